@@ -0,0 +1,555 @@
+#!/usr/bin/env python3
+"""
+Benchmark do gerenciador de arquivos do DevTools CLI
+
+Gera árvores sintéticas reproduzíveis (muitos arquivos pequenos, alguns
+enormes, aninhamento profundo, arquivos esparsos e hardlinks) e mede
+`file list`, `copy`, `copy -r`, `move` e `delete -r` sobre elas, gravando
+arquivos/s, MB/s, pico de memória (RSS) e contagem de syscalls em JSON.
+
+Cada operação roda em um processo Python próprio que executa o CLI e, ao
+terminar, informa o tempo da operação (sem a inicialização do
+interpretador), getrusage e /proc/self/io. Com --strace (se instalado) a
+sequência roda mais uma vez sob `strace -c` para contar todas as syscalls.
+
+Uso:
+    python benchmarks/bench_files.py run --scale small -o atual.json
+    python benchmarks/bench_files.py run --source /tmp/base/devtools-cli -o base.json
+    python benchmarks/bench_files.py compare base.json atual.json
+"""
+import argparse
+import hashlib
+import json
+import os
+import platform
+import random
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from rich.console import Console
+from rich.table import Table
+
+console = Console(stderr=True)
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATASET_STAMP = '.bench-dataset.json'
+# Tudo o que o benchmark cria dentro de --root
+ROOT_ENTRIES = ('dataset', DATASET_STAMP, 'work', 'home')
+MB = 1024 * 1024
+
+SCALES = {
+    'small': {
+        'small_files': 2000, 'small_max_size': 16 * 1024, 'fanout': 100, 'flat_files': 2000,
+        'huge_files': 2, 'huge_size': 64 * MB, 'depth': 64,
+        'sparse_files': 2, 'sparse_size': 256 * MB, 'sparse_extents': 4,
+        'link_groups': 100, 'links_per_group': 3,
+    },
+    'medium': {
+        'small_files': 20000, 'small_max_size': 32 * 1024, 'fanout': 200, 'flat_files': 10000,
+        'huge_files': 2, 'huge_size': 512 * MB, 'depth': 128,
+        'sparse_files': 4, 'sparse_size': 2048 * MB, 'sparse_extents': 16,
+        'link_groups': 1000, 'links_per_group': 4,
+    },
+    'large': {
+        'small_files': 200000, 'small_max_size': 64 * 1024, 'fanout': 500, 'flat_files': 50000,
+        'huge_files': 4, 'huge_size': 2048 * MB, 'depth': 256,
+        'sparse_files': 8, 'sparse_size': 8192 * MB, 'sparse_extents': 64,
+        'link_groups': 5000, 'links_per_group': 4,
+    },
+}
+
+OPERATIONS = ('list', 'copy', 'copy-r', 'move', 'delete-r')
+
+class DataPool:
+    """Bloco de bytes pseudoaleatórios de onde saem os conteúdos (reproduzível pela semente)"""
+    
+    SIZE = 4 * MB
+    
+    def __init__(self, rng):
+        self.data = rng.getrandbits(self.SIZE * 8).to_bytes(self.SIZE, 'little')
+        self.rng = rng
+    
+    def take(self, size):
+        offset = self.rng.randrange(self.SIZE - min(size, self.SIZE) + 1)
+        return self.data[offset:offset + size]
+    
+    def write(self, f, size):
+        while size > 0:
+            chunk = self.take(min(size, self.SIZE))
+            f.write(chunk)
+            size -= len(chunk)
+
+def generate_dataset(path, spec, seed):
+    """Cria a árvore sintética; retorna o resumo (arquivos, bytes lógicos, ...)"""
+    rng = random.Random(seed)
+    pool = DataPool(rng)
+    summary = {'files': 0, 'dirs': 0, 'bytes': 0, 'hardlinks': 0, 'sparse_bytes': 0}
+    
+    def make_file(file_path, size):
+        with open(file_path, 'wb') as f:
+            pool.write(f, size)
+        summary['files'] += 1
+        summary['bytes'] += size
+    
+    def make_dir(dir_path):
+        os.makedirs(dir_path)
+        summary['dirs'] += 1
+    
+    # Muitos arquivos pequenos espalhados em pastas
+    make_dir(os.path.join(path, 'small'))
+    for i in range(spec['small_files']):
+        directory = os.path.join(path, 'small', f"d{i // spec['fanout']:04d}")
+        if i % spec['fanout'] == 0:
+            make_dir(directory)
+        # Distribuição enviesada para arquivos muito pequenos, como em árvores de código
+        size = int(spec['small_max_size'] * rng.random() ** 3)
+        make_file(os.path.join(directory, f"f{i:06d}.dat"), size)
+    
+    # Uma pasta plana grande (alvo do `file list`)
+    make_dir(os.path.join(path, 'flat'))
+    for i in range(spec['flat_files']):
+        make_file(os.path.join(path, 'flat', f"item{i:06d}.txt"), rng.randrange(256))
+    
+    # Poucos arquivos enormes
+    make_dir(os.path.join(path, 'huge'))
+    for i in range(spec['huge_files']):
+        make_file(os.path.join(path, 'huge', f"huge{i}.bin"), spec['huge_size'])
+    
+    # Aninhamento profundo, um arquivo por nível
+    directory = os.path.join(path, 'deep')
+    for level in range(spec['depth']):
+        directory = os.path.join(directory, f"n{level:03d}")
+        make_dir(directory)
+        make_file(os.path.join(directory, 'leaf.txt'), rng.randrange(1024))
+    
+    # Arquivos esparsos: poucos trechos com dados em um tamanho lógico grande
+    make_dir(os.path.join(path, 'sparse'))
+    extent = MB
+    for i in range(spec['sparse_files']):
+        file_path = os.path.join(path, 'sparse', f"sparse{i}.img")
+        with open(file_path, 'wb') as f:
+            f.truncate(spec['sparse_size'])
+            step = spec['sparse_size'] // spec['sparse_extents']
+            for k in range(spec['sparse_extents']):
+                f.seek(k * step)
+                pool.write(f, min(extent, step))
+        summary['files'] += 1
+        summary['bytes'] += spec['sparse_size']
+        summary['sparse_bytes'] += spec['sparse_size'] - spec['sparse_extents'] * min(extent, step)
+    
+    # Grupos de hardlinks
+    make_dir(os.path.join(path, 'links'))
+    for group in range(spec['link_groups']):
+        original = os.path.join(path, 'links', f"g{group:05d}_0")
+        make_file(original, rng.randrange(8192))
+        for k in range(1, spec['links_per_group']):
+            os.link(original, os.path.join(path, 'links', f"g{group:05d}_{k}"))
+            summary['files'] += 1
+            summary['hardlinks'] += 1
+    
+    return summary
+
+def prepare_dataset(root, scale, seed):
+    """Reaproveita a árvore se já foi gerada com a mesma especificação"""
+    spec = SCALES[scale]
+    spec_id = hashlib.sha256(json.dumps([spec, seed], sort_keys=True).encode()).hexdigest()[:16]
+    path = os.path.join(root, 'dataset')
+    stamp = os.path.join(root, DATASET_STAMP)
+    
+    try:
+        with open(stamp, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached['id'] == spec_id and os.path.isdir(path):
+            console.print(f"♻️  Reutilizando árvore sintética em {path}")
+            return path, cached['summary']
+    except (OSError, ValueError, KeyError):
+        pass
+    
+    shutil.rmtree(path, ignore_errors=True)
+    console.print(f"🏗️  Gerando árvore sintética ({scale}, semente {seed}) em {path}")
+    start = time.perf_counter()
+    summary = generate_dataset(path, spec, seed)
+    summary['generation_seconds'] = round(time.perf_counter() - start, 3)
+    with open(stamp, 'w', encoding='utf-8') as f:
+        json.dump({'id': spec_id, 'scale': scale, 'seed': seed, 'summary': summary}, f, indent=2)
+    return path, summary
+
+def filesystem_type(path):
+    """Tipo do sistema de arquivos (ponto de montagem mais específico em /proc/mounts)"""
+    path = os.path.realpath(path)
+    best = ('', None)
+    try:
+        with open('/proc/mounts', 'r', encoding='utf-8') as f:
+            for line in f:
+                fields = line.split()
+                mount_point = fields[1].replace('\\040', ' ')
+                inside = path == mount_point or path.startswith(mount_point.rstrip('/') + '/')
+                if inside and len(mount_point) >= len(best[0]):
+                    best = (mount_point, fields[2])
+    except OSError:
+        pass
+    return best[1]
+
+def git_revision(source):
+    """Commit (e se há alterações locais) do código medido"""
+    try:
+        commit = subprocess.run(['git', '-C', source, 'rev-parse', 'HEAD'], capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = subprocess.run(['git', '-C', source, 'status', '--porcelain', '--', 'devtools'],
+                               capture_output=True, text=True, check=True).stdout.strip()
+        return commit, bool(dirty)
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+
+def drop_caches():
+    """Descarta o page cache (requer root)"""
+    os.sync()
+    try:
+        with open('/proc/sys/vm/drop_caches', 'w') as f:
+            f.write('3\n')
+        return True
+    except OSError:
+        return False
+
+def read_proc_io():
+    counters = {}
+    try:
+        with open('/proc/self/io', 'r') as f:
+            for line in f:
+                key, value = line.split(':')
+                counters[key] = int(value)
+    except OSError:
+        pass
+    return counters
+
+def exec_child(stats_path, cli_args):
+    """Executa o CLI neste processo e grava as medições em stats_path"""
+    from devtools import main as devtools_main
+    
+    sys.argv = ['devtools'] + cli_args
+    start = time.perf_counter()
+    try:
+        devtools_main.main()
+    except SystemExit:
+        pass
+    elapsed = time.perf_counter() - start
+    
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    io = read_proc_io()
+    with open(stats_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'seconds': elapsed,
+            # ru_maxrss é em KB no Linux e em bytes no macOS
+            'peak_rss_kb': usage.ru_maxrss // (1024 if sys.platform == 'darwin' else 1),
+            'user_seconds': usage.ru_utime,
+            'system_seconds': usage.ru_stime,
+            'voluntary_switches': usage.ru_nvcsw,
+            'involuntary_switches': usage.ru_nivcsw,
+            'read_syscalls': io.get('syscr'),
+            'write_syscalls': io.get('syscw'),
+            'storage_read_bytes': io.get('read_bytes'),
+            'storage_write_bytes': io.get('write_bytes'),
+        }, f)
+
+def parse_strace_summary(path):
+    """Total de syscalls e as mais frequentes a partir da saída de `strace -c`"""
+    calls = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            fields = line.split()
+            if len(fields) < 5 or not fields[0][0].isdigit():
+                continue
+            # % time, seconds, usecs/call, calls, [errors], syscall
+            calls[fields[-1]] = int(fields[3])
+    calls.pop('total', None)
+    top = sorted(calls.items(), key=lambda item: -item[1])[:10]
+    return {'total': sum(calls.values()), 'top': dict(top)}
+
+class Runner:
+    """Executa as operações do CLI em processos filhos isolados"""
+    
+    def __init__(self, source, home, use_strace=False, flush_caches=False):
+        self.source = source
+        self.use_strace = use_strace
+        self.flush_caches = flush_caches
+        self.env = dict(os.environ, HOME=home, PYTHONPATH=source)
+    
+    def run(self, cli_args, traced=False):
+        if self.flush_caches:
+            drop_caches()
+        with tempfile.TemporaryDirectory() as scratch:
+            stats_path = os.path.join(scratch, 'stats.json')
+            command = [sys.executable, os.path.abspath(__file__), '_exec', stats_path, '--'] + cli_args
+            if traced:
+                strace_path = os.path.join(scratch, 'strace.txt')
+                command = ['strace', '-f', '-c', '-o', strace_path] + command
+            
+            start = time.perf_counter()
+            result = subprocess.run(command, env=self.env, stdin=subprocess.DEVNULL,
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+            wall = time.perf_counter() - start
+            if result.returncode != 0 or not os.path.exists(stats_path):
+                raise RuntimeError(f"Falha em devtools {' '.join(cli_args)}: {result.stderr.strip()}")
+            
+            with open(stats_path, 'r', encoding='utf-8') as f:
+                stats = json.load(f)
+            stats['wall_seconds'] = wall
+            if traced:
+                stats['syscalls'] = parse_strace_summary(strace_path)
+            return stats
+
+def count_tree(path):
+    files = 0
+    for _, _, names in os.walk(path):
+        files += len(names)
+    return files
+
+def run_sequence(runner, dataset, summary, spec, work, traced=False):
+    """Executa list → copy → copy -r → move → delete -r, validando cada resultado"""
+    shutil.rmtree(work, ignore_errors=True)
+    os.makedirs(work)
+    huge = os.path.join(dataset, 'huge', 'huge0.bin')
+    huge_copy = os.path.join(work, 'huge0.bin')
+    tree = os.path.join(work, 'tree')
+    moved = os.path.join(work, 'moved')
+    results = {}
+    
+    def measure(name, cli_args, files, data_bytes, check):
+        stats = runner.run(cli_args, traced)
+        if not check():
+            raise RuntimeError(f"Resultado inesperado em '{name}' (devtools {' '.join(cli_args)})")
+        stats['files'] = files
+        stats['bytes'] = data_bytes
+        results[name] = stats
+    
+    flat = os.path.join(dataset, 'flat')
+    measure('list', ['file', 'list', '-l', flat], spec['flat_files'], 0, lambda: True)
+    
+    if spec['huge_files']:
+        measure('copy', ['file', 'copy', huge, huge_copy], 1, spec['huge_size'],
+                lambda: os.path.getsize(huge_copy) == spec['huge_size'])
+    
+    measure('copy-r', ['file', 'copy', '-r', dataset, tree], summary['files'], summary['bytes'],
+            lambda: count_tree(tree) == summary['files'])
+    measure('move', ['file', 'move', tree, moved], summary['files'], summary['bytes'],
+            lambda: not os.path.exists(tree) and os.path.isdir(moved))
+    measure('delete-r', ['file', 'delete', '-r', '-f', moved], summary['files'], summary['bytes'],
+            lambda: not os.path.exists(moved))
+    
+    shutil.rmtree(work, ignore_errors=True)
+    return results
+
+def summarize(runs, traced_run):
+    """Mediana das repetições e taxas derivadas por operação"""
+    report = {}
+    for name in OPERATIONS:
+        samples = [run[name] for run in runs if name in run]
+        if not samples:
+            continue
+        seconds = statistics.median(sample['seconds'] for sample in samples)
+        files = samples[0]['files']
+        data_bytes = samples[0]['bytes']
+        entry = {
+            'files': files,
+            'bytes': data_bytes,
+            'seconds': round(seconds, 4),
+            'wall_seconds': round(statistics.median(s['wall_seconds'] for s in samples), 4),
+            'files_per_s': round(files / seconds, 1) if seconds else None,
+            'mb_per_s': round(data_bytes / MB / seconds, 1) if seconds and data_bytes else None,
+            'peak_rss_kb': max(sample['peak_rss_kb'] for sample in samples),
+            'read_syscalls': samples[0]['read_syscalls'],
+            'write_syscalls': samples[0]['write_syscalls'],
+            'storage_read_bytes': samples[0]['storage_read_bytes'],
+            'storage_write_bytes': samples[0]['storage_write_bytes'],
+            'user_seconds': round(statistics.median(s['user_seconds'] for s in samples), 4),
+            'system_seconds': round(statistics.median(s['system_seconds'] for s in samples), 4),
+            'runs': [round(sample['seconds'], 4) for sample in samples],
+        }
+        if traced_run and name in traced_run:
+            entry['syscalls'] = traced_run[name]['syscalls']
+        report[name] = entry
+    return report
+
+def command_run(args):
+    source = os.path.abspath(args.source)
+    if not os.path.isdir(os.path.join(source, 'devtools')):
+        console.print(f"[red]❌ Pacote devtools não encontrado em {source}[/red]")
+        return 2
+    if args.strace and not shutil.which('strace'):
+        console.print("[red]❌ strace não encontrado no PATH[/red]")
+        return 2
+    
+    root = os.path.abspath(args.root)
+    os.makedirs(root, exist_ok=True)
+    unrelated = sorted(set(os.listdir(root)) - set(ROOT_ENTRIES))
+    if unrelated:
+        console.print(f"[red]❌ {root} contém arquivos que não são do benchmark ({', '.join(unrelated[:5])}); "
+                      f"use uma pasta vazia em --root[/red]")
+        return 2
+    try:
+        return _run(args, source, root)
+    finally:
+        # Só o que esta execução criou; a árvore sintética fica para as próximas, salvo com --clean
+        for name in ROOT_ENTRIES if args.clean else ('work', 'home'):
+            path = os.path.join(root, name)
+            if os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+            elif os.path.lexists(path):
+                os.remove(path)
+        if args.clean and not os.listdir(root):
+            os.rmdir(root)
+
+def _run(args, source, root):
+    spec = SCALES[args.scale]
+    dataset, summary = prepare_dataset(root, args.scale, args.seed)
+    
+    home = os.path.join(root, 'home')
+    os.makedirs(home, exist_ok=True)
+    runner = Runner(source, home, flush_caches=args.drop_caches)
+    if args.drop_caches and not drop_caches():
+        console.print("[yellow]⚠️  Sem permissão para descartar o page cache; medindo com cache quente[/yellow]")
+        runner.flush_caches = False
+    
+    runs = []
+    for repeat in range(args.repeat):
+        console.print(f"⏱️  Rodada {repeat + 1}/{args.repeat}")
+        runs.append(run_sequence(runner, dataset, summary, spec, os.path.join(root, 'work')))
+    traced_run = None
+    if args.strace:
+        console.print("🔎 Rodada extra sob strace -c")
+        traced_run = run_sequence(runner, dataset, summary, spec, os.path.join(root, 'work'), traced=True)
+    
+    commit, dirty = git_revision(source)
+    report = {
+        'version': 1,
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': commit,
+        'dirty': dirty,
+        'source': source,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'root': root,
+        'filesystem': filesystem_type(root),
+        'scale': args.scale,
+        'seed': args.seed,
+        'repeat': args.repeat,
+        'dataset': summary,
+        'results': summarize(runs, traced_run),
+    }
+    
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+        console.print(f"✅ Resultados gravados em {args.output}")
+    else:
+        print(text)
+    print_results(report)
+    return 0
+
+def print_results(report):
+    table = Table(title=f"{report['scale']} @ {(report['commit'] or '?')[:10]} ({report['filesystem']})",
+                  show_header=True, header_style="bold magenta")
+    table.add_column("Operação", style="cyan")
+    table.add_column("Tempo (s)", justify="right")
+    table.add_column("Arquivos/s", justify="right", style="green")
+    table.add_column("MB/s", justify="right", style="green")
+    table.add_column("Pico RSS", justify="right", style="yellow")
+    table.add_column("Syscalls r/w", justify="right")
+    
+    for name, entry in report['results'].items():
+        syscalls = f"{entry['read_syscalls']:,}/{entry['write_syscalls']:,}" if entry['read_syscalls'] is not None else "-"
+        table.add_row(name, f"{entry['seconds']:.3f}",
+                      f"{entry['files_per_s']:,.0f}" if entry['files_per_s'] else "-",
+                      f"{entry['mb_per_s']:,.1f}" if entry['mb_per_s'] else "-",
+                      f"{entry['peak_rss_kb'] / 1024:,.1f} MB", syscalls)
+    console.print(table)
+
+# Métricas comparadas (em todas, menor é melhor)
+COMPARED_METRICS = ('seconds', 'peak_rss_kb', 'read_syscalls', 'write_syscalls')
+
+def command_compare(args):
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    with open(args.candidate, 'r', encoding='utf-8') as f:
+        candidate = json.load(f)
+    
+    if (baseline['scale'], baseline['seed']) != (candidate['scale'], candidate['seed']):
+        console.print("[yellow]⚠️  Execuções com árvores diferentes (escala/semente); comparação aproximada[/yellow]")
+    
+    table = Table(title=f"{(baseline['commit'] or '?')[:10]} → {(candidate['commit'] or '?')[:10]}",
+                  show_header=True, header_style="bold magenta")
+    table.add_column("Operação", style="cyan")
+    for key in COMPARED_METRICS:
+        table.add_column(key, justify="right")
+    
+    regressions = []
+    for name, entry in candidate['results'].items():
+        base = baseline['results'].get(name)
+        if base is None:
+            continue
+        cells = []
+        for key in COMPARED_METRICS:
+            old, new = base.get(key), entry.get(key)
+            if not old or new is None:
+                cells.append("-")
+                continue
+            change = (new - old) / old * 100
+            worse = change > args.threshold
+            style = "red" if worse else "green" if change < -args.threshold else "white"
+            value = f"{new:,}" if isinstance(new, int) else f"{new:,.3f}"
+            cells.append(f"[{style}]{value} ({change:+.1f}%)[/{style}]")
+            if worse:
+                regressions.append((name, key, change))
+        table.add_row(name, *cells)
+    console.print(table)
+    
+    if regressions:
+        for name, key, change in regressions:
+            console.print(f"[red]❌ Regressão em {name}: {key} {change:+.1f}%[/red]")
+        return 1
+    console.print(f"[green]✅ Nenhuma regressão acima de {args.threshold:g}%[/green]")
+    return 0
+
+def main():
+    if len(sys.argv) > 3 and sys.argv[1] == '_exec':
+        # Processo filho: executa o CLI e grava as medições
+        exec_child(sys.argv[2], sys.argv[4:])
+        return 0
+    
+    parser = argparse.ArgumentParser(description='Benchmark do gerenciador de arquivos do DevTools CLI')
+    subparsers = parser.add_subparsers(dest='action', required=True)
+    
+    run_parser = subparsers.add_parser('run', help='Gerar a árvore sintética e medir as operações')
+    run_parser.add_argument('--scale', choices=SCALES, default='small', help='Tamanho da árvore (padrão: small)')
+    run_parser.add_argument('--seed', type=int, default=42, help='Semente da árvore sintética (padrão: 42)')
+    run_parser.add_argument('--root', default=os.path.join(tempfile.gettempdir(), 'devtools-bench'),
+                            help='Pasta de trabalho (use uma pasta em /dev/shm para tmpfs)')
+    run_parser.add_argument('--source', default=REPO_ROOT,
+                            help='Checkout do devtools-cli a medir (ex: um git worktree de outro commit)')
+    run_parser.add_argument('--repeat', type=int, default=3, help='Repetições por operação (padrão: 3)')
+    run_parser.add_argument('--drop-caches', action='store_true', help='Descartar o page cache antes de cada operação (root)')
+    run_parser.add_argument('--strace', action='store_true', help='Contar todas as syscalls com strace -c')
+    run_parser.add_argument('--clean', action='store_true',
+                            help='Apagar também a árvore gerada (padrão: mantê-la para as próximas execuções)')
+    run_parser.add_argument('-o', '--output', help='Gravar o relatório JSON no arquivo')
+    
+    compare_parser = subparsers.add_parser('compare', help='Comparar dois relatórios')
+    compare_parser.add_argument('baseline', help='Relatório de referência')
+    compare_parser.add_argument('candidate', help='Relatório comparado')
+    compare_parser.add_argument('--threshold', type=float, default=5.0,
+                                help='Variação percentual tolerada (padrão: 5)')
+    
+    args = parser.parse_args()
+    if args.action == 'run':
+        return command_run(args)
+    return command_compare(args)
+
+if __name__ == '__main__':
+    sys.exit(main())
\ No newline at end of file
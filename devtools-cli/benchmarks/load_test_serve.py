@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Teste de carga do `devtools file serve`
+
+Sobe o servidor em localhost sobre uma pasta sintética (arquivos pequenos,
+médios e um grande), abre N conexões keep-alive simultâneas e faz em cada
+uma uma sequência de GETs completos e com Range, validando status,
+Content-Length/Content-Range e, com --verify, o conteúdo. Informa
+requisições/s, MB/s e latências (p50/p90/p99).
+
+Uso:
+    python benchmarks/load_test_serve.py --connections 2000 --requests 20
+    python benchmarks/load_test_serve.py --url http://127.0.0.1:8000/ --paths a.bin b.bin
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import resource
+import shutil
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from urllib.parse import urlsplit
+from rich.console import Console
+from rich.table import Table
+
+console = Console(stderr=True)
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+KB = 1024
+MB = 1024 * KB
+
+# (prefixo, quantidade, tamanho)
+DATASET = (('small', 200, 4 * KB), ('medium', 20, 1 * MB), ('large', 1, 64 * MB))
+READ_SIZE = 256 * KB
+
+def generate_dataset(root, seed):
+    """Cria os arquivos de teste; retorna {caminho_relativo: tamanho}"""
+    rng = random.Random(seed)
+    pool = rng.getrandbits(MB * 8).to_bytes(MB, 'little')
+    files = {}
+    for prefix, count, size in DATASET:
+        for index in range(count):
+            name = f"{prefix}-{index:04d}.bin"
+            with open(os.path.join(root, name), 'wb') as f:
+                remaining = size
+                while remaining > 0:
+                    f.write(pool[:min(remaining, MB)])
+                    remaining -= MB
+            files[name] = size
+    return files
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def start_server(root, port, source):
+    """Inicia `devtools file serve` em um processo filho e espera a porta abrir"""
+    env = dict(os.environ, PYTHONPATH=source)
+    process = subprocess.Popen([sys.executable, '-m', 'devtools.main', 'file', 'serve', root, '-p', str(port)],
+                               env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 15
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"O servidor terminou com código {process.returncode}")
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=0.2).close()
+            return process
+        except OSError:
+            time.sleep(0.05)
+    process.kill()
+    raise RuntimeError("O servidor não abriu a porta a tempo")
+
+class LoadTest:
+    def __init__(self, host, port, files, range_ratio, verify_root, seed):
+        self.host = host
+        self.port = port
+        self.files = sorted(files.items())
+        self.range_ratio = range_ratio
+        self.verify_root = verify_root
+        self.rng = random.Random(seed)
+        self.latencies = []
+        self.bytes_received = 0
+        self.errors = []
+    
+    def pick(self):
+        """Próxima requisição: (caminho, intervalo ou None, status esperado, bytes esperados)
+        
+        Arquivos de tamanho desconhecido (servidor externo) são pedidos inteiros.
+        """
+        name, size = self.rng.choice(self.files)
+        if size and self.rng.random() < self.range_ratio:
+            start = self.rng.randrange(size)
+            end = min(size - 1, start + self.rng.randrange(1, 256 * KB))
+            return name, (start, end), 206, end - start + 1
+        return name, None, 200, size
+    
+    async def request(self, reader, writer, name, byte_range):
+        lines = [f"GET /{name} HTTP/1.1", f"Host: {self.host}:{self.port}"]
+        if byte_range:
+            lines.append(f"Range: bytes={byte_range[0]}-{byte_range[1]}")
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode())
+        await writer.drain()
+        
+        head = await reader.readuntil(b'\r\n\r\n')
+        status_line, *header_lines = head.decode('latin-1').split('\r\n')
+        headers = {}
+        for line in header_lines:
+            key, _, value = line.partition(':')
+            if key:
+                headers[key.strip().lower()] = value.strip()
+        length = int(headers.get('content-length', 0))
+        
+        body = bytearray() if self.verify_root else None
+        remaining = length
+        while remaining:
+            data = await reader.read(min(READ_SIZE, remaining))
+            if not data:
+                raise ConnectionError("Conexão encerrada no meio do corpo")
+            remaining -= len(data)
+            if body is not None:
+                body += data
+        return int(status_line.split(' ')[1]), headers, length, body
+    
+    def verify(self, name, byte_range, body):
+        start, end = byte_range or (0, None)
+        with open(os.path.join(self.verify_root, name), 'rb') as f:
+            f.seek(start)
+            expected = f.read() if end is None else f.read(end - start + 1)
+        return bytes(body) == expected
+    
+    async def connection(self, requests):
+        try:
+            reader, writer = await asyncio.open_connection(self.host, self.port, limit=READ_SIZE * 2)
+        except OSError as e:
+            self.errors.append(f"conexão: {e}")
+            return
+        try:
+            for _ in range(requests):
+                name, byte_range, expected_status, expected_length = self.pick()
+                start = time.perf_counter()
+                status, headers, length, body = await self.request(reader, writer, name, byte_range)
+                self.latencies.append(time.perf_counter() - start)
+                self.bytes_received += length
+                if status != expected_status or expected_length not in (None, length):
+                    self.errors.append(f"{name} {byte_range}: status {status}, {length} bytes")
+                elif byte_range and headers.get('content-range', '').split('/')[0] != \
+                        f"bytes {byte_range[0]}-{byte_range[1]}":
+                    self.errors.append(f"{name} {byte_range}: Content-Range {headers.get('content-range')}")
+                elif body is not None and not self.verify(name, byte_range, body):
+                    self.errors.append(f"{name} {byte_range}: conteúdo diferente")
+        except (OSError, asyncio.IncompleteReadError, ValueError) as e:
+            self.errors.append(f"conexão: {e}")
+        finally:
+            writer.close()
+    
+    async def run(self, connections, requests):
+        start = time.perf_counter()
+        await asyncio.gather(*(self.connection(requests) for _ in range(connections)))
+        return time.perf_counter() - start
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+def main():
+    parser = argparse.ArgumentParser(description='Teste de carga do devtools file serve')
+    parser.add_argument('--url', help='Servidor já em execução (padrão: iniciar um sobre dados sintéticos)')
+    parser.add_argument('--paths', nargs='+', help='Arquivos a pedir ao --url (caminhos na URL)')
+    parser.add_argument('-c', '--connections', type=int, default=1000, help='Conexões simultâneas (padrão: 1000)')
+    parser.add_argument('-n', '--requests', type=int, default=20, help='Requisições por conexão (padrão: 20)')
+    parser.add_argument('--range-ratio', type=float, default=0.5,
+                        help='Fração de requisições com Range (padrão: 0.5)')
+    parser.add_argument('--verify', action='store_true', help='Conferir o conteúdo recebido (servidor local)')
+    parser.add_argument('--source', default=REPO_ROOT, help='Checkout do devtools-cli a testar')
+    parser.add_argument('--seed', type=int, default=42, help='Semente (padrão: 42)')
+    parser.add_argument('-o', '--output', help='Gravar o resultado JSON no arquivo')
+    args = parser.parse_args()
+    
+    # O cliente também precisa de um descritor por conexão
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if hard != resource.RLIM_INFINITY and soft < hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    
+    root = process = None
+    try:
+        if args.url:
+            if not args.paths:
+                parser.error('--url requer --paths')
+            url = urlsplit(args.url)
+            host, port = url.hostname, url.port or 80
+            files = {path.lstrip('/'): None for path in args.paths}
+            verify_root = None
+        else:
+            root = tempfile.mkdtemp(prefix='devtools-serve-')
+            console.print("Gerando dados sintéticos...")
+            files = generate_dataset(root, args.seed)
+            host, port = '127.0.0.1', free_port()
+            process = start_server(root, port, args.source)
+            verify_root = root if args.verify else None
+        
+        test = LoadTest(host, port, files, args.range_ratio, verify_root, args.seed)
+        console.print(f"{args.connections} conexões x {args.requests} requisições em {host}:{port}...")
+        elapsed = asyncio.run(test.run(args.connections, args.requests))
+    finally:
+        if process:
+            process.send_signal(signal.SIGINT)
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        if root:
+            shutil.rmtree(root, ignore_errors=True)
+    
+    latencies = test.latencies
+    result = {
+        'connections': args.connections,
+        'requests': len(latencies),
+        'errors': len(test.errors),
+        'seconds': elapsed,
+        'requests_per_second': len(latencies) / elapsed if elapsed else 0,
+        'mb_per_second': test.bytes_received / MB / elapsed if elapsed else 0,
+        'latency_p50_ms': percentile(latencies, 0.50) * 1000,
+        'latency_p90_ms': percentile(latencies, 0.90) * 1000,
+        'latency_p99_ms': percentile(latencies, 0.99) * 1000,
+        'latency_mean_ms': statistics.fmean(latencies) * 1000 if latencies else 0,
+    }
+    
+    table = Table(title="Teste de carga do file serve", show_header=True, header_style="bold magenta")
+    table.add_column("Métrica", style="cyan")
+    table.add_column("Valor", justify="right", style="green")
+    for key, value in result.items():
+        table.add_row(key, f"{value:,.2f}" if isinstance(value, float) else f"{value:,}")
+    console.print(table)
+    for error in test.errors[:10]:
+        console.print(f"[red]❌ {error}[/red]")
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+    return 1 if test.errors else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,291 @@
+"""
+Arquivamento paralelo do DevTools CLI
+
+Gera arquivos .tar.gz padrão comprimindo blocos independentes em threads
+(o zlib libera o GIL), no estilo do pigz, e extrai em fluxo contínuo com um
+pool de escrita limitado.
+"""
+import os
+import struct
+import tarfile
+import threading
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from .utils import default_workers
+
+DEFAULT_BLOCK_SIZE = 1024 * 1024
+DICTIONARY_SIZE = 32 * 1024
+
+# Arquivos até este tamanho são lidos por inteiro e gravados em uma única tarefa
+SMALL_FILE_SIZE = 4 * 1024 * 1024
+MAX_PENDING_BYTES = 64 * 1024 * 1024
+
+def _compress_block(block, dictionary, level):
+    """Comprime um bloco como deflate bruto terminado em fronteira de byte"""
+    if dictionary:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS,
+                                      zlib.DEF_MEM_LEVEL, zlib.Z_DEFAULT_STRATEGY, dictionary)
+    else:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(block) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+class ParallelGzipWriter:
+    """Escritor gzip que comprime blocos em paralelo
+    
+    Cada bloco usa os últimos 32 KiB do bloco anterior como dicionário e termina
+    com Z_SYNC_FLUSH; a concatenação forma um único stream deflate válido.
+    """
+    
+    def __init__(self, fileobj, level=6, workers=None, block_size=DEFAULT_BLOCK_SIZE):
+        self.fileobj = fileobj
+        self.level = level
+        self.block_size = block_size
+        self.workers = workers or default_workers()
+        self.executor = ThreadPoolExecutor(max_workers=self.workers)
+        self.pending = deque()
+        self.buffer = bytearray()
+        self.dictionary = b''
+        self.crc = 0
+        self.size = 0
+        self.compressed_size = 0
+        self.closed = False
+        self._write_header()
+    
+    def _write_header(self):
+        """Grava o cabeçalho gzip (RFC 1952)"""
+        xfl = 2 if self.level == 9 else (4 if self.level == 1 else 0)
+        header = struct.pack('<BBBBIBB', 0x1f, 0x8b, 8, 0, int(time.time()), xfl, 3)
+        self.fileobj.write(header)
+        self.compressed_size += len(header)
+    
+    def write(self, data):
+        """Acumula dados e despacha blocos completos para compressão"""
+        self.buffer += data
+        while len(self.buffer) >= self.block_size:
+            block = bytes(self.buffer[:self.block_size])
+            del self.buffer[:self.block_size]
+            self._submit(block)
+        return len(data)
+    
+    def _submit(self, block):
+        """Envia um bloco ao pool mantendo a fila de resultados limitada"""
+        self.crc = zlib.crc32(block, self.crc)
+        self.size += len(block)
+        self.pending.append(self.executor.submit(_compress_block, block, self.dictionary, self.level))
+        self.dictionary = block[-DICTIONARY_SIZE:]
+        
+        while len(self.pending) > self.workers * 2:
+            self._drain_one()
+    
+    def _drain_one(self):
+        """Grava o próximo bloco comprimido, na ordem de envio"""
+        data = self.pending.popleft().result()
+        self.fileobj.write(data)
+        self.compressed_size += len(data)
+    
+    def flush(self):
+        pass
+    
+    def close(self):
+        """Finaliza o stream deflate e grava o trailer gzip"""
+        if self.closed:
+            return
+        self.closed = True
+        
+        try:
+            if self.buffer:
+                self._submit(bytes(self.buffer))
+                self.buffer.clear()
+            
+            while self.pending:
+                self._drain_one()
+            
+            # Bloco final vazio com BFINAL=1
+            final = zlib.compressobj(self.level, zlib.DEFLATED, -zlib.MAX_WBITS).flush(zlib.Z_FINISH)
+            trailer = struct.pack('<II', self.crc & 0xffffffff, self.size & 0xffffffff)
+            self.fileobj.write(final + trailer)
+            self.compressed_size += len(final) + len(trailer)
+        finally:
+            self.executor.shutdown(wait=True)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+def create_archive(output, sources, level=6, workers=None, block_size=DEFAULT_BLOCK_SIZE):
+    """Cria um .tar.gz a partir das fontes, retornando (bytes_lidos, bytes_gravados)"""
+    with open(output, 'wb') as raw:
+        with ParallelGzipWriter(raw, level, workers, block_size) as writer:
+            with tarfile.open(fileobj=writer, mode='w|', format=tarfile.PAX_FORMAT) as tar:
+                for source in sources:
+                    source_path = Path(source)
+                    tar.add(str(source_path), arcname=source_path.resolve().name)
+    return writer.size, writer.compressed_size
+
+class _WritePool:
+    """Pool de escrita com limite de bytes pendentes"""
+    
+    def __init__(self, workers):
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.budget = threading.Semaphore(MAX_PENDING_BYTES // (64 * 1024))
+        self.futures = []
+        self.errors = []
+    
+    def submit(self, size, func, *args):
+        """Agenda uma escrita, bloqueando enquanto o limite estiver esgotado"""
+        units = max(1, min(size // (64 * 1024), MAX_PENDING_BYTES // (64 * 1024)))
+        for _ in range(units):
+            self.budget.acquire()
+        
+        def run():
+            try:
+                func(*args)
+            finally:
+                for _ in range(units):
+                    self.budget.release()
+        
+        self.futures.append(self.executor.submit(run))
+        if len(self.futures) > 1024:
+            self._collect(wait=False)
+    
+    def _collect(self, wait=True):
+        """Recolhe tarefas concluídas, registrando erros"""
+        remaining = []
+        for future in self.futures:
+            if wait or future.done():
+                try:
+                    future.result()
+                except OSError as e:
+                    self.errors.append(e)
+            else:
+                remaining.append(future)
+        self.futures = remaining
+    
+    def wait(self):
+        """Aguarda todas as escritas pendentes"""
+        self._collect(wait=True)
+    
+    def shutdown(self):
+        self.wait()
+        self.executor.shutdown(wait=True)
+
+def _apply_metadata(path, member):
+    """Aplica permissões e datas do membro ao arquivo extraído"""
+    # O data_filter pode zerar atributos (None) que não devem ser aplicados
+    if member.mode is not None:
+        os.chmod(path, member.mode & 0o7777)
+    if member.mtime is not None:
+        os.utime(path, (member.mtime, member.mtime))
+
+def _write_small_file(path, data, member):
+    with open(path, 'wb') as f:
+        f.write(data)
+    _apply_metadata(path, member)
+
+def _pwrite_chunk(fd, data, offset):
+    view = memoryview(data)
+    while view:
+        written = os.pwrite(fd, view, offset)
+        view = view[written:]
+        offset += written
+
+def _safe_member(member, dest):
+    """Rejeita membros que escapariam do destino ou não são suportados"""
+    data_filter = getattr(tarfile, 'data_filter', None)
+    if data_filter:
+        return data_filter(member, str(dest))
+    
+    target = (dest / member.name).resolve()
+    if os.path.isabs(member.name) or not str(target).startswith(str(dest) + os.sep):
+        raise tarfile.TarError(f"Caminho inseguro no arquivo: {member.name}")
+    if member.issym() or member.islnk():
+        link_base = target.parent if member.issym() else dest
+        link_target = (link_base / member.linkname).resolve()
+        if not str(link_target).startswith(str(dest) + os.sep):
+            raise tarfile.TarError(f"Link inseguro no arquivo: {member.name}")
+    if not (member.isfile() or member.isdir() or member.issym() or member.islnk()):
+        raise tarfile.TarError(f"Tipo de membro não suportado: {member.name}")
+    return member
+
+def extract_archive(archive, dest, workers=None, chunk_size=DEFAULT_BLOCK_SIZE):
+    """Extrai um .tar(.gz) em fluxo contínuo, retornando (membros, bytes, avisos)"""
+    dest = Path(dest).resolve()
+    dest.mkdir(parents=True, exist_ok=True)
+    pool = _WritePool(workers or default_workers())
+    directories = []
+    warnings = []
+    members = 0
+    total = 0
+    
+    try:
+        with tarfile.open(archive, mode='r|*') as tar:
+            for member in tar:
+                try:
+                    member = _safe_member(member, dest)
+                except tarfile.TarError as e:
+                    warnings.append(str(e))
+                    continue
+                
+                path = dest / member.name
+                members += 1
+                
+                if member.isdir():
+                    path.mkdir(parents=True, exist_ok=True)
+                    directories.append((path, member))
+                    continue
+                
+                path.parent.mkdir(parents=True, exist_ok=True)
+                
+                if member.issym() or member.islnk():
+                    if path.is_symlink() or path.exists():
+                        path.unlink()
+                    if member.issym():
+                        os.symlink(member.linkname, path)
+                    else:
+                        # O alvo do hardlink precisa estar completamente gravado
+                        pool.wait()
+                        os.link(dest / member.linkname, path)
+                    continue
+                
+                source = tar.extractfile(member)
+                total += member.size
+                
+                if member.size <= SMALL_FILE_SIZE:
+                    pool.submit(member.size, _write_small_file, path, source.read(), member)
+                    continue
+                
+                fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                try:
+                    offset = 0
+                    while True:
+                        data = source.read(chunk_size)
+                        if not data:
+                            break
+                        pool.submit(len(data), _pwrite_chunk, fd, data, offset)
+                        offset += len(data)
+                finally:
+                    # Mesmo em erro de leitura, nenhuma escrita pode usar o fd depois de fechado
+                    try:
+                        pool.wait()
+                    finally:
+                        os.close(fd)
+                _apply_metadata(path, member)
+    finally:
+        pool.shutdown()
+    
+    # Datas de diretórios por último, do mais profundo para o mais raso
+    for path, member in reversed(directories):
+        try:
+            _apply_metadata(path, member)
+        except OSError:
+            pass
+    
+    if pool.errors:
+        raise pool.errors[0]
+    
+    return members, total, warnings
\ No newline at end of file
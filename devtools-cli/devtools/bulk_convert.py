@@ -0,0 +1,159 @@
+"""
+Conversão de unidades em lote do DevTools CLI (convert --from-file/--stdin)
+
+O par de unidades é resolvido uma única vez em uma transformação afim
+(valor * escala + deslocamento), aplicada a blocos de valores em arrays
+NumPy (ou array('d') sem NumPy). A saída é gravada bloco a bloco, então a
+memória não depende do tamanho da entrada. Valores inválidos são mantidos
+como estão na saída e contados.
+"""
+import csv
+import itertools
+import math
+import sys
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+CHUNK_BYTES = 4 * 1024 * 1024
+CSV_CHUNK_ROWS = 65536
+PRECISION = 6
+
+def _to_floats(tokens):
+    """Converte os textos em floats; retorna (valores, índices inválidos)"""
+    if np is not None:
+        try:
+            return np.array(tokens, dtype=np.float64), ()
+        except ValueError:
+            pass
+    values = array('d', bytes(8 * len(tokens)))
+    invalid = []
+    for index, token in enumerate(tokens):
+        try:
+            values[index] = float(token)
+        except ValueError:
+            values[index] = math.nan
+            invalid.append(index)
+    if np is not None:
+        return np.frombuffer(values, dtype=np.float64).copy(), invalid
+    return values, invalid
+
+def apply(values, scale, offset, precision=PRECISION):
+    """Aplica a conversão a um bloco de valores (precision=None: sem arredondar)"""
+    if np is not None:
+        values = values * scale
+        if offset:
+            values += offset
+        if precision is not None:
+            np.round(values, precision, out=values)
+        return values
+    if precision is None:
+        return array('d', (value * scale + offset for value in values))
+    return array('d', (round(value * scale + offset, precision) for value in values))
+
+def _format(values, tokens, invalid):
+    """Textos de saída: inteiros sem '.0' e inválidos inalterados"""
+    strings = list(map(repr, values.tolist()))
+    if invalid:
+        strings = [string[:-2] if string.endswith('.0') else string for string in strings]
+        for index in invalid:
+            token = tokens[index]
+            strings[index] = token.decode('utf-8', 'replace') if isinstance(token, bytes) else token
+        return strings
+    # Caminho rápido: remove o '.0' dos inteiros no texto já unido
+    return ('\n'.join(strings) + '\n').replace('.0\n', '\n').split('\n')[:-1]
+
+def convert_stream(stream, out, scale, offset, precision=PRECISION):
+    """Converte valores separados por espaços/quebras de linha, um por linha na saída
+    
+    stream é binário e out é texto; retorna (valores, inválidos).
+    """
+    count = invalid_count = 0
+    pending = b''
+    while True:
+        data = stream.read(CHUNK_BYTES)
+        buffer = pending + data if pending else data
+        tokens = buffer.split()
+        pending = b''
+        # O último valor pode estar cortado no meio: fica para o próximo bloco
+        if data and tokens and not buffer[-1:].isspace():
+            pending = tokens.pop()
+        if tokens:
+            values, invalid = _to_floats(tokens)
+            strings = _format(apply(values, scale, offset, precision), tokens, invalid)
+            out.write('\n'.join(strings) + '\n')
+            count += len(tokens)
+            invalid_count += len(invalid)
+        if not data:
+            break
+    out.flush()
+    return count, invalid_count
+
+def convert_binary(stream, out, scale, offset):
+    """Converte um fluxo de float64 little-endian, sem arredondamento"""
+    count = 0
+    pending = b''
+    while True:
+        data = stream.read(CHUNK_BYTES)
+        buffer = pending + data if pending else data
+        usable = len(buffer) - len(buffer) % 8
+        pending = buffer[usable:]
+        if usable:
+            if np is not None:
+                values = np.frombuffer(buffer, dtype='<f8', count=usable // 8)
+                out.write(apply(values, scale, offset, None).astype('<f8', copy=False).tobytes())
+            else:
+                values = array('d', buffer[:usable])
+                if sys.byteorder == 'big':
+                    values.byteswap()
+                values = apply(values, scale, offset, None)
+                if sys.byteorder == 'big':
+                    values.byteswap()
+                out.write(values.tobytes())
+            count += usable // 8
+        if not data:
+            break
+    if pending:
+        raise ValueError(f"Entrada binária com {len(pending)} bytes a mais (não é múltipla de 8)")
+    out.flush()
+    return count, 0
+
+def convert_csv(stream, out, column, scale, offset, precision=PRECISION):
+    """Converte uma coluna de um CSV (nome, com cabeçalho, ou número a partir de 1)
+    
+    stream e out são texto; retorna (valores, inválidos).
+    """
+    reader = csv.reader(stream)
+    writer = csv.writer(out, lineterminator='\n')
+    if column.isdigit():
+        index = int(column) - 1
+        if index < 0:
+            raise ValueError("O número da coluna começa em 1")
+    else:
+        header = next(reader, None)
+        if header is None:
+            return 0, 0
+        if column not in header:
+            raise ValueError(f"Coluna não encontrada no cabeçalho: {column}")
+        index = header.index(column)
+        writer.writerow(header)
+    
+    count = invalid_count = 0
+    while True:
+        rows = list(itertools.islice(reader, CSV_CHUNK_ROWS))
+        if not rows:
+            break
+        tokens = [row[index] if len(row) > index else '' for row in rows]
+        values, invalid = _to_floats(tokens)
+        strings = _format(apply(values, scale, offset, precision), tokens, invalid)
+        for row, string in zip(rows, strings):
+            if len(row) > index:
+                row[index] = string
+        writer.writerows(rows)
+        count += len(rows)
+        invalid_count += len(invalid)
+    out.flush()
+    return count, invalid_count
\ No newline at end of file
@@ -0,0 +1,149 @@
+"""
+Renomeação em massa do DevTools CLI
+
+O plano completo é calculado antes de qualquer alteração: colisões abortam a
+operação e ciclos (a→b, b→a) são resolvidos com nomes temporários. A execução
+usa um descritor por diretório (rename relativo a dir_fd), evitando resolver o
+caminho completo a cada operação.
+"""
+import os
+import re
+import uuid
+from collections import defaultdict
+
+class RenameConflict(Exception):
+    """Plano de renomeação inválido"""
+    
+    def __init__(self, conflicts):
+        self.conflicts = conflicts
+        super().__init__(f"{len(conflicts)} conflitos no plano de renomeação")
+
+class RenamePlan:
+    """Plano de renomeação agrupado por diretório"""
+    
+    def __init__(self):
+        self.mapping = {}
+        self.operations = defaultdict(list)
+        self.cycles = 0
+
+def _candidates(paths, recursive, rules=None):
+    """Gera (diretório, nome) das entradas a considerar"""
+    for path in paths:
+        path = os.path.abspath(path)
+        if not os.path.isdir(path) or os.path.islink(path):
+            yield os.path.dirname(path), os.path.basename(path)
+            continue
+        if recursive:
+            for root, dirs, files in (rules.walk(path) if rules else os.walk(path)):
+                for name in dirs + files:
+                    yield root, name
+        else:
+            matcher = rules.matcher(path) if rules else None
+            for name in os.listdir(path):
+                if matcher and not matcher.accepts(name, os.path.isdir(os.path.join(path, name))):
+                    continue
+                yield path, name
+
+def _order_directory(mapping):
+    """Ordena as renomeações de um diretório respeitando dependências
+    
+    mapping: {nome_origem: nome_destino}. Retorna (operações, ciclos).
+    """
+    incoming = {dst: src for src, dst in mapping.items()}
+    pending = dict(mapping)
+    ready = [src for src, dst in mapping.items() if dst not in mapping]
+    operations = []
+    
+    # Cadeias: primeiro quem vai para um nome livre, depois quem ocupa o nome liberado
+    while ready:
+        src = ready.pop()
+        operations.append((src, pending.pop(src)))
+        previous = incoming.get(src)
+        if previous in pending:
+            ready.append(previous)
+    
+    # O que sobrou são ciclos: um membro passa por um nome temporário
+    cycles = 0
+    while pending:
+        start = next(iter(pending))
+        temp = f".devtools-rename-{uuid.uuid4().hex[:12]}"
+        operations.append((start, temp))
+        final = pending.pop(start)
+        
+        previous = incoming[start]
+        while previous != start:
+            operations.append((previous, pending.pop(previous)))
+            previous = incoming[previous]
+        
+        operations.append((temp, final))
+        cycles += 1
+    
+    return operations, cycles
+
+def build_plan(paths, pattern, template, recursive=False, rules=None):
+    """Calcula o plano de renomeação (levanta RenameConflict se houver colisões)"""
+    compiled = re.compile(pattern)
+    by_directory = defaultdict(dict)
+    conflicts = []
+    
+    for directory, name in _candidates(paths, recursive, rules):
+        new_name = compiled.sub(template, name, count=1)
+        if new_name == name:
+            continue
+        if not new_name or '/' in new_name or new_name in ('.', '..'):
+            conflicts.append(f"{os.path.join(directory, name)}: nome inválido '{new_name}'")
+            continue
+        by_directory[directory][name] = new_name
+    
+    plan = RenamePlan()
+    for directory, mapping in by_directory.items():
+        targets = {}
+        for src, dst in mapping.items():
+            if dst in targets:
+                conflicts.append(f"{os.path.join(directory, targets[dst])} e "
+                                 f"{os.path.join(directory, src)} → {dst}")
+            targets[dst] = src
+            if dst not in mapping and os.path.lexists(os.path.join(directory, dst)):
+                conflicts.append(f"{os.path.join(directory, src)} → {dst}: destino já existe")
+        
+        for src, dst in mapping.items():
+            plan.mapping[os.path.join(directory, src)] = os.path.join(directory, dst)
+    
+    if conflicts:
+        raise RenameConflict(conflicts)
+    
+    # Diretórios mais profundos primeiro: renomear um pai não invalida os filhos
+    for directory in sorted(by_directory, key=lambda d: d.count(os.sep), reverse=True):
+        operations, cycles = _order_directory(by_directory[directory])
+        plan.operations[directory] = operations
+        plan.cycles += cycles
+    
+    return plan
+
+def execute_plan(plan):
+    """Executa o plano; em caso de erro desfaz o que já foi feito e relança"""
+    done = []
+    try:
+        for directory, operations in plan.operations.items():
+            if os.rename not in os.supports_dir_fd:
+                for src, dst in operations:
+                    os.rename(os.path.join(directory, src), os.path.join(directory, dst))
+                    done.append((directory, src, dst))
+                continue
+            
+            dir_fd = os.open(directory, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+            try:
+                for src, dst in operations:
+                    os.rename(src, dst, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+                    done.append((directory, src, dst))
+            finally:
+                os.close(dir_fd)
+    except OSError:
+        for directory, src, dst in reversed(done):
+            try:
+                os.rename(os.path.join(directory, dst), os.path.join(directory, src))
+            except OSError:
+                pass
+        raise
+    
+    return len(done)
\ No newline at end of file
@@ -0,0 +1,140 @@
+"""
+Cálculo de checksums e manifestos do DevTools CLI
+"""
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from .utils import default_workers
+
+SUPPORTED_ALGORITHMS = ('sha256', 'blake2b', 'md5')
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+# Rótulos usados no formato BSD (--tag) do coreutils
+ALGORITHM_TAGS = {'sha256': 'SHA256', 'blake2b': 'BLAKE2b', 'md5': 'MD5'}
+
+# Tamanho do digest hexadecimal -> algoritmo, para manifestos no formato GNU
+HEX_LENGTH_ALGORITHMS = {64: 'sha256', 128: 'blake2b', 32: 'md5'}
+
+def hash_file(path, algorithms=('sha256',), buffer_size=DEFAULT_BUFFER_SIZE):
+    """Calcula um ou mais digests do arquivo com uma única leitura"""
+    hashers = [hashlib.new(name) for name in algorithms]
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    
+    with open(path, 'rb', buffering=0) as f:
+        while True:
+            read = f.readinto(buffer)
+            if not read:
+                break
+            chunk = view[:read]
+            # hashlib libera o GIL para blocos grandes, então threads escalam
+            for hasher in hashers:
+                hasher.update(chunk)
+    
+    return {name: hasher.hexdigest() for name, hasher in zip(algorithms, hashers)}
+
+def _hash_entry(entry):
+    """Executa hash_file capturando erros (usado pelo pool)"""
+    path, algorithms, buffer_size = entry
+    try:
+        return path, hash_file(path, algorithms, buffer_size), None
+    except OSError as e:
+        return path, None, e
+
+def hash_files(paths, algorithms=('sha256',), workers=None, buffer_size=DEFAULT_BUFFER_SIZE):
+    """Calcula digests de vários arquivos em paralelo
+    
+    Gera tuplas (caminho, digests, erro) na ordem de entrada.
+    """
+    workers = workers or default_workers()
+    entries = ((path, tuple(algorithms), buffer_size) for path in paths)
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_hash_entry, entries)
+
+def iter_files(paths, recursive=False, rules=None):
+    """Expande caminhos em arquivos regulares, percorrendo diretórios se recursivo"""
+    for path in paths:
+        if os.path.isdir(path):
+            if not recursive:
+                continue
+            for root, dirs, files in (rules.walk(path) if rules else os.walk(path)):
+                dirs.sort()
+                for name in sorted(files):
+                    yield os.path.join(root, name)
+        else:
+            yield path
+
+def _escape_filename(filename):
+    """Escapa nomes com barra invertida ou quebra de linha (como o sha256sum)"""
+    if '\\' not in filename and '\n' not in filename:
+        return filename, ''
+    return filename.replace('\\', '\\\\').replace('\n', '\\n'), '\\'
+
+def _unescape_filename(filename):
+    """Desfaz o escape aplicado por _escape_filename"""
+    result = []
+    i = 0
+    while i < len(filename):
+        if filename[i] == '\\' and i + 1 < len(filename):
+            result.append('\n' if filename[i + 1] == 'n' else filename[i + 1])
+            i += 2
+        else:
+            result.append(filename[i])
+            i += 1
+    return ''.join(result)
+
+def format_manifest_line(digest, filename, algorithm=None):
+    """Formata uma linha de manifesto
+    
+    Sem algoritmo usa o formato GNU (compatível com sha256sum -c);
+    com algoritmo usa o formato BSD (--tag), necessário ao misturar algoritmos.
+    """
+    filename, prefix = _escape_filename(filename)
+    if algorithm:
+        return f"{prefix}{ALGORITHM_TAGS[algorithm]} ({filename}) = {digest}"
+    return f"{prefix}{digest}  {filename}"
+
+def parse_manifest_line(line):
+    """Interpreta uma linha de manifesto, retornando (algoritmo, digest, arquivo)"""
+    line = line.rstrip('\r\n')
+    if not line or line.startswith('#'):
+        return None
+    
+    escaped = line.startswith('\\')
+    if escaped:
+        line = line[1:]
+    
+    # Formato BSD: ALGO (arquivo) = digest
+    for algorithm, tag in ALGORITHM_TAGS.items():
+        if line.startswith(f"{tag} (") and ') = ' in line:
+            filename, _, digest = line[len(tag) + 2:].rpartition(') = ')
+            break
+    else:
+        # Formato GNU: digest  arquivo (ou digest *arquivo em modo binário)
+        digest, sep, filename = line.partition(' ')
+        if not sep or not filename:
+            raise ValueError(f"Linha de manifesto inválida: {line}")
+        if filename[0] in ' *':
+            filename = filename[1:]
+        algorithm = HEX_LENGTH_ALGORITHMS.get(len(digest))
+    
+    digest = digest.strip().lower()
+    if not algorithm or any(c not in '0123456789abcdef' for c in digest):
+        raise ValueError(f"Digest inválido: {digest}")
+    
+    if escaped:
+        filename = _unescape_filename(filename)
+    
+    return algorithm, digest, filename
+
+def read_manifest(manifest_path):
+    """Lê um manifesto, retornando {arquivo: {algoritmo: digest}} na ordem original"""
+    entries = {}
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            parsed = parse_manifest_line(line)
+            if parsed:
+                algorithm, digest, filename = parsed
+                entries.setdefault(filename, {})[algorithm] = digest
+    return entries
\ No newline at end of file
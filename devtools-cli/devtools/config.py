@@ -27,7 +27,9 @@ class Config:
         self.config['general'] = {
             'default_download_path': os.path.join(os.path.expanduser("~"), 'Downloads'),
             'use_colors': 'true',
-            'confirm_deletions': 'true'
+            'confirm_deletions': 'true',
+            'use_trash': 'false',
+            'respect_gitignore': 'false'
         }
         
         self.config['password'] = {
@@ -46,7 +48,40 @@ class Config:
         self.config['currency'] = {
             'api_key': '',
             'default_base': 'USD',
-            'cache_duration': '3600'
+            'cache_duration': '3600',
+            'max_stale': '604800',
+            'offline': 'false',
+            'api_base_url': 'https://v6.exchangerate-api.com/v6',
+            'prefetch_bases': ''
+        }
+        
+        self.config['hash_cache'] = {
+            'enabled': 'true',
+            'max_entries': '1000000',
+            'use_xattrs': 'false',
+            'skip_identical_copies': 'true'
+        }
+        
+        self.config['copy'] = {
+            'verify_mode': 'readback',
+            'verify_algorithm': 'sha256'
+        }
+        
+        self.config['watch'] = {
+            'debounce_ms': '500',
+            'max_delay_ms': '5000',
+            'command': ''
+        }
+        
+        self.config['throttle'] = {
+            'bwlimit': '',
+            'iops_limit': '',
+            'idle_io': 'false'
+        }
+        
+        self.config['snapshot'] = {
+            'store': '',
+            'chunk_size': '64K'
         }
         
         self.save_config()
@@ -0,0 +1,454 @@
+"""
+Motor de cópia de arquivos do DevTools CLI
+"""
+import errno
+import hashlib
+import json
+import os
+import queue
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from . import checksum, delete_engine
+
+COPY_BUFFER_SIZE = 1024 * 1024
+RESUME_BLOCK_SIZE = 16 * 1024 * 1024
+PART_SUFFIX = '.devtools-part'
+JOURNAL_SUFFIX = '.devtools-journal'
+VERIFY_BUFFERS = 3
+
+class VerificationError(Exception):
+    """Conteúdo do destino difere do que foi lido da origem"""
+    
+    def __init__(self, path, expected, actual):
+        self.path = path
+        self.expected = expected
+        self.actual = actual
+        super().__init__(f"Verificação falhou para {path}: esperado {expected}, lido {actual}")
+
+def _block_digest(data):
+    """Checksum de um bloco do journal"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+def _read_journal(journal_path, header):
+    """Lê os blocos registrados no journal se ele corresponde à cópia atual"""
+    try:
+        with open(journal_path, 'r', encoding='utf-8') as f:
+            if json.loads(f.readline()) != header:
+                return []
+            blocks = []
+            for line in f:
+                try:
+                    blocks.append(json.loads(line))
+                except ValueError:
+                    # Última linha truncada por uma interrupção
+                    break
+            return blocks
+    except (OSError, ValueError):
+        return []
+
+def _pread_into(fd, view, offset):
+    """Lê do descritor na posição indicada diretamente para o buffer"""
+    if hasattr(os, 'preadv'):
+        return os.preadv(fd, [view], offset)
+    data = os.pread(fd, len(view), offset)
+    view[:len(data)] = data
+    return len(data)
+
+def _pwrite_all(fd, view, offset):
+    """Grava todo o buffer na posição indicada"""
+    written = 0
+    while written < len(view):
+        written += os.pwrite(fd, view[written:], offset + written)
+
+def _datasync(fd):
+    """Garante que os dados gravados chegaram ao disco"""
+    if hasattr(os, 'fdatasync'):
+        os.fdatasync(fd)
+    else:
+        os.fsync(fd)
+
+def _verify_prefix(part_fd, blocks, block_size):
+    """Verifica os blocos já gravados e retorna os que continuam válidos"""
+    valid = []
+    view = memoryview(bytearray(block_size))
+    
+    for index, block in enumerate(blocks):
+        if block['offset'] != index * block_size or block['length'] > block_size:
+            break
+        read = _pread_into(part_fd, view[:block['length']], block['offset'])
+        if read != block['length'] or _block_digest(view[:read]) != block['digest']:
+            break
+        valid.append(block)
+    
+    return valid
+
+def resumable_copy(source, dest, block_size=RESUME_BLOCK_SIZE, progress_callback=None, throttle=None):
+    """Copia arquivo de forma retomável
+    
+    Os dados vão para um arquivo temporário ao lado do destino e cada bloco
+    confirmado em disco é registrado com seu checksum em um journal. Uma nova
+    execução verifica o prefixo já gravado e continua do último bloco válido;
+    ao final o temporário é renomeado atomicamente para o destino.
+    
+    Retorna o número de bytes reaproveitados de uma execução anterior.
+    """
+    source = os.fspath(source)
+    dest = os.fspath(dest)
+    part_path = dest + PART_SUFFIX
+    journal_path = dest + JOURNAL_SUFFIX
+    
+    st = os.stat(source)
+    header = {
+        'source': os.path.abspath(source),
+        'size': st.st_size,
+        'mtime_ns': st.st_mtime_ns,
+        'block_size': block_size,
+    }
+    
+    src_fd = os.open(source, os.O_RDONLY)
+    part_fd = os.open(part_path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        blocks = _read_journal(journal_path, header)
+        blocks = _verify_prefix(part_fd, blocks, block_size) if blocks else []
+        offset = sum(block['length'] for block in blocks)
+        os.ftruncate(part_fd, offset)
+        
+        # Reescreve o journal apenas com os blocos válidos
+        with open(journal_path, 'w', encoding='utf-8') as journal:
+            journal.write(json.dumps(header) + '\n')
+            for block in blocks:
+                journal.write(json.dumps(block) + '\n')
+            journal.flush()
+            os.fsync(journal.fileno())
+            
+            if progress_callback and offset:
+                progress_callback(offset)
+            
+            resumed = offset
+            view = memoryview(bytearray(block_size))
+            
+            while offset < st.st_size:
+                length = _pread_into(src_fd, view, offset)
+                if not length:
+                    break
+                
+                chunk = view[:length]
+                _pwrite_all(part_fd, chunk, offset)
+                if throttle:
+                    throttle.consume(length, 2)
+                
+                # O bloco só entra no journal depois de estar em disco
+                _datasync(part_fd)
+                journal.write(json.dumps({
+                    'offset': offset, 'length': length, 'digest': _block_digest(chunk)
+                }) + '\n')
+                journal.flush()
+                
+                offset += length
+                if progress_callback:
+                    progress_callback(length)
+            
+            os.fsync(part_fd)
+    finally:
+        os.close(src_fd)
+        os.close(part_fd)
+    
+    shutil.copystat(source, part_path)
+    os.replace(part_path, dest)
+    os.unlink(journal_path)
+    return resumed
+
+def _data_extents(fd, size):
+    """Gera as regiões (início, fim) com dados alocados do arquivo
+    
+    Usa SEEK_DATA/SEEK_HOLE quando disponíveis; caso contrário trata o
+    arquivo inteiro como uma única região.
+    """
+    if not hasattr(os, 'SEEK_DATA'):
+        yield 0, size
+        return
+    
+    position = 0
+    while position < size:
+        try:
+            start = os.lseek(fd, position, os.SEEK_DATA)
+        except OSError as e:
+            if e.errno == errno.ENXIO:
+                # Apenas buraco até o fim do arquivo
+                return
+            if position == 0 and e.errno in (errno.EINVAL, errno.EOPNOTSUPP):
+                yield 0, size
+                return
+            raise
+        end = os.lseek(fd, start, os.SEEK_HOLE)
+        yield start, min(end, size)
+        position = end
+
+def copy_file_data(source, dest, progress_callback=None, buffer_size=COPY_BUFFER_SIZE, throttle=None):
+    """Copia o conteúdo de um arquivo preservando buracos de arquivos esparsos
+    
+    Retorna (bytes_copiados, bytes_em_buracos_não_gravados).
+    """
+    if throttle:
+        buffer_size = throttle.buffer_size(buffer_size)
+    src_fd = os.open(source, os.O_RDONLY)
+    try:
+        size = os.fstat(src_fd).st_size
+        dst_fd = os.open(dest, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            view = memoryview(bytearray(buffer_size))
+            copied = 0
+            position = 0
+            
+            for start, end in _data_extents(src_fd, size):
+                if progress_callback and start > position:
+                    progress_callback(start - position)
+                
+                offset = start
+                while offset < end:
+                    length = _pread_into(src_fd, view[:min(buffer_size, end - offset)], offset)
+                    if not length:
+                        break
+                    _pwrite_all(dst_fd, view[:length], offset)
+                    if throttle:
+                        # Uma leitura e uma escrita por bloco
+                        throttle.consume(length, 2)
+                    offset += length
+                    copied += length
+                    if progress_callback:
+                        progress_callback(length)
+                position = end
+            
+            if progress_callback and size > position:
+                progress_callback(size - position)
+            
+            # Define o tamanho final, mantendo buracos no fim do arquivo
+            os.ftruncate(dst_fd, size)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    
+    return copied, size - copied
+
+def drop_cache(path):
+    """Remove as páginas do arquivo do cache do kernel (quando suportado)
+    
+    O arquivo precisa estar sincronizado: páginas sujas não são descartadas.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return False
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+    return True
+
+def verified_copy(source, dest, algorithm='sha256', readback=True, progress_callback=None,
+                  buffer_size=COPY_BUFFER_SIZE, throttle=None):
+    """Copia o arquivo calculando o checksum da origem durante a cópia
+    
+    Uma thread lê blocos para buffers rotativos enquanto a thread principal
+    calcula o hash e outra grava o bloco anterior, então hash e I/O se
+    sobrepõem. Com readback, o destino é sincronizado, retirado do cache e
+    relido para confirmar o checksum (levanta VerificationError se diferir).
+    
+    Retorna (digest, bytes_copiados, bytes_em_buracos).
+    """
+    if throttle:
+        buffer_size = throttle.buffer_size(buffer_size)
+    hasher = hashlib.new(algorithm)
+    free = queue.Queue()
+    for _ in range(VERIFY_BUFFERS):
+        free.put(memoryview(bytearray(buffer_size)))
+    filled = queue.Queue()
+    stop = threading.Event()
+    errors = []
+    
+    src_fd = os.open(source, os.O_RDONLY)
+    try:
+        size = os.fstat(src_fd).st_size
+        dst_fd = os.open(dest, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        
+        def read():
+            try:
+                position = 0
+                for start, end in _data_extents(src_fd, size):
+                    if start > position:
+                        filled.put((position, None, start - position))
+                    offset = start
+                    while offset < end and not stop.is_set():
+                        view = free.get()
+                        length = _pread_into(src_fd, view[:min(buffer_size, end - offset)], offset)
+                        if not length:
+                            free.put(view)
+                            break
+                        filled.put((offset, view, length))
+                        offset += length
+                    position = end
+                if size > position:
+                    filled.put((position, None, size - position))
+            except BaseException as e:
+                errors.append(e)
+            finally:
+                filled.put(None)
+        
+        reader = threading.Thread(target=read, daemon=True)
+        reader.start()
+        copied = 0
+        try:
+            with ThreadPoolExecutor(max_workers=1) as writer:
+                zeros = memoryview(bytes(buffer_size))
+                while True:
+                    item = filled.get()
+                    if item is None:
+                        break
+                    offset, view, length = item
+                    
+                    if view is None:
+                        # Buraco do arquivo esparso: entra no hash, mas não é gravado
+                        while length:
+                            step = min(length, buffer_size)
+                            hasher.update(zeros[:step])
+                            length -= step
+                            if progress_callback:
+                                progress_callback(step)
+                        continue
+                    
+                    chunk = view[:length]
+                    pending = writer.submit(_pwrite_all, dst_fd, chunk, offset)
+                    hasher.update(chunk)
+                    pending.result()
+                    if throttle:
+                        throttle.consume(length, 2)
+                    free.put(view)
+                    copied += length
+                    if progress_callback:
+                        progress_callback(length)
+            
+            if errors:
+                raise errors[0]
+            os.ftruncate(dst_fd, size)
+            if readback:
+                _datasync(dst_fd)
+        finally:
+            stop.set()
+            for _ in range(VERIFY_BUFFERS):
+                free.put(memoryview(bytearray(0)))
+            reader.join()
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    
+    digest = hasher.hexdigest()
+    if readback:
+        drop_cache(dest)
+        if throttle:
+            # A releitura também passa pelo disco
+            throttle.consume(copied, max(1, -(-copied // buffer_size)))
+        actual = checksum.hash_file(dest, (algorithm,))[algorithm]
+        if actual != digest:
+            raise VerificationError(os.fspath(dest), digest, actual)
+    
+    return digest, copied, size - copied
+
+class TreeCopier:
+    """Função de cópia para shutil.copytree ciente de esparsos e hardlinks
+    
+    Arquivos com vários links são copiados uma única vez; os demais membros do
+    grupo (mesmo dispositivo e inode) viram hardlinks no destino.
+    """
+    
+    def __init__(self, skip=None, verify_algorithm=None, readback=True, throttle=None):
+        self.skip = skip
+        self.verify_algorithm = verify_algorithm
+        self.readback = readback
+        self.throttle = throttle
+        self.digests = []
+        self.links = {}
+        self.files = 0
+        self.bytes_copied = 0
+        self.sparse_bytes = 0
+        self.linked_files = 0
+        self.linked_bytes = 0
+        self.skipped_files = 0
+    
+    @property
+    def bytes_avoided(self):
+        """Bytes que não precisaram ser gravados (buracos e hardlinks)"""
+        return self.sparse_bytes + self.linked_bytes
+    
+    def __call__(self, src, dst):
+        st = os.stat(src)
+        key = (st.st_dev, st.st_ino)
+        if self.throttle:
+            # Criação/metadados do arquivo
+            self.throttle.consume(0, 1)
+        
+        if st.st_nlink > 1 and key in self.links:
+            if os.path.lexists(dst):
+                os.unlink(dst)
+            first_copy, digest = self.links[key]
+            os.link(first_copy, dst)
+            self.linked_files += 1
+            self.linked_bytes += st.st_size
+            if digest:
+                self.digests.append((dst, digest))
+            return dst
+        
+        digest = None
+        if self.skip and os.path.exists(dst) and self.skip(src, dst):
+            self.skipped_files += 1
+            if self.verify_algorithm:
+                digest = checksum.hash_file(dst, (self.verify_algorithm,))[self.verify_algorithm]
+                self.digests.append((dst, digest))
+            if st.st_nlink > 1:
+                self.links[key] = (dst, digest)
+            return dst
+        
+        if self.verify_algorithm:
+            digest, copied, holes = verified_copy(src, dst, self.verify_algorithm, self.readback,
+                                                  throttle=self.throttle)
+            self.digests.append((dst, digest))
+        else:
+            copied, holes = copy_file_data(src, dst, throttle=self.throttle)
+        if st.st_nlink > 1:
+            self.links[key] = (dst, digest)
+        shutil.copystat(src, dst)
+        self.files += 1
+        self.bytes_copied += copied
+        self.sparse_bytes += holes
+        return dst
+
+def throttled_move(source, dest, throttle):
+    """Equivalente a shutil.move respeitando os limites de I/O
+    
+    No mesmo sistema de arquivos é um rename (uma operação); entre
+    dispositivos a cópia e a remoção da origem passam pelo limitador.
+    """
+    source = os.fspath(source)
+    dest = os.fspath(dest)
+    throttle.consume(0, 1)
+    try:
+        os.rename(source, dest)
+        return dest
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+    
+    if os.path.islink(source):
+        os.symlink(os.readlink(source), dest)
+        os.unlink(source)
+    elif os.path.isdir(source):
+        shutil.copytree(source, dest, symlinks=True, copy_function=TreeCopier(throttle=throttle))
+        plan = delete_engine.scan([source])
+        _, errors = delete_engine.execute(plan, throttle=throttle)
+        if errors:
+            raise errors[0]
+    else:
+        TreeCopier(throttle=throttle)(source, dest)
+        throttle.consume(0, 1)
+        os.unlink(source)
+    return dest
\ No newline at end of file
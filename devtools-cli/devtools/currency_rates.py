@@ -0,0 +1,245 @@
+"""
+Tabela de câmbio do DevTools CLI
+
+Cada consulta à API traz a tabela completa de uma moeda base (/latest/BASE),
+gravada como um único snapshot em SQLite com o horário da busca. Qualquer
+taxa cruzada é derivada em memória (taxa[destino] / taxa[origem]), então
+converter entre dezenas de moedas custa uma requisição por base, não uma
+por par.
+
+As requisições compartilham uma requests.Session (conexões TCP/TLS
+reaproveitadas) e várias bases são buscadas em paralelo. Um snapshot
+vencido, mas dentro de max_stale, é usado na hora enquanto threads em
+segundo plano o atualizam; ao sair, o processo as espera por no máximo
+REFRESH_GRACE segundos.
+"""
+import atexit
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from pathlib import Path
+import requests
+from requests.adapters import HTTPAdapter
+from .utils import print_error, print_warning, print_info
+
+API_URL = 'https://v6.exchangerate-api.com/v6'
+MAX_CONCURRENT = 8
+TIMEOUT = 10
+REFRESH_GRACE = 1.5
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    base TEXT PRIMARY KEY,
+    fetched_at REAL NOT NULL,
+    updated_at INTEGER
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS rates (
+    base TEXT NOT NULL,
+    currency TEXT NOT NULL,
+    rate REAL NOT NULL,
+    PRIMARY KEY (base, currency)
+) WITHOUT ROWID;
+"""
+
+def format_age(seconds):
+    """Idade de um snapshot em texto curto (ex: 3h, 2d)"""
+    for unit, size in (('d', 86400), ('h', 3600), ('min', 60)):
+        if seconds >= size:
+            return f"{seconds / size:.0f}{unit}"
+    return f"{seconds:.0f}s"
+
+class RateError(Exception):
+    """Falha ao obter uma tabela de câmbio"""
+
+class CurrencyRates:
+    def __init__(self, config, offline=False):
+        self.config = config
+        self.cache_dir = Path(config.config_dir) / 'cache'
+        self.cache_dir.mkdir(exist_ok=True)
+        self.db_path = self.cache_dir / 'currency.db'
+        
+        self.default_base = config.get('currency', 'default_base', 'USD').upper()
+        self.cache_duration = config.get_int('currency', 'cache_duration', 3600)
+        self.max_stale = config.get_int('currency', 'max_stale', 604800)
+        self.offline = offline or config.get_bool('currency', 'offline', False)
+        self.api_url = config.get('currency', 'api_base_url', API_URL).rstrip('/') or API_URL
+        self.prefetch = [base.strip().upper() for base in config.get('currency', 'prefetch_bases', '').split(',')
+                         if base.strip()]
+        
+        self._tables = None
+        self._session = None
+        self._lock = threading.Lock()
+        self._refresh = []
+    
+    def _connect(self):
+        conn = sqlite3.connect(str(self.db_path))
+        conn.executescript(SCHEMA)
+        return conn
+    
+    def tables(self):
+        """Snapshots gravados: {base: (buscado_em, {moeda: taxa})}, lidos uma vez por processo"""
+        if self._tables is None:
+            self._tables = {}
+            try:
+                with closing(self._connect()) as conn:
+                    for base, fetched_at in conn.execute('SELECT base, fetched_at FROM snapshots'):
+                        self._tables[base] = (fetched_at, {})
+                    for base, currency, rate in conn.execute('SELECT base, currency, rate FROM rates'):
+                        if base in self._tables:
+                            self._tables[base][1][currency] = rate
+            except sqlite3.Error as e:
+                print_warning(f"Erro ao ler cache de câmbio: {e}")
+        return self._tables
+    
+    def _store(self, base, fetched_at, updated_at, rates):
+        """Substitui o snapshot da base em uma única transação"""
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute('DELETE FROM rates WHERE base=?', (base,))
+                conn.execute('INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?)', (base, fetched_at, updated_at))
+                conn.executemany('INSERT INTO rates VALUES (?, ?, ?)',
+                                 ((base, currency, rate) for currency, rate in rates.items()))
+        except sqlite3.Error as e:
+            print_warning(f"Erro ao salvar cache de câmbio: {e}")
+    
+    def _best(self, source, target):
+        """Snapshot mais recente que contém as duas moedas: (base, buscado_em, taxas) ou None"""
+        best = None
+        with self._lock:
+            tables = list(self.tables().items())
+        for base, (fetched_at, rates) in tables:
+            if source in rates and target in rates and (best is None or fetched_at > best[1]):
+                best = (base, fetched_at, rates)
+        return best
+    
+    @property
+    def session(self):
+        """Sessão HTTP compartilhada, com pool para as buscas paralelas"""
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=MAX_CONCURRENT, pool_maxsize=MAX_CONCURRENT)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            self._session = session
+        return self._session
+    
+    def fetch(self, base):
+        """Busca a tabela completa da base na API e grava o snapshot; retorna as taxas"""
+        api_key = self.config.get('currency', 'api_key')
+        if not api_key:
+            raise RateError("Chave da API de moeda não configurada. Use: devtools config set currency api_key SUA_CHAVE")
+        
+        try:
+            response = self.session.get(f"{self.api_url}/{api_key}/latest/{base}", timeout=TIMEOUT)
+            if response.status_code != 200:
+                raise RateError(f"Erro HTTP: {response.status_code}")
+            data = response.json()
+            if data.get('result') != 'success':
+                raise RateError(f"Erro da API: {data.get('error-type', 'Desconhecido')}")
+            rates = {currency: float(rate) for currency, rate in data['conversion_rates'].items()}
+        except requests.RequestException as e:
+            raise RateError(f"Erro de rede: {e}") from e
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            raise RateError(f"Resposta inválida da API de câmbio: {e}") from e
+        
+        fetched_at = time.time()
+        self._store(base, fetched_at, data.get('time_last_update_unix'), rates)
+        with self._lock:
+            self.tables()[base] = (fetched_at, rates)
+        return rates
+    
+    def fetch_many(self, bases):
+        """Busca várias bases em paralelo; retorna {base: taxas ou RateError}"""
+        def attempt(base):
+            try:
+                return self.fetch(base)
+            except RateError as e:
+                return e
+        
+        bases = list(dict.fromkeys(bases))
+        if len(bases) == 1:
+            return {bases[0]: attempt(bases[0])}
+        with ThreadPoolExecutor(max_workers=min(len(bases), MAX_CONCURRENT)) as executor:
+            return dict(zip(bases, executor.map(attempt, bases)))
+    
+    def revalidate(self, bases):
+        """Atualiza as bases em segundo plano (no máximo uma atualização por vez)
+        
+        As threads são daemon e, ao sair, o processo espera no máximo
+        REFRESH_GRACE segundos por elas; o que não terminar fica para a
+        próxima execução.
+        """
+        with self._lock:
+            if any(thread.is_alive() for thread in self._refresh):
+                return
+            if not self._refresh:
+                atexit.register(self.wait, REFRESH_GRACE)
+            self._refresh = [threading.Thread(target=self._quiet_fetch, args=(base,), name=f'currency-refresh-{base}',
+                                              daemon=True)
+                             for base in dict.fromkeys(bases)]
+            for thread in self._refresh:
+                thread.start()
+    
+    def _quiet_fetch(self, base):
+        try:
+            self.fetch(base)
+        except RateError:
+            pass
+    
+    def wait(self, timeout=None):
+        """Aguarda a atualização em segundo plano, se houver (timeout total em segundos)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for thread in self._refresh:
+            thread.join(None if deadline is None else max(0, deadline - time.monotonic()))
+    
+    def _bases(self, source):
+        """Bases a buscar: a padrão, as de pré-carga e a origem se a padrão não a cobre"""
+        bases = [self.default_base, *self.prefetch]
+        known = self.tables().get(self.default_base)
+        if known and source not in known[1]:
+            bases.append(source)
+        return bases
+    
+    def rate(self, source, target):
+        """Taxa de câmbio de source para target, derivada do snapshot mais recente"""
+        source = source.upper()
+        target = target.upper()
+        if source == target:
+            return 1.0
+        
+        best = self._best(source, target)
+        age = time.time() - best[1] if best else None
+        if best and (age < self.cache_duration or self.offline):
+            if self.offline and age >= self.cache_duration:
+                print_warning(f"Modo offline: usando taxas de {format_age(age)} atrás")
+            return best[2][target] / best[2][source]
+        if self.offline:
+            print_error("Modo offline e nenhuma taxa em cache para este par de moedas")
+            return None
+        
+        # Vencido mas recente: responde na hora e atualiza em segundo plano
+        if best and (not self.max_stale or age < self.max_stale):
+            self.revalidate(self._bases(source))
+            return best[2][target] / best[2][source]
+        
+        bases = self._bases(source)
+        results = self.fetch_many(bases)
+        fetched = [rates for rates in results.values() if not isinstance(rates, RateError)]
+        if fetched and source not in bases and not any(source in rates for rates in fetched):
+            # A base padrão não tem a moeda de origem: tenta a tabela da própria origem
+            results.update(self.fetch_many([source]))
+            fetched = [rates for rates in results.values() if not isinstance(rates, RateError)]
+        
+        for rates in fetched:
+            if source in rates and target in rates:
+                return rates[target] / rates[source]
+        if not fetched:
+            print_error(str(results[bases[0]]))
+            if not self.config.get('currency', 'api_key'):
+                print_info("Você pode obter uma chave gratuita em: https://exchangerate-api.com/")
+            return None
+        missing = target if any(source in rates for rates in fetched) else source
+        print_error(f"Moeda não suportada: {missing}")
+        return None
\ No newline at end of file
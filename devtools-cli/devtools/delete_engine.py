@@ -0,0 +1,224 @@
+"""
+Motor de exclusão em massa do DevTools CLI
+
+A exclusão acontece em duas fases: uma varredura em largura, paralela por
+nível, que levanta arquivos, diretórios e bytes (usada também no resumo de
+confirmação); depois a remoção dos arquivos em um pool de workers e dos
+diretórios de baixo para cima, também em paralelo por nível.
+"""
+import glob
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from .utils import default_workers
+
+UNLINK_BATCH_SIZE = 256
+
+class DeletePlan:
+    """Resultado da varredura: o que será apagado"""
+    
+    def __init__(self):
+        self.targets = []
+        self.files = []
+        self.levels = []
+        self.total_bytes = 0
+        self.errors = []
+        self.skipped = 0
+    
+    @property
+    def directory_count(self):
+        return sum(len(level) for level in self.levels)
+    
+    @property
+    def entry_count(self):
+        return len(self.files) + self.directory_count
+
+def _has_magic(pattern):
+    return glob.has_magic(pattern) if hasattr(glob, 'has_magic') else any(c in pattern for c in '*?[')
+
+def _remove_nested(paths):
+    """Remove caminhos contidos em outros caminhos da lista"""
+    result = []
+    for path in sorted(set(os.path.abspath(p) for p in paths)):
+        if result and (path == result[-1] or path.startswith(result[-1].rstrip(os.sep) + os.sep)):
+            continue
+        result.append(path)
+    return result
+
+def _glob_root(pattern):
+    """Parte fixa (sem curingas) de um padrão glob: a pasta onde a busca começa"""
+    parts = []
+    for part in os.path.dirname(pattern).split(os.sep):
+        if _has_magic(part):
+            break
+        parts.append(part)
+    return os.sep.join(parts) or (os.sep if pattern.startswith(os.sep) else os.curdir)
+
+def select_targets(patterns, regex=None, rules=None):
+    """Expande padrões glob (ou busca por regex) em caminhos a apagar
+    
+    Sem regex, cada padrão é um caminho literal ou um glob (** recursivo); um
+    caminho que existe é sempre tratado como literal.
+    Com regex, os padrões são pastas raiz e são selecionadas as entradas cujo
+    caminho relativo casa com a expressão; diretórios selecionados não são
+    percorridos. rules (IgnoreRules) remove do resultado os caminhos filtrados.
+    
+    Retorna (alvos, padrões_sem_correspondência).
+    """
+    targets = []
+    unmatched = []
+    
+    if regex:
+        compiled = re.compile(regex)
+        for root in patterns:
+            if not os.path.isdir(root):
+                unmatched.append(root)
+                continue
+            for current, dirs, files in (rules.walk(root) if rules else os.walk(root)):
+                kept = []
+                for name in dirs:
+                    path = os.path.join(current, name)
+                    if compiled.search(os.path.relpath(path, root)):
+                        targets.append(path)
+                    else:
+                        kept.append(name)
+                dirs[:] = kept
+                targets.extend(os.path.join(current, name) for name in files
+                               if compiled.search(os.path.relpath(os.path.join(current, name), root)))
+    else:
+        for pattern in patterns:
+            # Um caminho existente vale como literal mesmo com [, * ou ? no nome
+            if _has_magic(pattern) and not os.path.lexists(pattern):
+                matches = glob.glob(pattern, recursive=True)
+                if rules:
+                    root = _glob_root(pattern)
+                    matches = [path for path in matches if not rules.excludes(path, root)]
+            else:
+                matches = [pattern] if os.path.lexists(pattern) else []
+            if not matches:
+                unmatched.append(pattern)
+            targets.extend(matches)
+    
+    return _remove_nested(targets), unmatched
+
+def _scan_directory(path, matcher=None):
+    """Lista um diretório retornando (arquivos, bytes, subdiretórios, ignorados, erro)
+    
+    Com um matcher, as subpastas são pares (caminho, matcher da subpasta).
+    """
+    files = []
+    subdirs = []
+    total = 0
+    skipped = 0
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                if matcher and not matcher.accepts(entry.name, is_dir):
+                    skipped += 1
+                elif is_dir:
+                    subdirs.append((entry.path, matcher.child(entry.name)) if matcher else entry.path)
+                else:
+                    files.append(entry.path)
+                    try:
+                        total += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        pass
+    except OSError as e:
+        return files, total, subdirs, skipped, e
+    return files, total, subdirs, skipped, None
+
+def _scan_filtered(path_and_matcher):
+    return _scan_directory(*path_and_matcher)
+
+def scan(targets, workers=None, rules=None):
+    """Varre os alvos em largura, um nível por vez em paralelo
+    
+    Com rules (IgnoreRules), entradas filtradas são preservadas junto com
+    todos os diretórios acima delas, que então não são removidos.
+    """
+    plan = DeletePlan()
+    plan.targets = list(targets)
+    level = []
+    kept = set()
+    
+    for target in plan.targets:
+        if os.path.isdir(target) and not os.path.islink(target):
+            level.append((target, rules.matcher(target)) if rules else target)
+        else:
+            plan.files.append(target)
+            try:
+                plan.total_bytes += os.lstat(target).st_size
+            except OSError:
+                pass
+    
+    with ThreadPoolExecutor(max_workers=workers or default_workers()) as executor:
+        while level:
+            paths = [item[0] for item in level] if rules else level
+            plan.levels.append(paths)
+            next_level = []
+            results = executor.map(_scan_filtered if rules else _scan_directory, level)
+            for path, (files, total, subdirs, skipped, error) in zip(paths, results):
+                plan.files.extend(files)
+                plan.total_bytes += total
+                next_level.extend(subdirs)
+                if skipped:
+                    plan.skipped += skipped
+                    kept.add(path)
+                if error:
+                    plan.errors.append(error)
+            level = next_level
+    
+    if kept:
+        # Um diretório com algo preservado não fica vazio: nem ele nem os acima dele
+        scanned = set().union(*plan.levels)
+        for path in list(kept):
+            path = os.path.dirname(path)
+            while path in scanned and path not in kept:
+                kept.add(path)
+                path = os.path.dirname(path)
+        plan.levels = [[path for path in level if path not in kept] for level in plan.levels]
+    
+    return plan
+
+def execute(plan, workers=None, throttle=None, progress_callback=None):
+    """Apaga o plano: arquivos em paralelo, depois diretórios do nível mais profundo ao raiz
+    
+    throttle (rate_limit.Throttle) limita as remoções por segundo.
+    Retorna (entradas_removidas, erros).
+    """
+    errors = list(plan.errors)
+    removed = 0
+    
+    def run(func, paths):
+        done = 0
+        failures = []
+        for path in paths:
+            if throttle:
+                throttle.consume(0, 1)
+            try:
+                func(path)
+                done += 1
+            except FileNotFoundError:
+                done += 1
+            except OSError as e:
+                failures.append(e)
+        if progress_callback:
+            progress_callback(len(paths))
+        return done, failures
+    
+    with ThreadPoolExecutor(max_workers=workers or default_workers()) as executor:
+        batches = [plan.files[i:i + UNLINK_BATCH_SIZE]
+                   for i in range(0, len(plan.files), UNLINK_BATCH_SIZE)]
+        for done, failures in executor.map(lambda batch: run(os.unlink, batch), batches):
+            removed += done
+            errors.extend(failures)
+        
+        # Diretórios do mesmo nível são independentes entre si
+        for level in reversed(plan.levels):
+            batches = [level[i:i + UNLINK_BATCH_SIZE] for i in range(0, len(level), UNLINK_BATCH_SIZE)]
+            for done, failures in executor.map(lambda batch: run(os.rmdir, batch), batches):
+                removed += done
+                errors.extend(failures)
+    
+    return removed, errors
\ No newline at end of file
@@ -1,27 +1,42 @@
 """
 Gerenciador de arquivos do DevTools CLI
 """
+import contextlib
+import json
 import os
+import re
+import shlex
 import shutil
 import stat
+import subprocess
+import sys
+import time
 from datetime import datetime
 from pathlib import Path
 from rich.console import Console
+from rich.live import Live
 from rich.table import Table
 from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn
 
 from .utils import (
     print_success, print_error, print_warning, print_info,
-    confirm_action, format_bytes, validate_file_path
+    confirm_action, format_bytes, validate_file_path, parse_size
 )
+from . import (
+    archiver, bulk_rename, checksum, copy_engine, delete_engine, file_server, file_watcher, grep_engine,
+    inventory, rate_limit, snapshot_store, split_engine, text_stats, top_files, tree_diff
+)
+from .hash_cache import HashCache
+from .trash import Trash
 
 console = Console()
+err_console = Console(stderr=True)
 
 class FileManager:
     def __init__(self, config):
         self.config = config
     
-    def list_files(self, path='.', show_hidden=False, long_format=False):
+    def list_files(self, path='.', show_hidden=False, long_format=False, rules=None):
         """Lista arquivos e pastas"""
         try:
             path = Path(path).resolve()
@@ -35,9 +50,12 @@ class FileManager:
                 return
             
             items = []
+            matcher = rules.matcher(path) if rules else None
             for item in path.iterdir():
                 if not show_hidden and item.name.startswith('.'):
                     continue
+                if matcher and not matcher.accepts(item.name, item.is_dir() and not item.is_symlink()):
+                    continue
                 
                 stat_info = item.stat()
                 items.append({
@@ -106,7 +124,8 @@ class FileManager:
         
         console.print(f"\n📊 Total: {total_dirs} diretórios, {total_files} arquivos ({format_bytes(total_size)})")
     
-    def copy_file(self, source, destination, recursive=False):
+    def copy_file(self, source, destination, recursive=False, resume=False, verify=False, manifest=None,
+                  rules=None, bwlimit=None, iops_limit=None, idle_io=False):
         """Copia arquivo ou pasta"""
         try:
             source_path = Path(source).resolve()
@@ -116,6 +135,19 @@ class FileManager:
                 print_error(f"Arquivo/pasta origem não encontrado: {source_path}")
                 return
             
+            throttle = self._throttle(bwlimit, iops_limit, idle_io)
+            
+            verify = verify or manifest is not None
+            if verify and resume:
+                print_error("--verify não pode ser combinado com --resume (a cópia retomável já verifica cada bloco)")
+                return
+            
+            algorithm = self.config.get('copy', 'verify_algorithm', 'sha256')
+            readback = self.config.get('copy', 'verify_mode', 'readback') != 'trust'
+            if verify and algorithm not in checksum.SUPPORTED_ALGORITHMS:
+                print_error(f"Algoritmo de verificação não suportado: {algorithm}")
+                return
+            
             # Se destino é um diretório existente, copia para dentro dele
             if dest_path.is_dir():
                 dest_path = dest_path / source_path.name
@@ -123,6 +155,10 @@ class FileManager:
             if source_path.is_file():
                 # Copia arquivo
                 if dest_path.exists():
+                    if self._skip_identical_copies() and self._is_identical(source_path, dest_path):
+                        print_info(f"Destino idêntico à origem, cópia ignorada: {dest_path}")
+                        return
+                    
                     if not confirm_action(f"Arquivo '{dest_path}' já existe. Sobrescrever?"):
                         print_info("Operação cancelada")
                         return
@@ -137,16 +173,31 @@ class FileManager:
                     TimeRemainingColumn(),
                 ) as progress:
                     task = progress.add_task(f"Copiando {source_path.name}", total=source_path.stat().st_size)
+                    advance = lambda n: progress.update(task, advance=n)
                     
-                    with open(source_path, 'rb') as src, open(dest_path, 'wb') as dst:
-                        while True:
-                            chunk = src.read(8192)
-                            if not chunk:
-                                break
-                            dst.write(chunk)
-                            progress.update(task, advance=len(chunk))
+                    if resume:
+                        try:
+                            resumed = copy_engine.resumable_copy(source_path, dest_path,
+                                                                 progress_callback=advance,
+                                                                 throttle=throttle)
+                        except KeyboardInterrupt:
+                            progress.stop()
+                            print_warning("Cópia interrompida. Execute novamente com --resume para continuar")
+                            return
+                    elif verify:
+                        digest, _, holes = copy_engine.verified_copy(source_path, dest_path, algorithm,
+                                                                     readback, advance, throttle=throttle)
+                    else:
+                        _, holes = copy_engine.copy_file_data(source_path, dest_path, advance,
+                                                              throttle=throttle)
                 
+                if resume and resumed:
+                    print_info(f"Retomado a partir de {format_bytes(resumed)} já verificados")
                 print_success(f"Arquivo copiado: {source_path} → {dest_path}")
+                if not resume and holes:
+                    print_info(f"Arquivo esparso: {format_bytes(holes)} em buracos não gravados")
+                if verify:
+                    self._report_verified_copy([(dest_path, digest)], algorithm, readback, manifest)
             
             elif source_path.is_dir():
                 # Copia diretório
@@ -159,15 +210,85 @@ class FileManager:
                         print_info("Operação cancelada")
                         return
                 
-                shutil.copytree(source_path, dest_path, dirs_exist_ok=True)
+                with self._open_hash_cache() as cache:
+                    # Arquivos idênticos no destino não são reescritos
+                    skip = (lambda src, dst: self._is_identical(src, dst, cache)) if cache else None
+                    copier = copy_engine.TreeCopier(skip, algorithm if verify else None, readback, throttle)
+                    ignore = rules.copytree_ignore(source_path) if rules else None
+                    shutil.copytree(source_path, dest_path, dirs_exist_ok=True, copy_function=copier,
+                                    ignore=ignore)
+                
                 print_success(f"Diretório copiado: {source_path} → {dest_path}")
+                if copier.skipped_files:
+                    print_info(f"{copier.skipped_files} arquivos idênticos ignorados")
+                if copier.bytes_avoided:
+                    print_info(f"{format_bytes(copier.bytes_avoided)} não gravados "
+                               f"({format_bytes(copier.sparse_bytes)} em buracos, "
+                               f"{copier.linked_files} hardlinks recriados)")
+                if verify:
+                    self._report_verified_copy(copier.digests, algorithm, readback, manifest)
         
+        except copy_engine.VerificationError as e:
+            print_error(str(e))
         except PermissionError:
             print_error("Permissão negada para realizar a cópia")
         except Exception as e:
             print_error(f"Erro ao copiar: {e}")
     
-    def move_file(self, source, destination):
+    def _report_verified_copy(self, digests, algorithm, readback, manifest):
+        """Informa a verificação da cópia e grava o manifesto, se pedido"""
+        how = "relidos do disco" if readback else "calculados durante a cópia"
+        print_success(f"{len(digests)} arquivos verificados ({algorithm}, {how})")
+        
+        if manifest:
+            # Caminhos do manifesto ficam relativos à pasta do manifesto
+            base_dir = os.path.dirname(os.path.abspath(manifest))
+            with open(manifest, 'w', encoding='utf-8') as f:
+                for path, digest in sorted(digests, key=lambda item: str(item[0])):
+                    f.write(checksum.format_manifest_line(digest, os.path.relpath(path, base_dir)) + '\n')
+            print_success(f"Manifesto gravado: {manifest}")
+    
+    def _skip_identical_copies(self):
+        """Indica se cópias para destinos idênticos devem ser ignoradas"""
+        return (self.config.get_bool('hash_cache', 'enabled', True) and
+                self.config.get_bool('hash_cache', 'skip_identical_copies', True))
+    
+    def _open_hash_cache(self):
+        """Abre o cache de checksums, ou um contexto vazio se desativado"""
+        if not self._skip_identical_copies():
+            return contextlib.nullcontext()
+        return HashCache(self.config)
+    
+    def _is_identical(self, source_path, dest_path, cache=None):
+        """Compara origem e destino por tamanho e checksum (via cache)"""
+        try:
+            if os.path.getsize(source_path) != os.path.getsize(dest_path):
+                return False
+            
+            if cache is None:
+                with HashCache(self.config) as cache:
+                    return self._is_identical(source_path, dest_path, cache)
+            
+            return cache.get_digest(source_path) == cache.get_digest(dest_path)
+        except OSError:
+            return False
+    
+    def _throttle(self, bwlimit=None, iops_limit=None, idle_io=False):
+        """Limites de I/O da operação (opções da linha de comando ou padrões do config)"""
+        bwlimit = bwlimit or self.config.get('throttle', 'bwlimit', '')
+        iops_limit = iops_limit or self.config.get('throttle', 'iops_limit', '')
+        try:
+            bytes_per_second = parse_size(bwlimit) if bwlimit else None
+            ops_per_second = float(iops_limit) if iops_limit else None
+        except ValueError:
+            raise ValueError(f"Limite de I/O inválido: {bwlimit or iops_limit}")
+        
+        if idle_io or self.config.get_bool('throttle', 'idle_io', False):
+            if not rate_limit.set_idle_io_priority():
+                print_warning("Prioridade de I/O ociosa não suportada neste sistema")
+        return rate_limit.Throttle.from_limits(bytes_per_second, ops_per_second)
+    
+    def move_file(self, source, destination, bwlimit=None, iops_limit=None, idle_io=False):
         """Move arquivo ou pasta"""
         try:
             source_path = Path(source).resolve()
@@ -189,7 +310,11 @@ class FileManager:
             # Cria diretório pai se não existir
             dest_path.parent.mkdir(parents=True, exist_ok=True)
             
-            shutil.move(str(source_path), str(dest_path))
+            throttle = self._throttle(bwlimit, iops_limit, idle_io)
+            if throttle:
+                copy_engine.throttled_move(source_path, dest_path, throttle)
+            else:
+                shutil.move(str(source_path), str(dest_path))
             print_success(f"Movido: {source_path} → {dest_path}")
         
         except PermissionError:
@@ -221,40 +346,1050 @@ class FileManager:
         except Exception as e:
             print_error(f"Erro ao renomear: {e}")
     
-    def delete_files(self, paths, force=False, recursive=False):
-        """Apaga arquivos ou pastas"""
+    def bulk_rename(self, paths, pattern, template, recursive=False, dry_run=False, force=False,
+                    rules=None):
+        """Renomeia vários arquivos com regex e template (ex: '(.*)\\.jpeg$' → '\\1.jpg')"""
+        try:
+            paths = paths or ['.']
+            plan = bulk_rename.build_plan(paths, pattern, template, recursive, rules)
+            
+            if not plan.mapping:
+                print_info("Nenhum arquivo corresponde ao padrão")
+                return True
+            
+            if dry_run or not force:
+                self._print_rename_plan(plan, limit=None if dry_run else 10)
+            
+            if dry_run:
+                print_info("Simulação: nenhum arquivo foi renomeado")
+                return True
+            
+            if not force and not confirm_action(f"Renomear {len(plan.mapping)} itens?"):
+                print_info("Operação cancelada")
+                return False
+            
+            start = time.perf_counter()
+            bulk_rename.execute_plan(plan)
+            elapsed = time.perf_counter() - start
+            
+            print_success(f"{len(plan.mapping)} itens renomeados em {elapsed:.2f}s")
+            return True
+        
+        except bulk_rename.RenameConflict as e:
+            for conflict in e.conflicts[:20]:
+                print_error(f"Conflito: {conflict}")
+            if len(e.conflicts) > 20:
+                print_error(f"... e mais {len(e.conflicts) - 20} conflitos")
+            print_warning("Nenhum arquivo foi renomeado")
+        except re.error as e:
+            print_error(f"Expressão regular inválida: {e}")
+        except PermissionError:
+            print_error("Permissão negada para renomear (alterações desfeitas)")
+        except Exception as e:
+            print_error(f"Erro ao renomear: {e}")
+        return False
+    
+    def _print_rename_plan(self, plan, limit=10):
+        """Mostra o plano de renomeação"""
+        table = Table(show_header=True, header_style="bold magenta")
+        table.add_column("Atual", style="white")
+        table.add_column("Novo", style="green")
+        
+        items = list(plan.mapping.items())
+        for src, dst in items[:limit]:
+            table.add_row(os.path.relpath(src), os.path.relpath(dst))
+        
+        console.print(table)
+        if limit is not None and len(items) > limit:
+            console.print(f"  ... e mais {len(items) - limit}")
+        if plan.cycles:
+            print_info(f"{plan.cycles} ciclos resolvidos com nomes temporários")
+    
+    def delete_files(self, paths, force=False, recursive=False, use_trash=False, regex=None, workers=None,
+                     rules=None, iops_limit=None, idle_io=False):
+        """Apaga arquivos ou pastas (aceita padrões glob ou --regex)"""
         try:
             confirm_deletions = self.config.get_bool('general', 'confirm_deletions', True)
+            use_trash = use_trash or self.config.get_bool('general', 'use_trash', False)
+            if use_trash and rules:
+                # A lixeira move cada alvo inteiro: não há como preservar partes dele
+                print_error("Filtros (--exclude/--include/--respect-gitignore) não podem ser usados com a lixeira")
+                return
             
-            for path_str in paths:
-                path = Path(path_str).resolve()
+            targets, unmatched = delete_engine.select_targets(paths, regex, rules)
+            for pattern in unmatched:
+                print_warning(f"Arquivo/pasta não encontrado: {Path(pattern).resolve()}")
+            
+            selected = []
+            for target in targets:
+                path = Path(target)
+                if path.is_dir() and not path.is_symlink() and not recursive and any(path.iterdir()):
+                    print_error(f"Diretório não vazio: {path}. Use -r/--recursive para apagar")
+                    continue
+                selected.append(target)
+            
+            if not selected:
+                return
+            
+            # A lixeira é um rename por alvo: não precisa varrer as árvores
+            plan = None if use_trash else delete_engine.scan(selected, workers, rules)
+            
+            # Confirmação de segurança única, com o resumo do que será apagado
+            if not force and confirm_deletions:
+                self._print_delete_summary(selected, plan)
+                if plan:
+                    message = (f"Confirmar exclusão de {len(selected)} itens ({len(plan.files)} arquivos, "
+                               f"{plan.directory_count} diretórios, {format_bytes(plan.total_bytes)})?")
+                else:
+                    message = f"Mover {len(selected)} itens para a lixeira?"
                 
-                if not path.exists():
-                    print_warning(f"Arquivo/pasta não encontrado: {path}")
+                if not confirm_action(message):
+                    print_info("Exclusão cancelada")
+                    return
+            
+            if use_trash:
+                trash = Trash(self.config)
+                for target in selected:
+                    # Rename para a lixeira: tempo constante mesmo para árvores enormes
+                    entry_id = trash.move_to_trash(target)
+                    print_success(f"Movido para a lixeira: {target} (id: {entry_id})")
+                return
+            
+            throttle = self._throttle(None, iops_limit, idle_io)
+            start = time.perf_counter()
+            with Progress(
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                "[progress.percentage]{task.percentage:>3.0f}%",
+                TimeRemainingColumn(),
+                disable=plan.entry_count < 1000,
+            ) as progress:
+                task = progress.add_task("Apagando", total=plan.entry_count)
+                removed, errors = delete_engine.execute(
+                    plan, workers, throttle, progress_callback=lambda n: progress.update(task, advance=n)
+                )
+            elapsed = time.perf_counter() - start
+            
+            for error in errors[:10]:
+                print_error(f"Falha ao apagar {error.filename}: {error.strerror}")
+            if len(errors) > 10:
+                print_error(f"... e mais {len(errors) - 10} falhas")
+            
+            if len(selected) == 1 and not errors and not plan.skipped:
+                item_type = "Diretório" if plan.levels else "Arquivo"
+                print_success(f"{item_type} apagado: {selected[0]}")
+            else:
+                print_success(f"{removed} de {plan.entry_count} entradas apagadas")
+            if plan.skipped:
+                print_info(f"{plan.skipped} entradas preservadas pelos filtros")
+            
+            if plan.levels and plan.files:
+                rate = len(plan.files) / elapsed if elapsed > 0 else 0
+                print_info(f"{len(plan.files)} arquivos, {format_bytes(plan.total_bytes)} em "
+                           f"{elapsed:.2f}s ({rate:,.0f} arquivos/s)")
+        
+        except re.error as e:
+            print_error(f"Expressão regular inválida: {e}")
+        except PermissionError:
+            print_error("Permissão negada para realizar a exclusão")
+        except Exception as e:
+            print_error(f"Erro ao apagar: {e}")
+    
+    def _print_delete_summary(self, targets, plan, limit=10):
+        """Mostra os alvos de uma exclusão antes da confirmação"""
+        console.print(f"\n🗑️  {len(targets)} itens selecionados:")
+        for target in targets[:limit]:
+            icon = "📁" if os.path.isdir(target) and not os.path.islink(target) else "📄"
+            console.print(f"  {icon} {target}")
+        if len(targets) > limit:
+            console.print(f"  ... e mais {len(targets) - limit}")
+        if plan and plan.skipped:
+            console.print(f"  ({plan.skipped} entradas preservadas pelos filtros)")
+        console.print()
+    
+    def hash_files(self, paths, algorithms=None, output=None, recursive=False, workers=None, rules=None):
+        """Calcula checksums de arquivos e opcionalmente grava um manifesto"""
+        try:
+            algorithms = algorithms or ['sha256']
+            files = list(checksum.iter_files(paths, recursive, rules))
+            
+            if not files:
+                print_warning("Nenhum arquivo para processar")
+                return False
+            
+            # Caminhos do manifesto ficam relativos à pasta do manifesto
+            base_dir = os.path.dirname(os.path.abspath(output)) if output else None
+            use_tag = len(algorithms) > 1
+            
+            start = time.perf_counter()
+            total_bytes = 0
+            errors = 0
+            lines = []
+            
+            for path, digests, error in checksum.hash_files(files, algorithms, workers):
+                if error:
+                    print_error(f"Erro ao ler {path}: {error}")
+                    errors += 1
                     continue
                 
-                # Confirmação de segurança
-                if not force and confirm_deletions:
-                    item_type = "diretório" if path.is_dir() else "arquivo"
-                    if not confirm_action(f"Confirmar exclusão do {item_type} '{path}'?"):
-                        print_info(f"Exclusão de '{path}' cancelada")
-                        continue
+                total_bytes += os.path.getsize(path)
+                name = os.path.relpath(os.path.abspath(path), base_dir) if base_dir else path
                 
-                if path.is_file():
-                    # Apaga arquivo
-                    path.unlink()
-                    print_success(f"Arquivo apagado: {path}")
+                for algorithm in algorithms:
+                    line = checksum.format_manifest_line(
+                        digests[algorithm], name, algorithm if use_tag else None
+                    )
+                    if output:
+                        lines.append(line)
+                    else:
+                        print(line)
+            
+            elapsed = time.perf_counter() - start
+            
+            if output:
+                with open(output, 'w', encoding='utf-8') as f:
+                    f.write('\n'.join(lines) + '\n')
+                print_success(f"Manifesto gravado: {output}")
                 
-                elif path.is_dir():
-                    # Apaga diretório
-                    if not recursive and any(path.iterdir()):
-                        print_error(f"Diretório não vazio: {path}. Use -r/--recursive para apagar")
-                        continue
-                    
-                    shutil.rmtree(path)
-                    print_success(f"Diretório apagado: {path}")
+                # Sem manifesto a saída padrão fica restrita às linhas de checksum
+                rate = total_bytes / elapsed if elapsed > 0 else 0
+                print_info(f"{len(files) - errors} arquivos, {format_bytes(total_bytes)} em "
+                           f"{elapsed:.2f}s ({format_bytes(rate)}/s)")
+            
+            return errors == 0
+        
+        except Exception as e:
+            print_error(f"Erro ao calcular checksums: {e}")
+            return False
+    
+    def verify_manifest(self, manifest, workers=None):
+        """Verifica arquivos listados em um manifesto de checksums"""
+        try:
+            manifest_path = Path(manifest).resolve()
+            
+            if not manifest_path.is_file():
+                print_error(f"Manifesto não encontrado: {manifest_path}")
+                return False
+            
+            entries = checksum.read_manifest(manifest_path)
+            if not entries:
+                print_warning("Manifesto vazio")
+                return False
+            
+            base_dir = manifest_path.parent
+            failed = []
+            missing = []
+            ok = 0
+            
+            # Agrupa por conjunto de algoritmos para ler cada arquivo uma única vez
+            groups = {}
+            for filename, expected in entries.items():
+                groups.setdefault(tuple(sorted(expected)), []).append(filename)
+            
+            start = time.perf_counter()
+            
+            for algorithms, filenames in groups.items():
+                paths = [str(base_dir / name) for name in filenames]
+                results = checksum.hash_files(paths, algorithms, workers)
+                
+                for filename, (path, digests, error) in zip(filenames, results):
+                    if error:
+                        missing.append(filename)
+                        print_error(f"{filename}: NÃO ENCONTRADO ({error.strerror})")
+                    elif digests != entries[filename]:
+                        failed.append(filename)
+                        print_error(f"{filename}: FALHOU")
+                    else:
+                        ok += 1
+            
+            elapsed = time.perf_counter() - start
+            
+            if failed or missing:
+                print_warning(f"{ok} OK, {len(failed)} divergentes, {len(missing)} ausentes "
+                              f"({elapsed:.2f}s)")
+                return False
+            
+            print_success(f"{ok} arquivos verificados sem divergências ({elapsed:.2f}s)")
+            return True
+        
+        except ValueError as e:
+            print_error(f"Manifesto inválido: {e}")
+            return False
+        except Exception as e:
+            print_error(f"Erro ao verificar manifesto: {e}")
+            return False
+    
+    def checksum_files(self, paths, algorithm='sha256', recursive=False, workers=None, use_cache=True,
+                       rules=None):
+        """Calcula checksums reaproveitando o cache persistente"""
+        try:
+            files = list(checksum.iter_files(paths, recursive, rules))
+            
+            if not files:
+                print_warning("Nenhum arquivo para processar")
+                return False
+            
+            if not use_cache or not self.config.get_bool('hash_cache', 'enabled', True):
+                return self.hash_files(files, [algorithm], workers=workers)
+            
+            start = time.perf_counter()
+            errors = 0
+            
+            with HashCache(self.config) as cache:
+                for path, digest, error, _ in cache.get_digests(files, algorithm, workers):
+                    if error:
+                        print_error(f"Erro ao ler {path}: {error}")
+                        errors += 1
+                    else:
+                        print(checksum.format_manifest_line(digest, path))
+                
+                hits, misses = cache.hits, cache.misses
+            
+            elapsed = time.perf_counter() - start
+            print_info(f"{len(files) - errors} arquivos em {elapsed:.2f}s "
+                       f"({hits} do cache, {misses} calculados)")
+            return errors == 0
+        
+        except Exception as e:
+            print_error(f"Erro ao calcular checksums: {e}")
+            return False
+    
+    def create_archive(self, output, sources, level=6, workers=None):
+        """Cria arquivo .tar.gz com compressão paralela"""
+        try:
+            for source in sources:
+                if not os.path.exists(source):
+                    print_error(f"Arquivo/pasta origem não encontrado: {source}")
+                    return False
+            
+            output_path = Path(output).resolve()
+            if output_path.exists():
+                if not confirm_action(f"Arquivo '{output_path}' já existe. Sobrescrever?"):
+                    print_info("Operação cancelada")
+                    return False
+            
+            start = time.perf_counter()
+            with console.status(f"Compactando em {output_path.name}..."):
+                raw_size, compressed_size = archiver.create_archive(output_path, sources, level, workers)
+            elapsed = time.perf_counter() - start
+            
+            ratio = compressed_size / raw_size * 100 if raw_size else 0
+            rate = raw_size / elapsed if elapsed > 0 else 0
+            print_success(f"Arquivo criado: {output_path}")
+            print_info(f"{format_bytes(raw_size)} → {format_bytes(compressed_size)} ({ratio:.1f}%) "
+                       f"em {elapsed:.2f}s ({format_bytes(rate)}/s)")
+            return True
         
         except PermissionError:
-            print_error("Permissão negada para realizar a exclusão")
+            print_error("Permissão negada para criar o arquivo")
+        except Exception as e:
+            print_error(f"Erro ao criar arquivo: {e}")
+        return False
+    
+    def extract_archive(self, archive, destination='.', workers=None):
+        """Extrai arquivo .tar/.tar.gz em fluxo contínuo"""
+        try:
+            archive_path = Path(archive).resolve()
+            
+            if not archive_path.is_file():
+                print_error(f"Arquivo não encontrado: {archive_path}")
+                return False
+            
+            start = time.perf_counter()
+            with console.status(f"Extraindo {archive_path.name}..."):
+                members, total, warnings = archiver.extract_archive(archive_path, destination, workers)
+            elapsed = time.perf_counter() - start
+            
+            for warning in warnings:
+                print_warning(f"Ignorado: {warning}")
+            
+            rate = total / elapsed if elapsed > 0 else 0
+            print_success(f"{members} itens extraídos em {Path(destination).resolve()}")
+            print_info(f"{format_bytes(total)} em {elapsed:.2f}s ({format_bytes(rate)}/s)")
+            return True
+        
+        except PermissionError:
+            print_error("Permissão negada para extrair o arquivo")
+        except Exception as e:
+            print_error(f"Erro ao extrair arquivo: {e}")
+        return False
+    
+    def list_trash(self):
+        """Lista itens da lixeira"""
+        entries = Trash(self.config).list_entries()
+        
+        if not entries:
+            print_info("Lixeira vazia")
+            return
+        
+        table = Table(title="Lixeira", show_header=True, header_style="bold magenta")
+        table.add_column("ID", style="cyan")
+        table.add_column("Apagado em", style="yellow")
+        table.add_column("Caminho original", style="white")
+        
+        for entry in entries:
+            icon = "📁" if entry['is_dir'] else "📄"
+            table.add_row(entry['id'], entry['deleted'].strftime("%Y-%m-%d %H:%M"),
+                          f"{icon} {entry['original_path']}")
+        
+        console.print(table)
+    
+    def restore_from_trash(self, selector=None, destination=None):
+        """Restaura item da lixeira pelo id ou caminho original"""
+        try:
+            if not selector:
+                self.list_trash()
+                return False
+            
+            trash = Trash(self.config)
+            entry = trash.find_entry(selector)
+            if not entry:
+                print_error(f"Item não encontrado na lixeira: {selector}")
+                return False
+            
+            target = trash.restore(entry, destination)
+            print_success(f"Restaurado: {target}")
+            return True
+        
+        except FileExistsError as e:
+            print_error(f"{e}. Use --to para restaurar em outro caminho")
+        except PermissionError:
+            print_error("Permissão negada para restaurar")
+        except Exception as e:
+            print_error(f"Erro ao restaurar: {e}")
+        return False
+    
+    def purge_trash(self, older_than_days=None, force=False, background=False, workers=None, iops_limit=None,
+                    idle_io=False):
+        """Esvazia a lixeira definitivamente"""
+        try:
+            trash = Trash(self.config)
+            entries = trash.list_entries()
+            if older_than_days is not None:
+                cutoff = time.time() - older_than_days * 86400
+                entries = [entry for entry in entries if entry['deleted_at'] < cutoff]
+            
+            if not entries and older_than_days is not None:
+                print_info("Nenhum item da lixeira corresponde ao critério")
+                return True
+            
+            if not force and not confirm_action(f"Apagar definitivamente {len(entries)} itens da lixeira?"):
+                print_info("Operação cancelada")
+                return False
+            
+            if background:
+                # Worker destacado do terminal: o comando retorna imediatamente
+                cmd = [sys.executable, '-m', 'devtools.main', 'file', 'purge', '--force']
+                if older_than_days is not None:
+                    cmd += ['--older-than', str(older_than_days)]
+                if workers:
+                    cmd += ['--workers', str(workers)]
+                if iops_limit:
+                    cmd += ['--iops-limit', str(iops_limit)]
+                if idle_io:
+                    cmd.append('--idle-io')
+                
+                process = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                           stderr=subprocess.DEVNULL, start_new_session=True)
+                print_success(f"Limpeza da lixeira iniciada em segundo plano (PID {process.pid})")
+                return True
+            
+            throttle = self._throttle(None, iops_limit, idle_io)
+            start = time.perf_counter()
+            with console.status("Esvaziando lixeira..."):
+                purged, removed = trash.purge(
+                    older_than_days * 86400 if older_than_days is not None else None,
+                    workers, throttle
+                )
+            elapsed = time.perf_counter() - start
+            
+            print_success(f"{purged} itens removidos da lixeira ({removed} entradas em {elapsed:.2f}s)")
+            return True
+        
+        except PermissionError:
+            print_error("Permissão negada para esvaziar a lixeira")
+        except Exception as e:
+            print_error(f"Erro ao esvaziar lixeira: {e}")
+        return False
+    
+    def watch_files(self, paths, recursive=False, debounce_ms=None, output=None, command=None,
+                    on_batch=None):
+        """Monitora alterações em pastas, emitindo lotes de eventos em JSON lines"""
+        if not file_watcher.is_supported():
+            print_error("O monitoramento de arquivos requer Linux (inotify)")
+            return False
+        
+        for path in paths:
+            if not os.path.isdir(path):
+                print_error(f"Pasta não encontrada: {path}")
+                return False
+        
+        if debounce_ms is None:
+            debounce_ms = self.config.get_int('watch', 'debounce_ms', 500)
+        max_delay_ms = self.config.get_int('watch', 'max_delay_ms', 5000)
+        command = command or self.config.get('watch', 'command', '')
+        
+        out = None
+        try:
+            out = open(output, 'a', encoding='utf-8') if output else None
+            with file_watcher.DirectoryWatcher(paths, recursive, debounce_ms / 1000,
+                                               max_delay_ms / 1000) as watcher:
+                watcher.start()
+                for error in watcher.watch_errors[:10]:
+                    print_warning(error)
+                # Mensagens vão para stderr: stdout fica reservado para os eventos
+                err_console.print(f"👀 Observando {watcher.watch_count} pastas "
+                                  f"(Ctrl+C para encerrar)", style="blue")
+                
+                try:
+                    for batch in watcher.batches():
+                        self._dispatch_watch_batch(batch, out, command, on_batch)
+                except KeyboardInterrupt:
+                    batch = watcher.flush()
+                    if batch:
+                        self._dispatch_watch_batch(batch, out, command, on_batch)
+            return True
+        
+        except PermissionError:
+            print_error("Permissão negada para monitorar as pastas")
+        except Exception as e:
+            print_error(f"Erro ao monitorar arquivos: {e}")
+        finally:
+            if out:
+                out.close()
+        return False
+    
+    def _dispatch_watch_batch(self, batch, out, command, on_batch):
+        """Entrega um lote de eventos: JSON lines, comando do devtools ou plugin"""
+        record = {'time': datetime.now().isoformat(timespec='milliseconds'), 'events': batch}
+        line = json.dumps(record, ensure_ascii=False)
+        
+        if command:
+            # O comando recebe o lote em JSON pela entrada padrão
+            cmd = [sys.executable, '-m', 'devtools.main'] + shlex.split(command)
+            result = subprocess.run(cmd, input=line + '\n', text=True)
+            if result.returncode != 0:
+                print_warning(f"Comando '{command}' terminou com código {result.returncode}")
+        if on_batch:
+            on_batch(record)
+        
+        if out:
+            out.write(line + '\n')
+            out.flush()
+        elif not command and not on_batch:
+            print(line, flush=True)
+    
+    def grep_files(self, pattern, paths, ignore_case=False, fixed=False, files_with_matches=False,
+                   max_count=None, workers=None, rules=None):
+        """Pesquisa um padrão no conteúdo dos arquivos"""
+        try:
+            for path in paths:
+                if not os.path.exists(path):
+                    print_error(f"Caminho não encontrado: {path}")
+                    return False
+            
+            start = time.perf_counter()
+            searched = 0
+            binary = 0
+            matched_files = 0
+            matches = 0
+            out = sys.stdout
+            
+            for path, lines, error in grep_engine.search(paths, pattern, fixed, ignore_case,
+                                                         max_count, workers, rules):
+                searched += 1
+                if error:
+                    err_console.print(f"❌ Erro ao ler {path}: {error}", style="red")
+                    continue
+                if lines is None:
+                    binary += 1
+                    continue
+                if not lines:
+                    continue
+                
+                matched_files += 1
+                matches += len(lines)
+                if files_with_matches:
+                    out.write(f"{path}\n")
+                else:
+                    for line_number, line in lines:
+                        out.write(f"{path}:{line_number}:{line.decode('utf-8', 'replace')}\n")
+                out.flush()
+            
+            elapsed = time.perf_counter() - start
+            # Resumo em stderr: stdout fica apenas com as correspondências
+            err_console.print(f"ℹ️  {matches} correspondências em {matched_files} arquivos "
+                              f"({searched} pesquisados, {binary} binários ignorados, {elapsed:.2f}s)",
+                              style="blue")
+            return matches > 0
+        
+        except re.error as e:
+            print_error(f"Expressão regular inválida: {e}")
+        except BrokenPipeError:
+            pass
+        except Exception as e:
+            print_error(f"Erro ao pesquisar arquivos: {e}")
+        return False
+    
+    def file_stats(self, paths, recursive=False, as_json=False, show_histogram=False, workers=None,
+                   rules=None):
+        """Estatísticas de linhas, palavras e bytes (estilo wc)"""
+        try:
+            files = list(checksum.iter_files(paths, recursive, rules))
+            if not files:
+                print_warning("Nenhum arquivo para processar")
+                return False
+            
+            start = time.perf_counter()
+            results = []
+            errors = 0
+            for path, stats, error in text_stats.file_stats(files, workers):
+                if error:
+                    print_error(f"Erro ao ler {path}: {error}")
+                    errors += 1
+                    continue
+                results.append(dict(path=path, **stats))
+            elapsed = time.perf_counter() - start
+            
+            if as_json:
+                print(json.dumps(results, ensure_ascii=False, indent=2))
+                return errors == 0
+            
+            table = Table(show_header=True, header_style="bold magenta")
+            table.add_column("Arquivo", style="white")
+            table.add_column("Linhas", justify="right", style="cyan")
+            table.add_column("Palavras", justify="right", style="cyan")
+            table.add_column("Bytes", justify="right", style="green")
+            table.add_column("Maior linha", justify="right", style="yellow")
+            
+            for result in results:
+                table.add_row(result['path'], f"{result['lines']:,}", f"{result['words']:,}",
+                              f"{result['bytes']:,}", f"{result['longest_line']:,}")
+            if len(results) > 1:
+                table.add_row("[bold]Total[/bold]",
+                              f"{sum(r['lines'] for r in results):,}",
+                              f"{sum(r['words'] for r in results):,}",
+                              f"{sum(r['bytes'] for r in results):,}",
+                              f"{max(r['longest_line'] for r in results):,}")
+            console.print(table)
+            
+            if show_histogram:
+                histogram = {}
+                for result in results:
+                    for bucket, count in result['histogram'].items():
+                        histogram[bucket] = histogram.get(bucket, 0) + count
+                ordered = sorted(histogram.items(), key=lambda item: int(item[0].split('-')[0]))
+                self._print_line_histogram(dict(ordered))
+            
+            total_bytes = sum(r['bytes'] for r in results)
+            rate = total_bytes / elapsed if elapsed > 0 else 0
+            print_info(f"{len(results)} arquivos, {format_bytes(total_bytes)} em "
+                       f"{elapsed:.2f}s ({format_bytes(rate)}/s)")
+            return errors == 0
+        
+        except Exception as e:
+            print_error(f"Erro ao calcular estatísticas: {e}")
+            return False
+    
+    def _print_line_histogram(self, histogram):
+        """Mostra o histograma de comprimento das linhas"""
+        table = Table(title="Comprimento das linhas (bytes)", show_header=True, header_style="bold magenta")
+        table.add_column("Faixa", justify="right", style="cyan")
+        table.add_column("Linhas", justify="right", style="green")
+        table.add_column("", style="blue")
+        
+        peak = max(histogram.values(), default=0)
+        for bucket, count in histogram.items():
+            bar = "█" * max(1, round(30 * count / peak)) if count else ""
+            table.add_row(bucket, f"{count:,}", bar)
+        console.print(table)
+    
+    def top_files(self, paths, key='size', count=50, oldest=False, rules=None, interval=5.0):
+        """Mostra os N maiores (ou mais antigos/recentes) arquivos de uma árvore"""
+        try:
+            for path in paths:
+                if not os.path.exists(path):
+                    print_error(f"Caminho não encontrado: {path}")
+                    return False
+            
+            # Tamanho: maiores primeiro; datas: mais recentes, ou mais antigos com --oldest
+            largest = not oldest
+            start = time.perf_counter()
+            
+            with Live(console=console, auto_refresh=False, transient=True) as live:
+                def show_partial(scanned, items):
+                    live.update(self._top_table(items, key, f"Parcial: {scanned:,} arquivos verificados"),
+                                refresh=True)
+                
+                items, scanned, errors = top_files.scan(paths, key, count, largest, rules,
+                                                        show_partial, interval)
+            
+            elapsed = time.perf_counter() - start
+            console.print(self._top_table(items, key, None))
+            print_info(f"{scanned:,} arquivos verificados em {elapsed:.2f}s")
+            if errors:
+                print_warning(f"{errors} entradas não puderam ser lidas")
+            return True
+        
+        except Exception as e:
+            print_error(f"Erro ao procurar arquivos: {e}")
+            return False
+    
+    def _top_table(self, items, key, title):
+        """Tabela de resultados do file top"""
+        table = Table(title=title, show_header=True, header_style="bold magenta")
+        table.add_column("#", justify="right", style="cyan")
+        table.add_column("Tamanho", justify="right", style="green")
+        table.add_column("Acesso" if key == 'atime' else "Modificado", style="yellow")
+        table.add_column("Caminho", style="white")
+        
+        for position, (path, st) in enumerate(items, 1):
+            timestamp = st.st_atime if key == 'atime' else st.st_mtime
+            table.add_row(str(position), format_bytes(st.st_size),
+                          datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M"), path)
+        return table
+    
+    def diff_directories(self, left, right, full=False, show_same=False, output=None, workers=None,
+                         rules=None):
+        """Compara duas pastas, emitindo as diferenças em JSON lines"""
+        out = None
+        try:
+            for path in (left, right):
+                if not os.path.isdir(path):
+                    print_error(f"Pasta não encontrada: {path}")
+                    return False
+            
+            start = time.perf_counter()
+            counts = {'added': 0, 'removed': 0, 'changed': 0, 'same': 0, 'error': 0}
+            out = open(output, 'w', encoding='utf-8') if output else sys.stdout
+            
+            for item in tree_diff.diff_trees(left, right, full, workers, rules):
+                counts[item['status']] += 1
+                if item['status'] == 'same' and not show_same:
+                    continue
+                out.write(json.dumps(item, ensure_ascii=False) + '\n')
+            out.flush()
+            
+            elapsed = time.perf_counter() - start
+            # Resumo em stderr: stdout fica apenas com os registros JSON
+            err_console.print(f"ℹ️  {counts['added']} adicionados, {counts['removed']} removidos, "
+                              f"{counts['changed']} alterados, {counts['same']} iguais "
+                              f"({elapsed:.2f}s)", style="blue")
+            if counts['error']:
+                err_console.print(f"⚠️  {counts['error']} entradas não puderam ser comparadas", style="yellow")
+            return not (counts['added'] or counts['removed'] or counts['changed'])
+        
+        except BrokenPipeError:
+            return False
+        except Exception as e:
+            print_error(f"Erro ao comparar pastas: {e}")
+            return False
+        finally:
+            if output and out:
+                out.close()
+    
+    def export_inventory(self, paths, output=None, fmt=None, workers=None, rules=None, decode=None):
+        """Exporta os metadados das árvores (ou de um inventário colunar) em JSONL/CSV/colunar"""
+        writer = out = None
+        try:
+            fmt = fmt or inventory.detect_format(output)
+            if decode:
+                if not os.path.isfile(decode):
+                    print_error(f"Inventário não encontrado: {decode}")
+                    return False
+                batches = self._batched(inventory.read_columnar(decode), inventory.BATCH_RECORDS)
+                errors = []
+            else:
+                for path in paths:
+                    if not os.path.exists(path):
+                        print_error(f"Caminho não encontrado: {path}")
+                        return False
+                batches, errors = inventory.scan(paths, workers, rules)
+            
+            if fmt == 'columnar' and not output and sys.stdout.isatty():
+                print_error("O formato colunar é binário: use -o ARQUIVO ou redirecione a saída")
+                return False
+            
+            start = time.perf_counter()
+            writer, out = inventory.open_writer(output, fmt)
+            total = 0
+            # Resumo e progresso em stderr: stdout pode conter os registros
+            with err_console.status("Inventariando...") as status:
+                for batch in batches:
+                    writer.write_batch(batch)
+                    total += len(batch)
+                    status.update(f"Inventariando... {total:,} entradas")
+            writer.close()
+            
+            elapsed = time.perf_counter() - start
+            rate = total / elapsed if elapsed > 0 else 0
+            destination = f" em {output}" if output else ""
+            err_console.print(f"✅ {total:,} entradas exportadas ({fmt}){destination} "
+                              f"em {elapsed:.2f}s ({rate:,.0f}/s)", style="green")
+            if errors:
+                err_console.print(f"⚠️  {len(errors)} entradas não puderam ser lidas", style="yellow")
+            undecodable = getattr(writer, 'undecodable', 0)
+            if undecodable:
+                err_console.print(f"⚠️  {undecodable} caminhos não são UTF-8 válido; gravados com os bytes originais",
+                                  style="yellow")
+            return True
+        
+        except BrokenPipeError:
+            return False
+        except ValueError as e:
+            print_error(str(e))
+        except PermissionError:
+            print_error("Permissão negada para gravar o inventário")
+        except Exception as e:
+            print_error(f"Erro ao gerar inventário: {e}")
+        finally:
+            if out:
+                out.close()
+        return False
+    
+    @staticmethod
+    def _batched(records, size):
+        """Agrupa um iterável de registros em listas de até size itens"""
+        batch = []
+        for record in records:
+            batch.append(record)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    
+    def _snapshot_store(self, store=None):
+        """Repositório de snapshots (padrão: [snapshot] store ou pasta de configuração)"""
+        root = store or self.config.get('snapshot', 'store', '') or os.path.join(self.config.config_dir,
+                                                                                'snapshots')
+        average = parse_size(self.config.get('snapshot', 'chunk_size', '64K'))
+        return snapshot_store.SnapshotStore(os.path.expanduser(root), average)
+    
+    def create_snapshot(self, source, store=None, workers=None, rules=None):
+        """Cria um snapshot deduplicado de uma pasta"""
+        try:
+            if not os.path.isdir(source):
+                print_error(f"Pasta não encontrada: {source}")
+                return False
+            
+            repository = self._snapshot_store(store)
+            start = time.perf_counter()
+            plan = repository.scan(source, rules)
+            if plan.parent:
+                print_info(f"Comparando com o snapshot {plan.parent['id']}: "
+                           f"{len(plan.reused)} arquivos inalterados")
+            
+            with Progress(
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                "[progress.percentage]{task.percentage:>3.0f}%",
+                TimeRemainingColumn(),
+            ) as progress:
+                task = progress.add_task("Fragmentando", total=plan.bytes_to_read)
+                manifest = repository.create(plan, workers, lambda n: progress.update(task, advance=n))
+            
+            elapsed = time.perf_counter() - start
+            stats = manifest['stats']
+            print_success(f"Snapshot {manifest['id']}: {len(manifest['files'])} arquivos, "
+                          f"{format_bytes(manifest['size'])} ({elapsed:.2f}s)")
+            print_info(f"{stats['files_read']} arquivos lidos ({format_bytes(stats['bytes_read'])}), "
+                       f"{stats['chunks_new']} blocos novos ({format_bytes(stats['bytes_new'])} gravados)")
+            if plan.errors:
+                print_warning(f"{plan.errors} entradas não puderam ser lidas")
+            return True
+        
+        except snapshot_store.SnapshotError as e:
+            print_error(str(e))
+        except ValueError as e:
+            print_error(f"Tamanho de bloco inválido: {e}")
+        except PermissionError as e:
+            print_error(f"Permissão negada: {e.filename}")
+        except Exception as e:
+            print_error(f"Erro ao criar snapshot: {e}")
+        return False
+    
+    def restore_snapshot(self, snapshot_id, destination, store=None, workers=None):
+        """Restaura um snapshot em uma pasta"""
+        try:
+            repository = self._snapshot_store(store)
+            manifest = repository.load(snapshot_id)
+            destination = Path(destination).resolve()
+            if destination.exists() and any(destination.iterdir()):
+                if not confirm_action(f"{destination} não está vazia; sobrescrever arquivos?"):
+                    print_info("Restauração cancelada")
+                    return False
+            
+            start = time.perf_counter()
+            with Progress(
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                "[progress.percentage]{task.percentage:>3.0f}%",
+                TimeRemainingColumn(),
+            ) as progress:
+                task = progress.add_task(f"Restaurando {manifest['id']}", total=manifest['size'])
+                repository.restore(manifest['id'], destination, workers,
+                                   lambda n: progress.update(task, advance=n))
+            
+            elapsed = time.perf_counter() - start
+            print_success(f"Snapshot {manifest['id']} restaurado em {destination} "
+                          f"({len(manifest['files'])} arquivos, {format_bytes(manifest['size'])}, "
+                          f"{elapsed:.2f}s)")
+            return True
+        
+        except snapshot_store.SnapshotError as e:
+            print_error(str(e))
+        except PermissionError as e:
+            print_error(f"Permissão negada: {e.filename}")
+        except Exception as e:
+            print_error(f"Erro ao restaurar snapshot: {e}")
+        return False
+    
+    def list_snapshots(self, store=None):
+        """Lista os snapshots do repositório"""
+        try:
+            repository = self._snapshot_store(store)
+            snapshots = repository.list_snapshots()
+            if not snapshots:
+                print_info(f"Nenhum snapshot em {repository.root}")
+                return True
+            
+            table = Table(title=f"Snapshots em {repository.root}", show_header=True, header_style="bold magenta")
+            table.add_column("ID", style="cyan")
+            table.add_column("Criado", style="yellow")
+            table.add_column("Origem", style="white")
+            table.add_column("Arquivos", justify="right")
+            table.add_column("Tamanho", justify="right", style="green")
+            table.add_column("Novos", justify="right", style="green")
+            
+            for manifest in snapshots:
+                table.add_row(manifest['id'], manifest['created'].replace('T', ' '), manifest['source'],
+                              f"{manifest['files']:,}", format_bytes(manifest['size']),
+                              format_bytes(manifest['stats']['bytes_new']))
+            console.print(table)
+            return True
+        
+        except snapshot_store.SnapshotError as e:
+            print_error(str(e))
+        except Exception as e:
+            print_error(f"Erro ao listar snapshots: {e}")
+        return False
+    
+    def serve_files(self, directory, host='127.0.0.1', port=8000, show_hidden=False, access_log=False):
+        """Serve uma pasta por HTTP (sendfile, Range, keep-alive)"""
+        if not os.path.isdir(directory):
+            print_error(f"Pasta não encontrada: {directory}")
+            return False
+        
+        try:
+            limit = file_server.raise_file_limit()
+            
+            def ready(addresses):
+                for address in addresses:
+                    err_console.print(f"🌐 Servindo {os.path.abspath(directory)} em "
+                                      f"http://{address[0]}:{address[1]}/ (Ctrl+C para encerrar)", style="blue")
+                if limit:
+                    err_console.print(f"ℹ️  Limite de conexões simultâneas: ~{limit:,} descritores", style="blue")
+            
+            start = time.perf_counter()
+            server = file_server.serve(directory, host, port, show_hidden, access_log, ready)
+            elapsed = time.perf_counter() - start
+            err_console.print(f"ℹ️  {server.requests:,} requisições em {server.connections:,} conexões, "
+                              f"{format_bytes(server.bytes_sent)} enviados ({elapsed:.0f}s)", style="blue")
+            return True
+        
+        except PermissionError:
+            print_error(f"Permissão negada para usar a porta {port}")
+        except OSError as e:
+            print_error(f"Não foi possível iniciar o servidor em {host}:{port}: {e.strerror}")
+        except Exception as e:
+            print_error(f"Erro no servidor de arquivos: {e}")
+        return False
+    
+    def split_file(self, source, part_size, output_dir=None, line_aligned=False, workers=None):
+        """Divide um arquivo grande em partes com manifesto de checksums"""
+        try:
+            source_path = Path(source).resolve()
+            if not source_path.is_file():
+                print_error(f"Arquivo não encontrado: {source_path}")
+                return False
+            
+            part_size = parse_size(part_size)
+            if part_size <= 0:
+                print_error("O tamanho das partes deve ser positivo")
+                return False
+            
+            output_dir = Path(output_dir).resolve() if output_dir else source_path.parent
+            algorithm = self.config.get('copy', 'verify_algorithm', 'sha256')
+            start = time.perf_counter()
+            
+            with Progress(
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                "[progress.percentage]{task.percentage:>3.0f}%",
+                TimeRemainingColumn(),
+            ) as progress:
+                task = progress.add_task(f"Dividindo {source_path.name}", total=source_path.stat().st_size)
+                manifest = split_engine.split_file(source_path, output_dir, part_size, line_aligned,
+                                                   algorithm, workers,
+                                                   lambda n: progress.update(task, advance=n))
+            
+            elapsed = time.perf_counter() - start
+            parts = len(split_engine.read_manifest(manifest)['parts'])
+            size = source_path.stat().st_size
+            rate = size / elapsed if elapsed > 0 else 0
+            print_success(f"{parts} partes gravadas em {output_dir} ({format_bytes(rate)}/s)")
+            print_info(f"Manifesto: {manifest}")
+            return True
+        
+        except ValueError as e:
+            print_error(f"Tamanho inválido: {e}")
+        except PermissionError:
+            print_error("Permissão negada para dividir o arquivo")
+        except Exception as e:
+            print_error(f"Erro ao dividir arquivo: {e}")
+        return False
+    
+    def join_file(self, manifest, output=None, workers=None):
+        """Reconstrói um arquivo a partir das partes e do manifesto"""
+        try:
+            manifest_path = Path(manifest).resolve()
+            if not manifest_path.is_file():
+                print_error(f"Manifesto não encontrado: {manifest_path}")
+                return False
+            
+            info = split_engine.read_manifest(manifest_path)
+            output_path = Path(output).resolve() if output else manifest_path.parent / info['file']
+            if output_path.is_dir():
+                output_path = output_path / info['file']
+            
+            if output_path.exists():
+                if not confirm_action(f"Arquivo '{output_path}' já existe. Sobrescrever?"):
+                    print_info("Operação cancelada")
+                    return False
+            
+            start = time.perf_counter()
+            with Progress(
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                "[progress.percentage]{task.percentage:>3.0f}%",
+                TimeRemainingColumn(),
+            ) as progress:
+                task = progress.add_task(f"Juntando {info['file']}", total=info['size'])
+                split_engine.join_file(manifest_path, output_path, workers,
+                                       lambda n: progress.update(task, advance=n))
+            
+            elapsed = time.perf_counter() - start
+            rate = info['size'] / elapsed if elapsed > 0 else 0
+            print_success(f"Arquivo reconstruído: {output_path} ({format_bytes(info['size'])}, "
+                          f"{format_bytes(rate)}/s)")
+            print_info(f"{len(info['parts'])} partes verificadas ({info['algorithm']})")
+            return True
+        
+        except split_engine.ManifestError as e:
+            print_error(str(e))
+        except PermissionError:
+            print_error("Permissão negada para reconstruir o arquivo")
         except Exception as e:
-            print_error(f"Erro ao apagar: {e}")
\ No newline at end of file
+            print_error(f"Erro ao juntar partes: {e}")
+        return False
\ No newline at end of file
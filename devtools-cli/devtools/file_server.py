@@ -0,0 +1,326 @@
+"""
+Servidor HTTP de arquivos estáticos do DevTools CLI (file serve)
+
+Um único processo asyncio atende milhares de conexões keep-alive. O corpo
+dos arquivos é enviado com loop.sendfile (os.sendfile: sem cópia para o
+espaço do usuário), inclusive em requisições Range de um único intervalo.
+As listagens de pastas são geradas de um snapshot do scandir guardado em
+cache e invalidado pelo mtime da pasta.
+"""
+import asyncio
+import html
+import mimetypes
+import os
+import stat
+import sys
+import time
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+from urllib.parse import quote, unquote_to_bytes, urlsplit
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+SERVER_NAME = 'devtools-serve'
+MAX_HEADER_SIZE = 64 * 1024
+KEEPALIVE_TIMEOUT = 15.0
+LISTING_CACHE_SIZE = 1024
+BACKLOG = 4096
+
+REASONS = {
+    200: 'OK', 206: 'Partial Content', 301: 'Moved Permanently', 304: 'Not Modified',
+    400: 'Bad Request', 403: 'Forbidden', 404: 'Not Found', 405: 'Method Not Allowed',
+    416: 'Range Not Satisfiable', 431: 'Request Header Fields Too Large', 500: 'Internal Server Error',
+}
+
+def raise_file_limit():
+    """Eleva o limite de descritores abertos ao máximo permitido; retorna o novo limite"""
+    if resource is None:
+        return None
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if hard != resource.RLIM_INFINITY and soft < hard:
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+            soft = hard
+        except (ValueError, OSError):
+            pass
+    return soft
+
+def parse_range(header, size):
+    """Interpreta um cabeçalho Range de um único intervalo
+    
+    Retorna (início, fim_inclusivo), None para ignorar o cabeçalho (200 com o
+    arquivo inteiro) ou False se o intervalo não puder ser atendido (416).
+    """
+    unit, _, spec = header.partition('=')
+    if unit.strip().lower() != 'bytes' or ',' in spec:
+        return None
+    first, dash, last = spec.strip().partition('-')
+    if not dash:
+        return None
+    try:
+        if not first:
+            suffix = int(last)
+            if suffix <= 0:
+                return False
+            return max(0, size - suffix), size - 1
+        start = int(first)
+        end = int(last) if last else size - 1
+    except ValueError:
+        return None
+    if start >= size:
+        return False
+    if start > end:
+        return None
+    return start, min(end, size - 1)
+
+def url_to_path(url_path):
+    """Caminho da URL (texto latin-1 da requisição) decodificado como nome do sistema de arquivos"""
+    return os.fsdecode(unquote_to_bytes(url_path.encode('latin-1', 'replace')))
+
+def display_name(name):
+    """Nome exibível em HTML: bytes que não são UTF-8 viram U+FFFD"""
+    return os.fsencode(name).decode('utf-8', 'replace')
+
+class FileServer:
+    """Atende GET/HEAD de arquivos e listagens abaixo de root"""
+    
+    def __init__(self, root, show_hidden=False, access_log=None):
+        self.root = os.path.realpath(root)
+        self.show_hidden = show_hidden
+        self.access_log = access_log
+        self.listings = OrderedDict()
+        self.requests = 0
+        self.bytes_sent = 0
+        self.connections = 0
+        self.active = 0
+        self._date = (0, '')
+    
+    def http_date(self):
+        """Cabeçalho Date, recalculado no máximo uma vez por segundo"""
+        now = int(time.time())
+        if self._date[0] != now:
+            self._date = (now, formatdate(now, usegmt=True))
+        return self._date[1]
+    
+    def resolve(self, target):
+        """Caminho local de uma URL, ou None se estiver fora da raiz"""
+        path = url_to_path(urlsplit(target).path)
+        if '\0' in path:
+            return None
+        parts = [part for part in path.split('/') if part not in ('', '.')]
+        if '..' in parts or (not self.show_hidden and any(part.startswith('.') for part in parts)):
+            return None
+        local = os.path.realpath(os.path.join(self.root, *parts))
+        if local != self.root and not local.startswith(self.root + os.sep):
+            return None
+        return local
+    
+    async def handle(self, reader, writer):
+        self.connections += 1
+        self.active += 1
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), KEEPALIVE_TIMEOUT)
+                except asyncio.LimitOverrunError:
+                    await self.send_error(writer, 431, close=True)
+                    break
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    break
+                if not await self.respond(head, writer):
+                    break
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self.active -= 1
+            writer.close()
+    
+    async def respond(self, head, writer):
+        """Atende uma requisição; retorna False se a conexão deve ser fechada"""
+        try:
+            request_line, *header_lines = head.decode('latin-1').split('\r\n')
+            method, target, version = request_line.split(' ')
+        except ValueError:
+            await self.send_error(writer, 400, close=True)
+            return False
+        headers = {}
+        for line in header_lines:
+            name, _, value = line.partition(':')
+            if name:
+                headers[name.strip().lower()] = value.strip()
+        
+        connection = headers.get('connection', '').lower()
+        keep_alive = ('close' not in connection if version == 'HTTP/1.1' else 'keep-alive' in connection)
+        self.requests += 1
+        
+        if 'content-length' in headers or 'transfer-encoding' in headers:
+            # Corpos não são suportados (apenas GET/HEAD)
+            keep_alive = False
+        if method not in ('GET', 'HEAD'):
+            status = await self.send_error(writer, 405, close=True, extra={'Allow': 'GET, HEAD'})
+            self.log(method, target, status, 0)
+            return False
+        
+        local = self.resolve(target)
+        try:
+            st = os.stat(local) if local else None
+        except OSError:
+            st = None
+        if st is None:
+            status, sent = await self.send_error(writer, 404, not keep_alive, method=method), 0
+        elif stat.S_ISDIR(st.st_mode):
+            status, sent = await self.send_listing(writer, target, local, st, method, keep_alive)
+        elif stat.S_ISREG(st.st_mode):
+            status, sent = await self.send_file(writer, local, st, headers, method, keep_alive)
+        else:
+            status, sent = await self.send_error(writer, 403, not keep_alive, method=method), 0
+        self.log(method, target, status, sent)
+        return keep_alive
+    
+    def log(self, method, target, status, sent):
+        if self.access_log:
+            self.access_log.write(f'{self.http_date()} "{method} {target}" {status} {sent}\n')
+    
+    def _head(self, status, length, keep_alive, extra=None):
+        lines = [f'HTTP/1.1 {status} {REASONS[status]}', f'Server: {SERVER_NAME}', f'Date: {self.http_date()}',
+                 f'Content-Length: {length}', f'Connection: {"keep-alive" if keep_alive else "close"}']
+        for name, value in (extra or {}).items():
+            lines.append(f'{name}: {value}')
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+    
+    async def send_error(self, writer, status, close=False, extra=None, method='GET'):
+        body = f'{status} {REASONS[status]}\n'.encode()
+        headers = {'Content-Type': 'text/plain; charset=utf-8', **(extra or {})}
+        writer.write(self._head(status, len(body), not close, headers) + (body if method != 'HEAD' else b''))
+        await writer.drain()
+        return status
+    
+    async def send_file(self, writer, path, st, headers, method, keep_alive):
+        size = st.st_size
+        etag = f'"{st.st_mtime_ns:x}-{size:x}"'
+        last_modified = formatdate(st.st_mtime, usegmt=True)
+        extra = {
+            'Content-Type': mimetypes.guess_type(path)[0] or 'application/octet-stream',
+            'Last-Modified': last_modified,
+            'ETag': etag,
+            'Accept-Ranges': 'bytes',
+        }
+        
+        if headers.get('if-none-match') == etag or self._not_modified_since(headers, st):
+            writer.write(self._head(304, 0, keep_alive, {'ETag': etag, 'Last-Modified': last_modified}))
+            await writer.drain()
+            return 304, 0
+        
+        status, offset, count = 200, 0, size
+        byte_range = headers.get('range')
+        # If-Range: só honra o Range se o arquivo ainda for a mesma versão
+        if byte_range and headers.get('if-range', etag) in (etag, last_modified):
+            selected = parse_range(byte_range, size)
+            if selected is False:
+                writer.write(self._head(416, 0, keep_alive, {'Content-Range': f'bytes */{size}'}))
+                await writer.drain()
+                return 416, 0
+            if selected:
+                start, end = selected
+                status, offset, count = 206, start, end - start + 1
+                extra['Content-Range'] = f'bytes {start}-{end}/{size}'
+        
+        if method == 'HEAD' or not count:
+            writer.write(self._head(status, count, keep_alive, extra))
+            await writer.drain()
+            return status, 0
+        try:
+            f = open(path, 'rb')
+        except OSError:
+            return await self.send_error(writer, 403, not keep_alive, method=method), 0
+        with f:
+            writer.write(self._head(status, count, keep_alive, extra))
+            await writer.drain()
+            sent = await asyncio.get_running_loop().sendfile(writer.transport, f, offset, count)
+        self.bytes_sent += sent
+        return status, sent
+    
+    @staticmethod
+    def _not_modified_since(headers, st):
+        value = headers.get('if-modified-since')
+        if not value or 'if-none-match' in headers:
+            return False
+        try:
+            return int(st.st_mtime) <= parsedate_to_datetime(value).timestamp()
+        except (TypeError, ValueError):
+            return False
+    
+    async def send_listing(self, writer, target, path, st, method, keep_alive):
+        url_path = urlsplit(target).path
+        if not url_path.endswith('/'):
+            writer.write(self._head(301, 0, keep_alive, {'Location': url_path + '/'}))
+            await writer.drain()
+            return 301, 0
+        index = os.path.join(path, 'index.html')
+        if os.path.isfile(index):
+            return await self.send_file(writer, index, os.stat(index), {}, method, keep_alive)
+        
+        try:
+            body = self.listing(path, st, display_name(url_to_path(url_path)))
+        except OSError:
+            return await self.send_error(writer, 403, not keep_alive, method=method), 0
+        writer.write(self._head(200, len(body), keep_alive, {'Content-Type': 'text/html; charset=utf-8'}))
+        if method == 'GET':
+            writer.write(body)
+            self.bytes_sent += len(body)
+        await writer.drain()
+        return 200, len(body) if method == 'GET' else 0
+    
+    def listing(self, path, st, url_path):
+        """HTML da listagem, reaproveitado enquanto o mtime da pasta não mudar"""
+        cached = self.listings.get(path)
+        if cached and cached[0] == st.st_mtime_ns:
+            self.listings.move_to_end(path)
+            return cached[1]
+        
+        entries = []
+        with os.scandir(path) as iterator:
+            for entry in iterator:
+                if not self.show_hidden and entry.name.startswith('.'):
+                    continue
+                try:
+                    is_dir = entry.is_dir()
+                    info = entry.stat()
+                except OSError:
+                    continue
+                entries.append((not is_dir, entry.name, is_dir, info.st_size, info.st_mtime))
+        entries.sort()
+        
+        title = html.escape(url_path)
+        rows = ['<tr><td><a href="../">../</a></td><td></td><td></td></tr>'] if url_path != '/' else []
+        for _, name, is_dir, size, mtime in entries:
+            label = name + '/' if is_dir else name
+            modified = time.strftime('%Y-%m-%d %H:%M', time.localtime(mtime))
+            rows.append(f'<tr><td><a href="{quote(os.fsencode(label))}">{html.escape(display_name(label))}</a></td>'
+                        f'<td align="right">{"-" if is_dir else size}</td><td>{modified}</td></tr>')
+        body = (f'<!DOCTYPE html>\n<html><head><meta charset="utf-8"><title>{title}</title></head>\n'
+                f'<body><h1>{title}</h1>\n<table>\n' + '\n'.join(rows) + '\n</table></body></html>\n').encode('utf-8')
+        
+        self.listings[path] = (st.st_mtime_ns, body)
+        if len(self.listings) > LISTING_CACHE_SIZE:
+            self.listings.popitem(last=False)
+        return body
+    
+    async def serve(self, host, port, ready_callback=None):
+        server = await asyncio.start_server(self.handle, host, port, limit=MAX_HEADER_SIZE, backlog=BACKLOG)
+        if ready_callback:
+            ready_callback([sock.getsockname() for sock in server.sockets])
+        async with server:
+            await server.serve_forever()
+
+def serve(root, host='127.0.0.1', port=8000, show_hidden=False, access_log=False, ready_callback=None):
+    """Executa o servidor até ser interrompido; retorna o FileServer com as estatísticas"""
+    server = FileServer(root, show_hidden, sys.stderr if access_log else None)
+    try:
+        asyncio.run(server.serve(host, port, ready_callback))
+    except KeyboardInterrupt:
+        pass
+    return server
\ No newline at end of file
@@ -0,0 +1,265 @@
+"""
+Monitoramento de arquivos do DevTools CLI (Linux inotify via ctypes)
+
+O processo fica bloqueado em poll() enquanto não há eventos, então o uso de
+CPU em repouso é praticamente zero mesmo com dezenas de milhares de
+diretórios observados. Rajadas de eventos são agrupadas em lotes depois de
+um intervalo sem atividade (debounce).
+"""
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import time
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_DONT_FOLLOW = 0x02000000
+IN_EXCL_UNLINK = 0x04000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+              IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF |
+              IN_DONT_FOLLOW | IN_EXCL_UNLINK)
+
+EVENT_HEADER = struct.Struct('iIII')
+READ_SIZE = 64 * 1024
+
+def is_supported():
+    """Indica se o inotify está disponível nesta plataforma"""
+    return os.uname().sysname == 'Linux' if hasattr(os, 'uname') else False
+
+def _event_type(mask):
+    """Traduz a máscara do inotify para o tipo de evento reportado"""
+    if mask & IN_CREATE:
+        return 'created'
+    if mask & (IN_DELETE | IN_DELETE_SELF):
+        return 'deleted'
+    if mask & IN_MOVED_FROM:
+        return 'moved_from'
+    if mask & IN_MOVED_TO:
+        return 'moved_to'
+    if mask & (IN_MODIFY | IN_CLOSE_WRITE):
+        return 'modified'
+    if mask & IN_ATTRIB:
+        return 'attrib'
+    return None
+
+def _coalesce(previous, current):
+    """Combina dois eventos do mesmo caminho dentro de um lote"""
+    if previous == 'created' and current in ('deleted', 'moved_from'):
+        return None  # Arquivo temporário: criado e removido no mesmo lote
+    if previous in ('created', 'moved_to') and current in ('modified', 'attrib'):
+        return previous
+    if previous == 'modified' and current == 'attrib':
+        return previous
+    if previous == 'deleted' and current == 'created':
+        return 'modified'
+    return current
+
+class Inotify:
+    """Interface mínima para inotify_init1/inotify_add_watch via ctypes"""
+    
+    def __init__(self):
+        libc_name = ctypes.util.find_library('c') or 'libc.so.6'
+        self.libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            self._raise_errno()
+        self.watches = {}
+    
+    def _raise_errno(self, path=None):
+        code = ctypes.get_errno()
+        raise OSError(code, os.strerror(code), path)
+    
+    def add_watch(self, path):
+        """Adiciona (ou atualiza) um watch para o diretório"""
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), WATCH_MASK | IN_ONLYDIR)
+        if wd < 0:
+            self._raise_errno(path)
+        # Um diretório já observado devolve o mesmo wd: só o caminho muda
+        self.watches[wd] = path
+        return wd
+    
+    def forget(self, wd):
+        """Descarta um watch removido pelo kernel"""
+        self.watches.pop(wd, None)
+    
+    def read_events(self):
+        """Lê os eventos disponíveis: gera (wd, máscara, cookie, nome)"""
+        while True:
+            try:
+                data = os.read(self.fd, READ_SIZE)
+            except BlockingIOError:
+                return
+            offset = 0
+            while offset < len(data):
+                wd, mask, cookie, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b'\0')
+                offset += length
+                yield wd, mask, cookie, os.fsdecode(name)
+    
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+class DirectoryWatcher:
+    """Observa árvores de diretórios e entrega lotes de eventos agrupados"""
+    
+    def __init__(self, paths, recursive=True, debounce=0.5, max_delay=5.0):
+        self.roots = [os.path.abspath(path) for path in paths]
+        self.recursive = recursive
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.inotify = Inotify()
+        self.pending = {}
+        self.pending_dirs = set()
+        self.first_event = None
+        self.last_event = None
+        self.watch_errors = []
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.inotify.close()
+    
+    @property
+    def watch_count(self):
+        return len(self.inotify.watches)
+    
+    def add_tree(self, root, report_existing=False):
+        """Adiciona watches para o diretório e, se recursivo, seus subdiretórios"""
+        stack = [root]
+        while stack:
+            directory = stack.pop()
+            try:
+                self.inotify.add_watch(directory)
+            except OSError as e:
+                if e.errno == errno.ENOSPC:
+                    self.watch_errors.append(
+                        "limite de watches atingido (aumente fs.inotify.max_user_watches)")
+                    return
+                self.watch_errors.append(f"{directory}: {e.strerror}")
+                continue
+            
+            if not self.recursive:
+                continue
+            
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                        if is_dir:
+                            stack.append(entry.path)
+                        # Entradas criadas antes do watch existir não gerariam eventos
+                        if report_existing:
+                            self._record(entry.path, 'created', is_dir)
+            except OSError:
+                continue
+    
+    def start(self):
+        """Registra os watches iniciais"""
+        for root in self.roots:
+            self.add_tree(root)
+    
+    def _record(self, path, event_type, is_dir):
+        """Acumula um evento no lote atual, combinando com eventos anteriores"""
+        now = time.monotonic()
+        if self.first_event is None:
+            self.first_event = now
+        self.last_event = now
+        
+        if path in self.pending:
+            event_type = _coalesce(self.pending[path], event_type)
+            if event_type is None:
+                del self.pending[path]
+                self.pending_dirs.discard(path)
+                return
+        self.pending[path] = event_type
+        if is_dir:
+            self.pending_dirs.add(path)
+    
+    def _process(self):
+        """Converte eventos do kernel em eventos do lote"""
+        for wd, mask, cookie, name in self.inotify.read_events():
+            if mask & IN_Q_OVERFLOW:
+                self._record('', 'overflow', False)
+                continue
+            
+            directory = self.inotify.watches.get(wd)
+            if mask & IN_IGNORED:
+                self.inotify.forget(wd)
+                continue
+            if directory is None:
+                continue
+            
+            path = os.path.join(directory, name) if name else directory
+            is_dir = bool(mask & IN_ISDIR)
+            event_type = _event_type(mask)
+            if event_type is None or (not name and mask & (IN_DELETE_SELF | IN_MOVE_SELF)
+                                      and directory not in self.roots):
+                # Remoção/movimento de subdiretórios já é reportado pelo pai
+                continue
+            
+            self._record(path, event_type, is_dir)
+            
+            # Novos diretórios passam a ser observados imediatamente; para
+            # diretórios movidos, re-adicionar atualiza os caminhos dos watches
+            if is_dir and self.recursive and mask & (IN_CREATE | IN_MOVED_TO):
+                self.add_tree(path, report_existing=bool(mask & IN_CREATE))
+    
+    def _take_batch(self):
+        """Retira o lote atual no formato de saída"""
+        batch = [{'path': path, 'type': event_type, 'is_dir': path in self.pending_dirs}
+                 for path, event_type in self.pending.items()]
+        self.pending = {}
+        self.pending_dirs = set()
+        self.first_event = None
+        self.last_event = None
+        return batch
+    
+    def _timeout(self):
+        """Tempo até o lote atual ficar pronto (None bloqueia indefinidamente)"""
+        if self.first_event is None:
+            return None
+        now = time.monotonic()
+        deadline = min(self.last_event + self.debounce, self.first_event + self.max_delay)
+        return max(0.0, deadline - now)
+    
+    def batches(self):
+        """Gera lotes de eventos até ser interrompido"""
+        poller = select.poll()
+        poller.register(self.inotify.fd, select.POLLIN)
+        
+        while True:
+            timeout = self._timeout()
+            ready = poller.poll(None if timeout is None else timeout * 1000)
+            if ready:
+                self._process()
+            elif self.pending:
+                yield self._take_batch()
+            elif self.first_event is not None:
+                # Eventos que se anularam: nada a entregar
+                self._take_batch()
+    
+    def flush(self):
+        """Retira eventos pendentes (usado ao encerrar)"""
+        self._process()
+        return self._take_batch() if self.pending else None
\ No newline at end of file
@@ -0,0 +1,165 @@
+"""
+Busca de conteúdo do DevTools CLI
+
+Cada arquivo é mapeado em memória (mmap) e pesquisado sem iterar linha a
+linha: padrões literais usam find() direto no mapeamento e os demais uma
+regex compilada em modo bytes. O número da linha só é calculado quando há
+correspondência, contando as quebras de linha desde a anterior.
+"""
+import mmap
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from functools import lru_cache
+from .utils import default_workers
+
+REGEX_METACHARACTERS = frozenset('.^$*+?{}[]\\|()')
+BINARY_SNIFF_SIZE = 8192
+BATCH_FILES = 256
+BATCH_BYTES = 64 * 1024 * 1024
+
+def is_literal(pattern):
+    """Indica se o padrão não usa nenhum recurso de expressão regular"""
+    return not any(char in REGEX_METACHARACTERS for char in pattern)
+
+@lru_cache(maxsize=16)
+def _compile(pattern, fixed, ignore_case):
+    flags = re.MULTILINE | (re.IGNORECASE if ignore_case else 0)
+    return re.compile(re.escape(pattern) if fixed else pattern, flags)
+
+def search_file(path, pattern, fixed=False, ignore_case=False, max_count=None):
+    """Busca o padrão (bytes) no arquivo
+    
+    Retorna lista de (número_da_linha, linha) ou None se o arquivo for binário.
+    """
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if not size:
+            return []
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if b'\0' in mm[:BINARY_SNIFF_SIZE]:
+                return None
+            if max_count is not None and max_count <= 0:
+                return []
+            
+            if fixed and not ignore_case:
+                def find(start):
+                    return mm.find(pattern, start)
+            else:
+                compiled = _compile(pattern, fixed, ignore_case)
+                
+                def find(start):
+                    match = compiled.search(mm, start)
+                    return match.start() if match else -1
+            
+            matches = []
+            line_number = 1
+            counted = 0
+            position = find(0)
+            
+            while 0 <= position < size:
+                line_start = mm.rfind(b'\n', 0, position) + 1
+                line_end = mm.find(b'\n', position)
+                if line_end == -1:
+                    line_end = size
+                
+                line_number += mm[counted:line_start].count(b'\n')
+                counted = line_start
+                matches.append((line_number, mm[line_start:line_end].rstrip(b'\r')))
+                
+                if max_count is not None and len(matches) >= max_count:
+                    break
+                # Cada linha é reportada uma única vez
+                position = find(line_end + 1)
+            
+            return matches
+
+def search_batch(paths, pattern, fixed=False, ignore_case=False, max_count=None):
+    """Pesquisa um lote de arquivos, retornando (caminho, linhas, erro) de cada um"""
+    results = []
+    for path in paths:
+        try:
+            results.append((path, search_file(path, pattern, fixed, ignore_case, max_count), None))
+        except (OSError, ValueError) as e:
+            results.append((path, [], e))
+    return results
+
+def walk_files(paths, rules=None):
+    """Gera (caminho, tamanho) dos arquivos regulares, descendo em diretórios"""
+    for path in paths:
+        if not os.path.isdir(path):
+            try:
+                yield path, os.stat(path).st_size
+            except OSError:
+                yield path, 0
+            continue
+        
+        stack = [(path, rules.matcher(path) if rules else None)]
+        while stack:
+            directory, matcher = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    subdirs = []
+                    for entry in entries:
+                        try:
+                            is_dir = entry.is_dir(follow_symlinks=False)
+                            if matcher and not matcher.accepts(entry.name, is_dir):
+                                continue
+                            if is_dir:
+                                subdirs.append((entry.path, matcher and matcher.child(entry.name)))
+                            elif entry.is_file(follow_symlinks=False):
+                                yield entry.path, entry.stat(follow_symlinks=False).st_size
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+            stack.extend(reversed(subdirs))
+
+def _batches(files):
+    """Agrupa arquivos em lotes limitados por quantidade e bytes"""
+    batch = []
+    batch_bytes = 0
+    for path, size in files:
+        batch.append(path)
+        batch_bytes += size
+        if len(batch) >= BATCH_FILES or batch_bytes >= BATCH_BYTES:
+            yield batch
+            batch = []
+            batch_bytes = 0
+    if batch:
+        yield batch
+
+def search(paths, pattern, fixed=False, ignore_case=False, max_count=None, workers=None, rules=None):
+    """Pesquisa o padrão nos caminhos, gerando (caminho, linhas, erro) à medida que termina
+    
+    A varredura dos diretórios acontece enquanto os lotes já enviados são
+    pesquisados em processos separados (regex não libera o GIL).
+    """
+    pattern = pattern.encode('utf-8', 'surrogateescape')
+    fixed = fixed or is_literal(pattern.decode('utf-8', 'surrogateescape'))
+    if not fixed or ignore_case:
+        # Valida a expressão antes de iniciar a varredura
+        _compile(pattern, fixed, ignore_case)
+    
+    workers = workers or default_workers()
+    batches = _batches(walk_files(paths, rules))
+    
+    if workers == 1:
+        for batch in batches:
+            yield from search_batch(batch, pattern, fixed, ignore_case, max_count)
+        return
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        for batch in batches:
+            pending.add(executor.submit(search_batch, batch, pattern, fixed, ignore_case, max_count))
+            if len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+        
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
\ No newline at end of file
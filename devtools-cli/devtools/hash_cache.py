@@ -0,0 +1,200 @@
+"""
+Cache persistente de checksums do DevTools CLI
+
+Os digests são indexados por (dispositivo, inode, algoritmo) e validados por
+tamanho e mtime_ns, de forma que recalcular uma árvore inalterada custa
+apenas um stat por arquivo.
+"""
+import os
+import sqlite3
+import time
+from pathlib import Path
+from . import checksum
+from .utils import print_warning
+
+XATTR_PREFIX = 'user.devtools.'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS hashes (
+    dev INTEGER NOT NULL,
+    ino INTEGER NOT NULL,
+    algorithm TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    digest BLOB NOT NULL,
+    last_used INTEGER NOT NULL,
+    PRIMARY KEY (dev, ino, algorithm)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS hashes_last_used ON hashes (last_used);
+"""
+
+class HashCache:
+    def __init__(self, config):
+        self.config = config
+        self.cache_dir = Path(config.config_dir) / 'cache'
+        self.cache_dir.mkdir(exist_ok=True)
+        self.db_path = self.cache_dir / 'hashes.db'
+        
+        self.max_entries = config.get_int('hash_cache', 'max_entries', 1000000)
+        self.use_xattrs = (config.get_bool('hash_cache', 'use_xattrs', False)
+                           and hasattr(os, 'getxattr'))
+        
+        self.hits = 0
+        self.misses = 0
+        self._touched = {}
+        self._dirty = False
+        
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(SCHEMA)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def lookup(self, path, st, algorithm):
+        """Retorna o digest em cache se o arquivo não mudou, senão None"""
+        row = self.conn.execute(
+            'SELECT size, mtime_ns, digest FROM hashes WHERE dev=? AND ino=? AND algorithm=?',
+            (st.st_dev, st.st_ino, algorithm)
+        ).fetchone()
+        
+        if row and row[0] == st.st_size and row[1] == st.st_mtime_ns:
+            self._touched[(st.st_dev, st.st_ino, algorithm)] = int(time.time())
+            return row[2].hex()
+        
+        if self.use_xattrs:
+            digest = self._read_xattr(path, st, algorithm)
+            if digest:
+                self.store(path, st, algorithm, digest, write_xattr=False)
+                return digest
+        
+        return None
+    
+    def store(self, path, st, algorithm, digest, write_xattr=True):
+        """Registra o digest de um arquivo no cache"""
+        self.conn.execute(
+            'INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (st.st_dev, st.st_ino, algorithm, st.st_size, st.st_mtime_ns,
+             bytes.fromhex(digest), int(time.time()))
+        )
+        self._dirty = True
+        
+        if self.use_xattrs and write_xattr:
+            self._write_xattr(path, st, algorithm, digest)
+    
+    def get_digests(self, paths, algorithm='sha256', workers=None):
+        """Obtém digests usando o cache e calculando em paralelo apenas os ausentes
+        
+        Gera tuplas (caminho, digest, erro, em_cache) na ordem de entrada.
+        """
+        results = []
+        pending = []
+        
+        for path in paths:
+            try:
+                st = os.stat(path)
+            except OSError as e:
+                results.append([path, None, e, False])
+                continue
+            
+            digest = self.lookup(path, st, algorithm)
+            if digest:
+                self.hits += 1
+                results.append([path, digest, None, True])
+            else:
+                self.misses += 1
+                entry = [path, None, None, False]
+                results.append(entry)
+                pending.append((entry, st))
+        
+        computed = checksum.hash_files([entry[0] for entry, _ in pending], (algorithm,), workers)
+        for (entry, st), (path, digests, error) in zip(pending, computed):
+            if error:
+                entry[2] = error
+                continue
+            
+            entry[1] = digests[algorithm]
+            # Só grava se o arquivo não mudou durante a leitura
+            try:
+                current = os.stat(path)
+            except OSError:
+                continue
+            if (current.st_size, current.st_mtime_ns) == (st.st_size, st.st_mtime_ns):
+                self.store(path, current, algorithm, entry[1])
+        
+        for entry in results:
+            yield tuple(entry)
+    
+    def get_digest(self, path, algorithm='sha256'):
+        """Obtém o digest de um único arquivo (levanta OSError em caso de falha)"""
+        _, digest, error, _ = next(self.get_digests([path], algorithm, workers=1))
+        if error:
+            raise error
+        return digest
+    
+    def close(self):
+        """Grava acessos pendentes, aplica a política LRU e fecha o banco"""
+        if self.conn is None:
+            return
+        
+        try:
+            if self._touched:
+                self.conn.executemany(
+                    'UPDATE hashes SET last_used=? WHERE dev=? AND ino=? AND algorithm=?',
+                    [(used, *key) for key, used in self._touched.items()]
+                )
+                self._touched.clear()
+            
+            if self._dirty:
+                self._evict()
+            
+            self.conn.commit()
+        finally:
+            self.conn.close()
+            self.conn = None
+    
+    def clear(self):
+        """Remove todas as entradas do cache"""
+        self.conn.execute('DELETE FROM hashes')
+        self.conn.commit()
+    
+    def _evict(self):
+        """Remove as entradas menos usadas recentemente acima do limite"""
+        count = self.conn.execute('SELECT COUNT(*) FROM hashes').fetchone()[0]
+        excess = count - self.max_entries
+        if excess <= 0:
+            return
+        
+        self.conn.execute(
+            'DELETE FROM hashes WHERE (dev, ino, algorithm) IN '
+            '(SELECT dev, ino, algorithm FROM hashes ORDER BY last_used LIMIT ?)',
+            (excess,)
+        )
+    
+    def _read_xattr(self, path, st, algorithm):
+        """Lê o digest gravado em atributo estendido, se ainda válido"""
+        try:
+            value = os.getxattr(path, XATTR_PREFIX + algorithm).decode('ascii')
+            mtime_ns, size, digest = value.split(':')
+        except (OSError, ValueError):
+            return None
+        
+        if int(mtime_ns) == st.st_mtime_ns and int(size) == st.st_size:
+            return digest
+        return None
+    
+    def _write_xattr(self, path, st, algorithm, digest):
+        """Grava o digest em atributo estendido (ignorado se não suportado)"""
+        value = f"{st.st_mtime_ns}:{st.st_size}:{digest}".encode('ascii')
+        try:
+            os.setxattr(path, XATTR_PREFIX + algorithm, value)
+        except PermissionError:
+            pass
+        except OSError as e:
+            # Sistema de arquivos sem suporte: desativa para o resto da execução
+            self.use_xattrs = False
+            print_warning(f"Atributos estendidos indisponíveis: {e.strerror}")
\ No newline at end of file
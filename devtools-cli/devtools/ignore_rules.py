@@ -0,0 +1,260 @@
+"""
+Regras de exclusão no estilo .gitignore do DevTools CLI
+
+Os padrões de cada arquivo de ignore (e os da linha de comando) são
+compilados em uma única expressão regular por arquivo, com as regras em
+ordem inversa: o primeiro grupo que casa é a última regra aplicável, como
+no git. As regras valem para a pasta do arquivo e são herdadas pelas
+subpastas; pastas excluídas são podadas antes de serem percorridas.
+"""
+import os
+import re
+
+IGNORE_FILES = ('.gitignore', '.devtoolsignore')
+
+def _translate(pattern):
+    """Converte um padrão glob do .gitignore em regex (sem âncoras)"""
+    i, n = 0, len(pattern)
+    out = []
+    while i < n:
+        char = pattern[i]
+        if char == '*':
+            if pattern.startswith('**', i) and (i == 0 or pattern[i - 1] == '/'):
+                if pattern[i + 2:i + 3] == '/':
+                    # '**/' casa zero ou mais pastas
+                    out.append('(?:.*/)?')
+                    i += 3
+                    continue
+                if i + 2 == n:
+                    # '/**' final casa tudo dentro da pasta
+                    out.append('.*')
+                    i += 2
+                    continue
+            while pattern.startswith('*', i):
+                i += 1
+            out.append('[^/]*')
+            continue
+        if char == '?':
+            out.append('[^/]')
+        elif char == '[':
+            j = i + 1
+            if j < n and pattern[j] in '!^':
+                j += 1
+            if j < n and pattern[j] == ']':
+                j += 1
+            while j < n and pattern[j] != ']':
+                j += 1
+            if j >= n:
+                out.append('\\[')
+            else:
+                body = pattern[i + 1:j].replace('\\', '\\\\')
+                if body[0] in '!^':
+                    body = '^' + body[1:]
+                out.append(f'[{body}]')
+                i = j + 1
+                continue
+        elif char == '\\' and i + 1 < n:
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+            continue
+        else:
+            out.append(re.escape(char))
+        i += 1
+    return ''.join(out)
+
+def parse_pattern(line):
+    """Interpreta uma linha de .gitignore: retorna (regex, negada, só_pastas) ou None"""
+    line = line.rstrip('\r\n')
+    if not line or line.startswith('#'):
+        return None
+    
+    # Espaços finais são ignorados, a menos que escapados
+    stripped = line.rstrip(' ')
+    if stripped.endswith('\\') and len(stripped) < len(line):
+        stripped += ' '
+    line = stripped
+    
+    negated = line.startswith('!')
+    if negated:
+        line = line[1:]
+    elif line.startswith(('\\!', '\\#')):
+        line = line[1:]
+    
+    dir_only = line.endswith('/')
+    line = line.rstrip('/')
+    if not line:
+        return None
+    
+    # Padrões com barra no início ou no meio são relativos à pasta do arquivo
+    anchored = '/' in line
+    regex = _translate(line.lstrip('/'))
+    if not anchored:
+        regex = '(?:.*/)?' + regex
+    return regex, negated, dir_only
+
+class RuleSet:
+    """Regras de um arquivo de ignore, relativas à pasta onde ele está"""
+    
+    def __init__(self, patterns, base=''):
+        self.base = base
+        rules = [rule for rule in map(parse_pattern, patterns) if rule]
+        self.empty = not rules
+        self.dir_regex, self.dir_negated = self._combine(rules)
+        self.file_regex, self.file_negated = self._combine([r for r in rules if not r[2]])
+    
+    @staticmethod
+    def _combine(rules):
+        if not rules:
+            return None, ()
+        rules = rules[::-1]
+        regex = re.compile('|'.join(f'({pattern})' for pattern, _, _ in rules), re.DOTALL)
+        return regex, tuple(negated for _, negated, _ in rules)
+    
+    @classmethod
+    def from_file(cls, path, base=''):
+        try:
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                return cls(f.read().splitlines(), base)
+        except OSError:
+            return None
+    
+    def match(self, relpath, is_dir):
+        """True se excluído, False se re-incluído (!), None se nenhuma regra casa"""
+        if self.base:
+            relpath = relpath[len(self.base) + 1:]
+        regex, negated = ((self.dir_regex, self.dir_negated) if is_dir
+                          else (self.file_regex, self.file_negated))
+        if regex is None:
+            return None
+        found = regex.fullmatch(relpath)
+        if found is None:
+            return None
+        return not negated[found.lastindex - 1]
+
+class DirectoryMatcher:
+    """Regras efetivas dentro de uma pasta (herdadas das pastas acima)"""
+    
+    __slots__ = ('rules', 'path', 'relpath', 'rulesets')
+    
+    def __init__(self, rules, path, relpath, rulesets):
+        self.rules = rules
+        self.path = path
+        self.relpath = relpath
+        self.rulesets = rulesets
+        if rules.respect_gitignore:
+            for name in IGNORE_FILES:
+                ruleset = RuleSet.from_file(os.path.join(path, name), relpath)
+                if ruleset and not ruleset.empty:
+                    self.rulesets = self.rulesets + (ruleset,)
+    
+    def child(self, name):
+        """Matcher de uma subpasta"""
+        relpath = f"{self.relpath}/{name}" if self.relpath else name
+        return DirectoryMatcher(self.rules, os.path.join(self.path, name), relpath, self.rulesets)
+    
+    def is_excluded(self, name, is_dir):
+        """Indica se a entrada (e, se pasta, tudo abaixo dela) deve ser ignorada"""
+        if is_dir and name == '.git' and self.rules.respect_gitignore:
+            return True
+        relpath = f"{self.relpath}/{name}" if self.relpath else name
+        if self.rules.exclude is not None:
+            result = self.rules.exclude.match(relpath, is_dir)
+            if result is not None:
+                return result
+        # Arquivos mais profundos têm precedência sobre os das pastas acima
+        for ruleset in reversed(self.rulesets):
+            result = ruleset.match(relpath, is_dir)
+            if result is not None:
+                return result
+        return False
+    
+    def is_included(self, name):
+        """Indica se um arquivo passa pelos padrões --include"""
+        if self.rules.include is None:
+            return True
+        relpath = f"{self.relpath}/{name}" if self.relpath else name
+        return bool(self.rules.include.match(relpath, False))
+    
+    def accepts(self, name, is_dir):
+        """Entrada visível: não excluída e, se arquivo, incluída"""
+        if self.is_excluded(name, is_dir):
+            return False
+        return is_dir or self.is_included(name)
+
+class IgnoreRules:
+    """Filtros de caminhos compartilhados pelos comandos que percorrem árvores"""
+    
+    def __init__(self, exclude=None, include=None, respect_gitignore=False):
+        self.exclude = RuleSet(exclude) if exclude else None
+        self.include = RuleSet(include) if include else None
+        self.respect_gitignore = respect_gitignore
+    
+    @classmethod
+    def from_options(cls, exclude=None, include=None, respect_gitignore=False):
+        """Cria as regras, ou None quando nenhum filtro foi pedido"""
+        if not exclude and not include and not respect_gitignore:
+            return None
+        return cls(exclude, include, respect_gitignore)
+    
+    def excludes(self, path, root):
+        """Indica se um caminho abaixo de root é filtrado, considerando as pastas no caminho"""
+        relpath = os.path.relpath(path, root)
+        if relpath == os.curdir or relpath.startswith(os.pardir):
+            return False
+        
+        *parents, name = relpath.split(os.sep)
+        matcher = self.matcher(root)
+        for parent in parents:
+            if matcher.is_excluded(parent, True):
+                return True
+            matcher = matcher.child(parent)
+        return not matcher.accepts(name, os.path.isdir(path) and not os.path.islink(path))
+    
+    def matcher(self, root):
+        """Matcher da pasta raiz de uma varredura"""
+        return DirectoryMatcher(self, os.fspath(root), '', ())
+    
+    def walk(self, top):
+        """Como os.walk(top), sem entradas filtradas e sem descer em pastas excluídas
+        
+        Assim como no os.walk, a lista de pastas pode ser alterada pelo chamador.
+        """
+        stack = [(os.fspath(top), self.matcher(top))]
+        while stack:
+            directory, matcher = stack.pop()
+            dirs = []
+            files = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            is_dir = entry.is_dir(follow_symlinks=False)
+                        except OSError:
+                            is_dir = False
+                        if matcher.accepts(entry.name, is_dir):
+                            (dirs if is_dir else files).append(entry.name)
+            except OSError:
+                continue
+            
+            yield directory, dirs, files
+            for name in reversed(dirs):
+                stack.append((os.path.join(directory, name), matcher.child(name)))
+    
+    def copytree_ignore(self, root):
+        """Função ignore para shutil.copytree aplicando as regras"""
+        matchers = {os.path.normpath(os.fspath(root)): self.matcher(root)}
+        
+        def ignore(directory, names):
+            matcher = matchers.pop(os.path.normpath(directory), None)
+            if matcher is None:
+                return set()
+            ignored = set()
+            for name in names:
+                is_dir = os.path.isdir(os.path.join(directory, name))
+                if not matcher.accepts(name, is_dir):
+                    ignored.add(name)
+                elif is_dir:
+                    matchers[os.path.normpath(os.path.join(directory, name))] = matcher.child(name)
+            return ignored
+        
+        return ignore
\ No newline at end of file
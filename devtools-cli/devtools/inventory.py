@@ -0,0 +1,353 @@
+"""
+Inventário de metadados de árvores de arquivos (file inventory)
+
+Workers em threads listam diretórios com scandir e enviam os registros em
+lotes por uma fila limitada até o escritor, que grava JSON lines, CSV ou um
+formato colunar binário compacto. A memória fica constante: só os lotes em
+trânsito e a fronteira de diretórios pendentes (percorrida em profundidade,
+proporcional à profundidade da árvore) ficam em memória.
+
+Formato colunar (.dti): MAGIC, cabeçalho JSON com os campos e codificações,
+e blocos de até BLOCK_RECORDS registros. Em cada bloco cada coluna é
+comprimida com zlib separadamente: inteiros/reais em arrays little-endian,
+caminhos como (prefixo comum com o anterior, sufixo) e textos repetidos
+(tipo, dono) como dicionário + códigos.
+"""
+import csv
+import json
+import os
+import queue
+import stat
+import struct
+import sys
+import threading
+import zlib
+from array import array
+from functools import lru_cache
+from .utils import default_workers
+
+try:
+    import pwd
+except ImportError:
+    pwd = None
+
+FIELDS = ('path', 'type', 'size', 'mtime', 'mode', 'uid', 'gid', 'owner', 'inode', 'nlink')
+FORMATS = ('jsonl', 'csv', 'columnar')
+FORMAT_EXTENSIONS = {'.jsonl': 'jsonl', '.json': 'jsonl', '.csv': 'csv', '.dti': 'columnar'}
+
+BATCH_RECORDS = 1024
+QUEUE_BATCHES = 64
+BLOCK_RECORDS = 65536
+
+COLUMNAR_MAGIC = b'DTINV\x01'
+COLUMNAR_ENCODINGS = {
+    'path': 'prefix', 'type': 'dict', 'size': 'q', 'mtime': 'd', 'mode': 'I',
+    'uid': 'I', 'gid': 'I', 'owner': 'dict', 'inode': 'Q', 'nlink': 'Q',
+}
+
+def detect_format(output):
+    """Formato pela extensão do arquivo de saída (JSON lines por padrão)"""
+    if output:
+        return FORMAT_EXTENSIONS.get(os.path.splitext(output)[1].lower(), 'jsonl')
+    return 'jsonl'
+
+@lru_cache(maxsize=4096)
+def owner_name(uid):
+    if pwd is None:
+        return str(uid)
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        return str(uid)
+
+def _entry_type(mode):
+    if stat.S_ISREG(mode):
+        return 'file'
+    if stat.S_ISDIR(mode):
+        return 'dir'
+    if stat.S_ISLNK(mode):
+        return 'link'
+    return 'other'
+
+def make_record(path, st):
+    """Registro (tupla na ordem de FIELDS) a partir de um lstat"""
+    return (path, _entry_type(st.st_mode), st.st_size, st.st_mtime, stat.S_IMODE(st.st_mode),
+            st.st_uid, st.st_gid, owner_name(st.st_uid), st.st_ino, st.st_nlink)
+
+def scan(paths, workers=None, rules=None):
+    """Gera lotes de registros das árvores, listando diretórios em paralelo
+    
+    Retorna (gerador_de_lotes, erros); erros é preenchida durante a varredura.
+    """
+    directories = queue.LifoQueue()
+    batches = queue.Queue(maxsize=QUEUE_BATCHES)
+    errors = []
+    workers = workers or default_workers()
+    roots = []
+    
+    for path in paths:
+        try:
+            st = os.lstat(path)
+        except OSError as e:
+            errors.append(e)
+            continue
+        roots.append(make_record(path, st))
+        if stat.S_ISDIR(st.st_mode):
+            directories.put((path, rules.matcher(path) if rules else None))
+    
+    def work():
+        while True:
+            item = directories.get()
+            if item is None:
+                return
+            directory, matcher = item
+            batch = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            st = entry.stat(follow_symlinks=False)
+                        except OSError as e:
+                            errors.append(e)
+                            continue
+                        is_dir = stat.S_ISDIR(st.st_mode)
+                        if matcher and not matcher.accepts(entry.name, is_dir):
+                            continue
+                        if is_dir:
+                            directories.put((entry.path, matcher and matcher.child(entry.name)))
+                        batch.append(make_record(entry.path, st))
+                        if len(batch) >= BATCH_RECORDS:
+                            batches.put(batch)
+                            batch = []
+            except OSError as e:
+                errors.append(e)
+            if batch:
+                batches.put(batch)
+            directories.task_done()
+    
+    def close():
+        # Todos os diretórios processados (inclusive os descobertos no caminho)
+        directories.join()
+        for _ in threads:
+            directories.put(None)
+        batches.put(None)
+    
+    threads = [threading.Thread(target=work, daemon=True) for _ in range(workers)]
+    
+    def generate():
+        if roots:
+            yield roots
+        for thread in threads:
+            thread.start()
+        threading.Thread(target=close, daemon=True).start()
+        while True:
+            batch = batches.get()
+            if batch is None:
+                break
+            yield batch
+        for thread in threads:
+            thread.join()
+    
+    return generate(), errors
+
+def _undecodable(records):
+    """Quantos caminhos do lote não são UTF-8 válido (nomes com bytes arbitrários)"""
+    count = 0
+    for record in records:
+        path = record[0]
+        if not path.isascii():
+            try:
+                path.encode('utf-8')
+            except UnicodeEncodeError:
+                count += 1
+    return count
+
+class JsonlWriter:
+    """Um objeto JSON por linha
+    
+    Caminhos que não são UTF-8 saem com os bytes originais (surrogateescape).
+    """
+    
+    binary = False
+    
+    def __init__(self, out):
+        self.out = out
+        self.undecodable = 0
+    
+    def write_batch(self, records):
+        self.undecodable += _undecodable(records)
+        self.out.write(''.join(json.dumps(dict(zip(FIELDS, record)), ensure_ascii=False) + '\n'
+                               for record in records))
+    
+    def close(self):
+        self.out.flush()
+
+class CsvWriter:
+    """CSV com cabeçalho"""
+    
+    binary = False
+    
+    def __init__(self, out):
+        self.out = out
+        self.undecodable = 0
+        self.writer = csv.writer(out)
+        self.writer.writerow(FIELDS)
+    
+    def write_batch(self, records):
+        self.undecodable += _undecodable(records)
+        self.writer.writerows(records)
+    
+    def close(self):
+        self.out.flush()
+
+def _varint(value, out):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+def _read_varint(data, position):
+    value = 0
+    shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+def _encode_column(encoding, values):
+    if encoding == 'prefix':
+        out = bytearray()
+        previous = b''
+        for value in values:
+            current = os.fsencode(value)
+            shared = 0
+            limit = min(len(previous), len(current))
+            while shared < limit and previous[shared] == current[shared]:
+                shared += 1
+            _varint(shared, out)
+            _varint(len(current) - shared, out)
+            out += current[shared:]
+            previous = current
+        return bytes(out)
+    if encoding == 'dict':
+        codes = {}
+        indexes = array('I', (codes.setdefault(value, len(codes)) for value in values))
+        return _pack_dictionary(list(codes), indexes)
+    column = array(encoding, values)
+    if sys.byteorder == 'big':
+        column.byteswap()
+    return column.tobytes()
+
+def _pack_dictionary(words, indexes):
+    header = json.dumps(words, ensure_ascii=False).encode('utf-8')
+    if sys.byteorder == 'big':
+        indexes.byteswap()
+    return struct.pack('<I', len(header)) + header + indexes.tobytes()
+
+def _decode_column(encoding, data, count):
+    if encoding == 'prefix':
+        values = []
+        previous = b''
+        position = 0
+        for _ in range(count):
+            shared, position = _read_varint(data, position)
+            length, position = _read_varint(data, position)
+            current = previous[:shared] + data[position:position + length]
+            position += length
+            values.append(os.fsdecode(current))
+            previous = current
+        return values
+    if encoding == 'dict':
+        (header_length,) = struct.unpack_from('<I', data)
+        words = json.loads(data[4:4 + header_length].decode('utf-8'))
+        indexes = array('I')
+        indexes.frombytes(data[4 + header_length:])
+        if sys.byteorder == 'big':
+            indexes.byteswap()
+        return [words[index] for index in indexes]
+    column = array(encoding)
+    column.frombytes(data)
+    if sys.byteorder == 'big':
+        column.byteswap()
+    return column.tolist()
+
+class ColumnarWriter:
+    """Formato colunar binário com blocos comprimidos por coluna"""
+    
+    binary = True
+    
+    def __init__(self, out, block_records=BLOCK_RECORDS):
+        self.out = out
+        self.block_records = block_records
+        self.pending = []
+        header = json.dumps({'fields': FIELDS,
+                             'encodings': [COLUMNAR_ENCODINGS[field] for field in FIELDS]}).encode('utf-8')
+        out.write(COLUMNAR_MAGIC + struct.pack('<I', len(header)) + header)
+    
+    def write_batch(self, records):
+        self.pending.extend(records)
+        if len(self.pending) >= self.block_records:
+            self._flush_block()
+    
+    def _flush_block(self):
+        if not self.pending:
+            return
+        records, self.pending = self.pending, []
+        parts = [struct.pack('<I', len(records))]
+        for index, field in enumerate(FIELDS):
+            data = _encode_column(COLUMNAR_ENCODINGS[field], [record[index] for record in records])
+            compressed = zlib.compress(data, 1)
+            parts.append(struct.pack('<I', len(compressed)))
+            parts.append(compressed)
+        self.out.write(b''.join(parts))
+    
+    def close(self):
+        self._flush_block()
+        self.out.flush()
+
+WRITERS = {'jsonl': JsonlWriter, 'csv': CsvWriter, 'columnar': ColumnarWriter}
+
+def _read_exact(f, size):
+    data = f.read(size)
+    if len(data) != size:
+        raise ValueError("Inventário colunar truncado")
+    return data
+
+def read_columnar(path):
+    """Gera os registros (tuplas na ordem de FIELDS) de um inventário colunar"""
+    with open(path, 'rb') as f:
+        if f.read(len(COLUMNAR_MAGIC)) != COLUMNAR_MAGIC:
+            raise ValueError(f"Não é um inventário colunar: {path}")
+        (header_length,) = struct.unpack('<I', _read_exact(f, 4))
+        header = json.loads(_read_exact(f, header_length).decode('utf-8'))
+        encodings = header['encodings']
+        
+        while True:
+            prefix = f.read(4)
+            if not prefix:
+                return
+            if len(prefix) != 4:
+                raise ValueError("Inventário colunar truncado")
+            (count,) = struct.unpack('<I', prefix)
+            columns = []
+            for encoding in encodings:
+                (length,) = struct.unpack('<I', _read_exact(f, 4))
+                data = zlib.decompress(_read_exact(f, length))
+                columns.append(_decode_column(encoding, data, count))
+            yield from zip(*columns)
+
+def open_writer(output, fmt):
+    """Abre o escritor do formato; retorna (writer, arquivo_a_fechar_ou_None)"""
+    writer_class = WRITERS[fmt]
+    if output:
+        if writer_class.binary:
+            f = open(output, 'wb', buffering=1024 * 1024)
+        else:
+            f = open(output, 'w', encoding='utf-8', errors='surrogateescape', newline='', buffering=1024 * 1024)
+        return writer_class(f), f
+    if not writer_class.binary and hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(errors='surrogateescape')
+    return writer_class(sys.stdout.buffer if writer_class.binary else sys.stdout), None
\ No newline at end of file
@@ -10,6 +10,7 @@ from rich.table import Table
 from .utils import create_banner, print_error, print_success, print_info
 from .config import Config
 from .file_manager import FileManager
+from . import checksum, ignore_rules, inventory, top_files, unit_registry
 from .unit_converter import UnitConverter
 from .video_downloader import VideoDownloader
 from .password_generator import PasswordGenerator
@@ -52,41 +53,254 @@ Exemplos de uso:
         file_parser = subparsers.add_parser('file', help='Gerenciador de arquivos')
         file_subparsers = file_parser.add_subparsers(dest='file_action')
         
+        # Filtros compartilhados pelos comandos que percorrem árvores
+        filter_parser = argparse.ArgumentParser(add_help=False)
+        filter_parser.add_argument('--exclude', action='append', metavar='PADRÃO',
+                                   help='Ignorar caminhos (sintaxe do .gitignore; pode repetir)')
+        filter_parser.add_argument('--include', action='append', metavar='PADRÃO',
+                                   help='Apenas arquivos que casam (sintaxe do .gitignore; pode repetir)')
+        filter_parser.add_argument('--respect-gitignore', action='store_true',
+                                   help='Respeitar .gitignore/.devtoolsignore das pastas percorridas')
+        
+        # Limites de I/O compartilhados (padrões na seção [throttle] do config)
+        io_limit_parser = argparse.ArgumentParser(add_help=False)
+        io_limit_parser.add_argument('--iops-limit', type=float, metavar='N',
+                                     help='Máximo de operações de I/O por segundo')
+        io_limit_parser.add_argument('--idle-io', action='store_true',
+                                     help='Prioridade de I/O ociosa (como ionice -c3)')
+        
         # file list
-        list_parser = file_subparsers.add_parser('list', help='Listar arquivos e pastas')
+        list_parser = file_subparsers.add_parser('list', help='Listar arquivos e pastas',
+                                                 parents=[filter_parser])
         list_parser.add_argument('path', nargs='?', default='.', help='Caminho para listar')
         list_parser.add_argument('-a', '--all', action='store_true', help='Mostrar arquivos ocultos')
         list_parser.add_argument('-l', '--long', action='store_true', help='Formato detalhado')
         
         # file copy
-        copy_parser = file_subparsers.add_parser('copy', help='Copiar arquivos/pastas')
+        copy_parser = file_subparsers.add_parser('copy', help='Copiar arquivos/pastas',
+                                                 parents=[filter_parser, io_limit_parser])
         copy_parser.add_argument('source', help='Arquivo/pasta origem')
         copy_parser.add_argument('destination', help='Destino')
         copy_parser.add_argument('-r', '--recursive', action='store_true', help='Cópia recursiva')
+        copy_parser.add_argument('--resume', action='store_true',
+                                 help='Cópia retomável com journal de blocos (arquivos grandes)')
+        copy_parser.add_argument('--verify', action='store_true',
+                                 help='Calcular checksums durante a cópia e confirmar o destino')
+        copy_parser.add_argument('--manifest', help='Gravar manifesto dos checksums (implica --verify)')
+        copy_parser.add_argument('--bwlimit', metavar='TAXA', help='Máximo de bytes por segundo (ex: 50M)')
         
         # file move
-        move_parser = file_subparsers.add_parser('move', help='Mover arquivos/pastas')
+        move_parser = file_subparsers.add_parser('move', help='Mover arquivos/pastas',
+                                                 parents=[io_limit_parser])
         move_parser.add_argument('source', help='Arquivo/pasta origem')
         move_parser.add_argument('destination', help='Destino')
+        move_parser.add_argument('--bwlimit', metavar='TAXA',
+                                 help='Máximo de bytes por segundo entre dispositivos (ex: 50M)')
         
         # file rename
-        rename_parser = file_subparsers.add_parser('rename', help='Renomear arquivo/pasta')
-        rename_parser.add_argument('old_name', help='Nome atual')
-        rename_parser.add_argument('new_name', help='Novo nome')
+        rename_parser = file_subparsers.add_parser('rename', help='Renomear arquivo/pasta',
+                                                   parents=[filter_parser])
+        rename_parser.add_argument('names', nargs='*', metavar='nome',
+                                   help='Nome atual e novo nome (ou pastas/arquivos com --pattern)')
+        rename_parser.add_argument('--pattern', help='Regex aplicada ao nome (renomeação em massa)')
+        rename_parser.add_argument('--template', help='Substituição, aceita \\1 e \\g<nome>')
+        rename_parser.add_argument('-r', '--recursive', action='store_true', help='Incluir subpastas')
+        rename_parser.add_argument('-n', '--dry-run', action='store_true', help='Apenas mostrar o plano')
+        rename_parser.add_argument('-f', '--force', action='store_true', help='Não pedir confirmação')
         
         # file delete
-        delete_parser = file_subparsers.add_parser('delete', help='Apagar arquivos/pastas')
-        delete_parser.add_argument('paths', nargs='+', help='Caminhos para apagar')
+        delete_parser = file_subparsers.add_parser('delete', help='Apagar arquivos/pastas',
+                                                   parents=[filter_parser, io_limit_parser])
+        delete_parser.add_argument('paths', nargs='+', help='Caminhos ou padrões glob (ex: "build/**/*.o")')
         delete_parser.add_argument('-f', '--force', action='store_true', help='Forçar exclusão')
         delete_parser.add_argument('-r', '--recursive', action='store_true', help='Exclusão recursiva')
+        delete_parser.add_argument('--trash', action='store_true', help='Mover para a lixeira em vez de apagar')
+        delete_parser.add_argument('--regex', help='Apagar entradas cujo caminho relativo às pastas casa com a regex')
+        delete_parser.add_argument('-j', '--workers', type=int, help='Número de workers paralelos')
+        
+        # file purge
+        purge_parser = file_subparsers.add_parser('purge', help='Esvaziar a lixeira',
+                                                  parents=[io_limit_parser])
+        purge_parser.add_argument('--older-than', type=float, metavar='DIAS',
+                                  help='Apenas itens apagados há mais de N dias')
+        purge_parser.add_argument('-f', '--force', action='store_true', help='Não pedir confirmação')
+        purge_parser.add_argument('--background', action='store_true', help='Executar em segundo plano')
+        purge_parser.add_argument('-j', '--workers', type=int, help='Número de workers paralelos')
+        purge_parser.add_argument('--ops-limit', type=float, dest='iops_limit', help=argparse.SUPPRESS)
+        
+        # file restore
+        restore_parser = file_subparsers.add_parser('restore', help='Restaurar item da lixeira')
+        restore_parser.add_argument('item', nargs='?', help='ID ou caminho original (vazio lista a lixeira)')
+        restore_parser.add_argument('--to', dest='destination', help='Restaurar em outro caminho')
+        
+        # file hash
+        hash_parser = file_subparsers.add_parser('hash', help='Calcular checksums de arquivos',
+                                                 parents=[filter_parser])
+        hash_parser.add_argument('paths', nargs='+', help='Arquivos/pastas')
+        hash_parser.add_argument('-a', '--algorithm', action='append', choices=checksum.SUPPORTED_ALGORITHMS,
+                                 dest='algorithms', help='Algoritmo (pode repetir; padrão: sha256)')
+        hash_parser.add_argument('-o', '--output', help='Gravar manifesto no arquivo')
+        hash_parser.add_argument('-r', '--recursive', action='store_true', help='Incluir pastas recursivamente')
+        hash_parser.add_argument('-j', '--workers', type=int, help='Número de workers paralelos')
+        
+        # file checksum
+        checksum_parser = file_subparsers.add_parser('checksum', help='Checksums com cache persistente',
+                                                     parents=[filter_parser])
+        checksum_parser.add_argument('paths', nargs='+', help='Arquivos/pastas')
+        checksum_parser.add_argument('-a', '--algorithm', default='sha256', choices=checksum.SUPPORTED_ALGORITHMS,
+                                     help='Algoritmo (padrão: sha256)')
+        checksum_parser.add_argument('-r', '--recursive', action='store_true', help='Incluir pastas recursivamente')
+        checksum_parser.add_argument('-j', '--workers', type=int, help='Número de workers paralelos')
+        checksum_parser.add_argument('--no-cache', action='store_true', help='Ignorar o cache de checksums')
+        
+        # file verify
+        verify_parser = file_subparsers.add_parser('verify', help='Verificar manifesto de checksums')
+        verify_parser.add_argument('manifest', help='Arquivo de manifesto')
+        verify_parser.add_argument('-j', '--workers', type=int, help='Número de workers paralelos')
+        
+        # file archive
+        archive_parser = file_subparsers.add_parser('archive', help='Criar/extrair arquivos .tar.gz')
+        archive_subparsers = archive_parser.add_subparsers(dest='archive_action')
+        
+        archive_create_parser = archive_subparsers.add_parser('create', help='Criar arquivo .tar.gz')
+        archive_create_parser.add_argument('output', help='Arquivo de saída (.tar.gz)')
+        archive_create_parser.add_argument('sources', nargs='+', help='Arquivos/pastas a incluir')
+        archive_create_parser.add_argument('-l', '--level', type=int, default=6, choices=range(1, 10),
+                                           metavar='1-9', help='Nível de compressão (padrão: 6)')
+        archive_create_parser.add_argument('-j', '--workers', type=int, help='Número de workers paralelos')
+        
+        archive_extract_parser = archive_subparsers.add_parser('extract', help='Extrair arquivo .tar/.tar.gz')
+        archive_extract_parser.add_argument('archive', help='Arquivo a extrair')
+        archive_extract_parser.add_argument('destination', nargs='?', default='.', help='Pasta de destino')
+        archive_extract_parser.add_argument('-j', '--workers', type=int, help='Número de workers de escrita')
+        
+        # file grep
+        grep_parser = file_subparsers.add_parser('grep', help='Pesquisar conteúdo em arquivos',
+                                                 parents=[filter_parser])
+        grep_parser.add_argument('pattern', help='Texto ou expressão regular')
+        grep_parser.add_argument('paths', nargs='+', help='Arquivos/pastas (pastas são percorridas)')
+        grep_parser.add_argument('-i', '--ignore-case', action='store_true', help='Ignorar maiúsculas/minúsculas')
+        grep_parser.add_argument('-F', '--fixed-strings', action='store_true', help='Tratar o padrão como texto literal')
+        grep_parser.add_argument('-l', '--files-with-matches', action='store_true',
+                                 help='Listar apenas os arquivos com correspondências')
+        grep_parser.add_argument('-m', '--max-count', type=int, help='Máximo de linhas por arquivo')
+        grep_parser.add_argument('-j', '--workers', type=int, help='Número de processos paralelos')
+        
+        # file stats
+        stats_parser = file_subparsers.add_parser('stats', help='Contar linhas, palavras e bytes (estilo wc)',
+                                                  parents=[filter_parser])
+        stats_parser.add_argument('paths', nargs='+', help='Arquivos/pastas')
+        stats_parser.add_argument('-r', '--recursive', action='store_true', help='Incluir pastas recursivamente')
+        stats_parser.add_argument('--json', action='store_true', help='Saída em JSON')
+        stats_parser.add_argument('--histogram', action='store_true', help='Mostrar histograma do comprimento das linhas')
+        stats_parser.add_argument('-j', '--workers', type=int, help='Número de processos paralelos')
+        
+        # file top
+        top_parser = file_subparsers.add_parser('top', help='Maiores, mais antigos ou mais recentes arquivos',
+                                                parents=[filter_parser])
+        top_parser.add_argument('paths', nargs='*', default=['.'], help='Pastas (padrão: atual)')
+        top_parser.add_argument('-n', '--count', type=int, default=50, help='Quantidade de arquivos (padrão: 50)')
+        top_parser.add_argument('--by', choices=top_files.SORT_KEYS, default='size',
+                                help='Critério: size, mtime ou atime (padrão: size)')
+        top_parser.add_argument('--oldest', action='store_true', help='Menores valores primeiro (ex: mais antigos)')
+        top_parser.add_argument('--interval', type=float, default=5.0,
+                                help='Segundos entre resultados parciais (padrão: 5)')
+        
+        # file diff-dir
+        diff_parser = file_subparsers.add_parser('diff-dir', help='Comparar duas pastas (JSON lines)',
+                                                 parents=[filter_parser])
+        diff_parser.add_argument('left', help='Pasta de referência (A)')
+        diff_parser.add_argument('right', help='Pasta comparada (B)')
+        diff_parser.add_argument('--full', action='store_true',
+                                 help='Confirmar arquivos de mesmo tamanho com hash completo')
+        diff_parser.add_argument('--same', action='store_true', help='Incluir entradas iguais na saída')
+        diff_parser.add_argument('-o', '--output', help='Gravar os registros no arquivo')
+        diff_parser.add_argument('-j', '--workers', type=int, help='Número de workers de hash')
+        
+        # file inventory
+        inventory_parser = file_subparsers.add_parser('inventory', help='Exportar metadados de árvores (JSONL/CSV/colunar)',
+                                                      parents=[filter_parser])
+        inventory_parser.add_argument('paths', nargs='*', default=['.'], help='Pastas (padrão: atual)')
+        inventory_parser.add_argument('-o', '--output', help='Arquivo de saída (padrão: stdout)')
+        inventory_parser.add_argument('-f', '--format', choices=inventory.FORMATS,
+                                      help='Formato (padrão: pela extensão; .dti = colunar, senão jsonl)')
+        inventory_parser.add_argument('-j', '--workers', type=int, help='Número de workers de varredura')
+        inventory_parser.add_argument('--decode', metavar='ARQUIVO',
+                                      help='Converter um inventário colunar (.dti) em vez de varrer pastas')
+        
+        # file snapshot
+        snapshot_parser = file_subparsers.add_parser('snapshot', help='Snapshots deduplicados de pastas')
+        snapshot_subparsers = snapshot_parser.add_subparsers(dest='snapshot_action')
+        
+        snapshot_create_parser = snapshot_subparsers.add_parser('create', help='Criar snapshot de uma pasta',
+                                                                parents=[filter_parser])
+        snapshot_create_parser.add_argument('source', help='Pasta de origem')
+        snapshot_create_parser.add_argument('--store', help='Repositório (padrão: [snapshot] store)')
+        snapshot_create_parser.add_argument('-j', '--workers', type=int, help='Número de workers paralelos')
+        
+        snapshot_restore_parser = snapshot_subparsers.add_parser('restore', help='Restaurar um snapshot')
+        snapshot_restore_parser.add_argument('snapshot', help='ID do snapshot (prefixo ou latest)')
+        snapshot_restore_parser.add_argument('destination', help='Pasta de destino')
+        snapshot_restore_parser.add_argument('--store', help='Repositório (padrão: [snapshot] store)')
+        snapshot_restore_parser.add_argument('-j', '--workers', type=int, help='Número de workers paralelos')
+        
+        snapshot_list_parser = snapshot_subparsers.add_parser('list', help='Listar snapshots')
+        snapshot_list_parser.add_argument('--store', help='Repositório (padrão: [snapshot] store)')
+        
+        # file serve
+        serve_parser = file_subparsers.add_parser('serve', help='Servir uma pasta por HTTP (sendfile, Range)')
+        serve_parser.add_argument('directory', nargs='?', default='.', help='Pasta (padrão: atual)')
+        serve_parser.add_argument('-b', '--bind', default='127.0.0.1', help='Endereço (padrão: 127.0.0.1)')
+        serve_parser.add_argument('-p', '--port', type=int, default=8000, help='Porta (padrão: 8000)')
+        serve_parser.add_argument('--hidden', action='store_true', help='Servir arquivos ocultos (.*)')
+        serve_parser.add_argument('--log', action='store_true', help='Registrar as requisições em stderr')
+        
+        # file split
+        split_parser = file_subparsers.add_parser('split', help='Dividir arquivo grande em partes')
+        split_parser.add_argument('source', help='Arquivo a dividir')
+        split_parser.add_argument('-s', '--size', required=True, help='Tamanho máximo das partes (ex: 100M, 4G)')
+        split_parser.add_argument('--lines', action='store_true', help='Cortar apenas em fim de linha')
+        split_parser.add_argument('-o', '--output', help='Pasta das partes (padrão: pasta do arquivo)')
+        split_parser.add_argument('-j', '--workers', type=int, help='Número de workers paralelos')
+        
+        # file join
+        join_parser = file_subparsers.add_parser('join', help='Juntar partes geradas por file split')
+        join_parser.add_argument('manifest', help='Manifesto (.manifest.json)')
+        join_parser.add_argument('output', nargs='?', help='Arquivo de destino (padrão: nome original)')
+        join_parser.add_argument('-j', '--workers', type=int, help='Número de workers paralelos')
+        
+        # file watch
+        watch_parser = file_subparsers.add_parser('watch', help='Monitorar alterações em pastas')
+        watch_parser.add_argument('paths', nargs='+', help='Pastas a monitorar')
+        watch_parser.add_argument('-r', '--recursive', action='store_true', default=True,
+                                  help='Incluir subpastas (padrão)')
+        watch_parser.add_argument('--no-recursive', dest='recursive', action='store_false',
+                                  help='Monitorar apenas as pastas informadas, sem subpastas')
+        watch_parser.add_argument('--debounce', type=int, metavar='MS',
+                                  help='Intervalo sem eventos antes de emitir o lote (padrão: 500)')
+        watch_parser.add_argument('-o', '--output', help='Gravar os lotes (JSON lines) no arquivo')
+        watch_parser.add_argument('--run', metavar='COMANDO',
+                                  help='Comando do devtools executado a cada lote (ex: "file checksum dist -r")')
+        watch_parser.add_argument('--plugin', help='Plugin executado a cada lote')
         
         # Comando convert (conversor de unidades)
         convert_parser = subparsers.add_parser('convert', help='Conversor de unidades')
-        convert_parser.add_argument('value', type=float, help='Valor a converter')
+        convert_parser.add_argument('value', type=float, nargs='?', help='Valor a converter (omitido em lote)')
         convert_parser.add_argument('from_unit', help='Unidade origem')
         convert_parser.add_argument('to_unit', help='Unidade destino')
-        convert_parser.add_argument('--type', choices=['size', 'time', 'temperature', 'currency'], 
+        convert_parser.add_argument('--type', choices=[*unit_registry.DIMENSION_NAMES.values(), 'currency'],
                                    help='Tipo de conversão')
+        convert_parser.add_argument('--from-file', metavar='ARQUIVO', help='Converter em lote os valores do arquivo')
+        convert_parser.add_argument('--stdin', action='store_true', help='Converter em lote os valores da entrada padrão')
+        convert_parser.add_argument('--csv-column', metavar='COLUNA',
+                                   help='Entrada CSV: converter a coluna (nome no cabeçalho ou número a partir de 1)')
+        convert_parser.add_argument('--binary', action='store_true',
+                                   help='Entrada e saída em float64 little-endian (sem texto)')
+        convert_parser.add_argument('-o', '--output', help='Gravar os valores convertidos no arquivo')
+        convert_parser.add_argument('--si', action='store_true',
+                                   help='KB, MB, GB, TB e PB em base 1000 (padrão: 1024; KiB, MiB... são sempre binários)')
+        convert_parser.add_argument('--offline', action='store_true',
+                                   help='Moedas: usar apenas o último snapshot de câmbio, sem acessar a API')
         
         # Comando download (downloader de vídeos)
         download_parser = subparsers.add_parser('download', help='Downloader de vídeos')
@@ -150,25 +364,140 @@ Exemplos de uso:
         console.print(create_banner())
         console.print()
     
+    def _ignore_rules(self, args, config_default=True):
+        """Regras de filtro a partir de --exclude/--include/--respect-gitignore
+        
+        config_default=False ignora o general.respect_gitignore da configuração.
+        """
+        respect = args.respect_gitignore or (config_default and
+                                             self.config.get_bool('general', 'respect_gitignore', False))
+        return ignore_rules.IgnoreRules.from_options(args.exclude, args.include, respect)
+    
     def handle_file_command(self, args):
         """Processa comandos de arquivo"""
         if args.file_action == 'list':
-            self.file_manager.list_files(args.path, args.all, args.long)
+            self.file_manager.list_files(args.path, args.all, args.long, self._ignore_rules(args))
         elif args.file_action == 'copy':
-            self.file_manager.copy_file(args.source, args.destination, args.recursive)
+            self.file_manager.copy_file(args.source, args.destination, args.recursive, args.resume,
+                                        args.verify, args.manifest, self._ignore_rules(args),
+                                        args.bwlimit, args.iops_limit, args.idle_io)
         elif args.file_action == 'move':
-            self.file_manager.move_file(args.source, args.destination)
+            self.file_manager.move_file(args.source, args.destination, args.bwlimit, args.iops_limit,
+                                        args.idle_io)
         elif args.file_action == 'rename':
-            self.file_manager.rename_file(args.old_name, args.new_name)
+            if args.pattern is not None:
+                if args.template is None:
+                    print_error("Use --template junto com --pattern")
+                else:
+                    self.file_manager.bulk_rename(args.names, args.pattern, args.template,
+                                                  args.recursive, args.dry_run, args.force,
+                                                  self._ignore_rules(args))
+            elif len(args.names) == 2:
+                self.file_manager.rename_file(args.names[0], args.names[1])
+            else:
+                print_error("Use: devtools file rename nome_atual novo_nome")
         elif args.file_action == 'delete':
-            self.file_manager.delete_files(args.paths, args.force, args.recursive)
+            # A lixeira move alvos inteiros: só filtros pedidos explicitamente são recusados
+            use_trash = args.trash or self.config.get_bool('general', 'use_trash', False)
+            self.file_manager.delete_files(args.paths, args.force, args.recursive, args.trash,
+                                           args.regex, args.workers,
+                                           self._ignore_rules(args, config_default=not use_trash),
+                                           args.iops_limit, args.idle_io)
+        elif args.file_action == 'purge':
+            self.file_manager.purge_trash(args.older_than, args.force, args.background,
+                                          args.workers, args.iops_limit, args.idle_io)
+        elif args.file_action == 'restore':
+            self.file_manager.restore_from_trash(args.item, args.destination)
+        elif args.file_action == 'hash':
+            self.file_manager.hash_files(args.paths, args.algorithms, args.output,
+                                         args.recursive, args.workers, self._ignore_rules(args))
+        elif args.file_action == 'checksum':
+            self.file_manager.checksum_files(args.paths, args.algorithm, args.recursive,
+                                             args.workers, not args.no_cache, self._ignore_rules(args))
+        elif args.file_action == 'verify':
+            self.file_manager.verify_manifest(args.manifest, args.workers)
+        elif args.file_action == 'archive':
+            if args.archive_action == 'create':
+                self.file_manager.create_archive(args.output, args.sources, args.level, args.workers)
+            elif args.archive_action == 'extract':
+                self.file_manager.extract_archive(args.archive, args.destination, args.workers)
+            else:
+                print_error("Use: devtools file archive create|extract")
+        elif args.file_action == 'grep':
+            if args.max_count is not None and args.max_count < 1:
+                print_error("O máximo de linhas (-m) deve ser pelo menos 1")
+                return
+            self.file_manager.grep_files(args.pattern, args.paths, args.ignore_case, args.fixed_strings,
+                                         args.files_with_matches, args.max_count, args.workers,
+                                         self._ignore_rules(args))
+        elif args.file_action == 'stats':
+            self.file_manager.file_stats(args.paths, args.recursive, args.json, args.histogram, args.workers,
+                                         self._ignore_rules(args))
+        elif args.file_action == 'top':
+            if args.count < 1:
+                print_error("A quantidade (-n) deve ser pelo menos 1")
+                return
+            self.file_manager.top_files(args.paths, args.by, args.count, args.oldest,
+                                        self._ignore_rules(args), args.interval)
+        elif args.file_action == 'diff-dir':
+            self.file_manager.diff_directories(args.left, args.right, args.full, args.same,
+                                               args.output, args.workers, self._ignore_rules(args))
+        elif args.file_action == 'inventory':
+            self.file_manager.export_inventory(args.paths, args.output, args.format, args.workers,
+                                               self._ignore_rules(args), args.decode)
+        elif args.file_action == 'snapshot':
+            if args.snapshot_action == 'create':
+                self.file_manager.create_snapshot(args.source, args.store, args.workers, self._ignore_rules(args))
+            elif args.snapshot_action == 'restore':
+                self.file_manager.restore_snapshot(args.snapshot, args.destination, args.store, args.workers)
+            elif args.snapshot_action == 'list':
+                self.file_manager.list_snapshots(args.store)
+            else:
+                print_error("Use: devtools file snapshot create|restore|list")
+        elif args.file_action == 'serve':
+            self.file_manager.serve_files(args.directory, args.bind, args.port, args.hidden, args.log)
+        elif args.file_action == 'split':
+            self.file_manager.split_file(args.source, args.size, args.output, args.lines, args.workers)
+        elif args.file_action == 'join':
+            self.file_manager.join_file(args.manifest, args.output, args.workers)
+        elif args.file_action == 'watch':
+            on_batch = None
+            if args.plugin:
+                if args.plugin not in self.plugin_system.loaded_plugins:
+                    print_error(f"Plugin não encontrado: {args.plugin}")
+                    return
+                
+                def on_batch(record):
+                    args.watch_batch = record
+                    self.plugin_system.execute_plugin(args.plugin, args)
+            
+            self.file_manager.watch_files(args.paths, args.recursive, args.debounce, args.output,
+                                          args.run, on_batch)
         else:
             print_error("Ação de arquivo não reconhecida. Use --help para ver opções.")
     
     def handle_convert_command(self, args):
         """Processa comandos de conversão"""
+        if args.offline:
+            self.unit_converter.offline = True
+        if args.si:
+            self.unit_converter.registry = unit_registry.SI_REGISTRY
+        if args.from_file or args.stdin:
+            if args.value is not None:
+                print_error("Em lote informe apenas as unidades: devtools convert --stdin bytes gb")
+                return
+            if args.csv_column and args.binary:
+                print_error("--csv-column e --binary não podem ser combinados")
+                return
+            self.unit_converter.convert_bulk(args.from_unit, args.to_unit, args.type, args.from_file,
+                                             args.csv_column, args.binary, args.output)
+            return
+        if args.value is None:
+            print_error("Informe o valor a converter, ou use --from-file/--stdin")
+            return
+        
         result = self.unit_converter.convert(args.value, args.from_unit, args.to_unit, args.type)
-        if result:
+        if result is not None:
             print_success(f"{args.value} {args.from_unit} = {result} {args.to_unit}")
     
     def handle_download_command(self, args):
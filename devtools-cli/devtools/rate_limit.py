@@ -0,0 +1,94 @@
+"""
+Limitação de banda e de operações de I/O do DevTools CLI
+
+Cada limite é um balde de fichas com débito: quem consome reserva as fichas
+imediatamente (o saldo pode ficar negativo) e dorme até o débito ser pago.
+Assim várias threads dividem o mesmo limite sem ultrapassá-lo, e a taxa
+média fica exata mesmo para blocos maiores que o balde. Sem limites
+configurados nenhum objeto é criado e os chamadores apenas testam None.
+"""
+import ctypes
+import ctypes.util
+import platform
+import threading
+import time
+
+# Quanto tempo de folga pode acumular enquanto ninguém consome
+BURST_SECONDS = 0.05
+# Blocos menores quando a banda é baixa: rajadas de no máximo ~50ms
+MIN_THROTTLED_BUFFER = 64 * 1024
+
+IOPRIO_CLASS_IDLE = 3
+IOPRIO_CLASS_SHIFT = 13
+IOPRIO_WHO_PROCESS = 1
+# Número da syscall ioprio_set por arquitetura (Linux)
+SYS_IOPRIO_SET = {
+    'x86_64': 251, 'i386': 289, 'i686': 289, 'aarch64': 30, 'arm64': 30, 'riscv64': 30,
+    'armv7l': 314, 'ppc64le': 273, 'ppc64': 273, 's390x': 282,
+}
+
+class TokenBucket:
+    """Balde de fichas: rate fichas por segundo"""
+    
+    def __init__(self, rate, burst=None):
+        if rate <= 0:
+            raise ValueError(f"Limite deve ser positivo: {rate}")
+        self.rate = float(rate)
+        self.capacity = burst if burst is not None else self.rate * BURST_SECONDS
+        self.tokens = 0.0
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def consume(self, amount):
+        """Reserva amount fichas, dormindo o necessário para respeitar a taxa"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate) - amount
+            self.updated = now
+            delay = -self.tokens / self.rate if self.tokens < 0 else 0
+        if delay > 0:
+            time.sleep(delay)
+
+class Throttle:
+    """Limites combinados de bytes/s e operações/s"""
+    
+    def __init__(self, bytes_per_second=None, ops_per_second=None):
+        self.bytes = TokenBucket(bytes_per_second) if bytes_per_second else None
+        self.ops = TokenBucket(ops_per_second) if ops_per_second else None
+    
+    @classmethod
+    def from_limits(cls, bytes_per_second=None, ops_per_second=None):
+        """Cria o limitador, ou None quando não há limites"""
+        if not bytes_per_second and not ops_per_second:
+            return None
+        return cls(bytes_per_second, ops_per_second)
+    
+    def consume(self, nbytes=0, ops=1):
+        """Contabiliza ops operações de I/O transferindo nbytes"""
+        if self.ops and ops:
+            self.ops.consume(ops)
+        if self.bytes and nbytes:
+            self.bytes.consume(nbytes)
+    
+    def buffer_size(self, default):
+        """Tamanho de bloco adequado ao limite de banda"""
+        if not self.bytes:
+            return default
+        return max(MIN_THROTTLED_BUFFER, min(default, int(self.bytes.rate * BURST_SECONDS)))
+
+def set_idle_io_priority():
+    """Coloca o processo na classe de I/O ociosa (ioprio_set), como `ionice -c3`
+    
+    Vale para a thread atual e as criadas depois dela. Retorna False se não
+    for suportado.
+    """
+    number = SYS_IOPRIO_SET.get(platform.machine())
+    if platform.system() != 'Linux' or number is None:
+        return False
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+    except OSError:
+        return False
+    value = IOPRIO_CLASS_IDLE << IOPRIO_CLASS_SHIFT
+    # which=0: a thread que chama
+    return libc.syscall(number, IOPRIO_WHO_PROCESS, 0, value) == 0
\ No newline at end of file
@@ -0,0 +1,355 @@
+"""
+Snapshots deduplicados de pastas do DevTools CLI (file snapshot)
+
+Os arquivos são divididos em blocos de tamanho variável por content-defined
+chunking com o hash rolante Gear: a fronteira depende apenas dos últimos 64
+bytes, então uma inserção no meio de um arquivo altera só os blocos vizinhos.
+Cada bloco é gravado uma única vez no repositório, endereçado pelo SHA-256, e
+cada snapshot é um manifesto gzip com a lista de blocos de cada arquivo.
+Arquivos com o mesmo tamanho e mtime do snapshot anterior da mesma origem
+reaproveitam a lista de blocos sem serem lidos.
+"""
+import bisect
+import gzip
+import hashlib
+import json
+import os
+import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from .utils import default_workers
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+STORE_VERSION = 1
+STORE_INFO = 'store.json'
+MANIFEST_SUFFIX = '.json.gz'
+DEFAULT_AVERAGE_CHUNK = 64 * 1024
+# O bloco mínimo precisa cobrir a janela de 64 bytes do hash
+MIN_AVERAGE_CHUNK = 1024
+READ_SIZE = 4 * 1024 * 1024
+
+GEAR = tuple(int.from_bytes(hashlib.sha256(bytes([value])).digest()[:8], 'little') for value in range(256))
+MASK64 = (1 << 64) - 1
+GEAR_ARRAY = np.array(GEAR, dtype=np.uint64) if np is not None else None
+
+class SnapshotError(Exception):
+    """Repositório, snapshot ou bloco inválido"""
+
+def chunk_params(average):
+    """Limites do chunking para um tamanho médio de bloco (potência de 2)"""
+    if average < MIN_AVERAGE_CHUNK:
+        raise SnapshotError(f"Tamanho médio de bloco muito pequeno: {average}")
+    bits = average.bit_length() - 1
+    return {'average': 1 << bits, 'minimum': (1 << bits) // 4, 'maximum': (1 << bits) * 4, 'bits': bits}
+
+def _gear_candidates(data, bits):
+    """Posições cujo hash Gear tem os bits mais altos zerados (possíveis fronteiras)"""
+    mask = ((1 << bits) - 1) << (64 - bits)
+    if np is not None:
+        # h[i] = soma de GEAR[data[i-k]] << k para k < 64, em 6 passos de duplicação
+        h = GEAR_ARRAY[np.frombuffer(data, dtype=np.uint8)]
+        span = 1
+        while span < 64:
+            h[span:] += h[:-span] << np.uint64(span)
+            span *= 2
+        return np.flatnonzero((h & np.uint64(mask)) == 0).tolist()
+    
+    positions = []
+    h = 0
+    for position, byte in enumerate(data):
+        h = ((h << 1) + GEAR[byte]) & MASK64
+        if not h & mask:
+            positions.append(position)
+    return positions
+
+def cut_points(data, params, final):
+    """Fronteiras dos blocos em data, que começa em uma fronteira
+    
+    Sem final, o trecho após a última fronteira fica pendente até chegarem
+    mais dados.
+    """
+    candidates = _gear_candidates(data, params['bits'])
+    minimum, maximum = params['minimum'], params['maximum']
+    cuts = []
+    start = 0
+    index = 0
+    while True:
+        index = bisect.bisect_left(candidates, start + minimum - 1, index)
+        if index < len(candidates) and candidates[index] + 1 - start <= maximum:
+            cut = candidates[index] + 1
+        else:
+            cut = start + maximum
+        if cut > len(data):
+            break
+        cuts.append(cut)
+        start = cut
+    if final and start < len(data):
+        cuts.append(len(data))
+    return cuts
+
+def iter_chunks(f, params):
+    """Gera os blocos de um arquivo aberto em modo binário"""
+    pending = b''
+    while True:
+        data = f.read(READ_SIZE)
+        final = not data
+        buffer = pending + data if pending else data
+        start = 0
+        for cut in cut_points(buffer, params, final):
+            yield buffer[start:cut]
+            start = cut
+        if final:
+            return
+        pending = buffer[start:]
+
+def _relative_target(destination, relpath):
+    """Caminho de restauração, recusando entradas fora do destino"""
+    if not relpath or relpath.startswith('/') or '..' in relpath.split('/'):
+        raise SnapshotError(f"Caminho inválido no manifesto: {relpath}")
+    return os.path.join(destination, *relpath.split('/'))
+
+class SnapshotPlan:
+    """Entradas de uma origem e o snapshot anterior usado como referência"""
+    
+    def __init__(self, source, parent):
+        self.source = source
+        self.parent = parent
+        self.files = []
+        self.dirs = []
+        self.links = []
+        self.reused = {}
+        self.bytes_to_read = 0
+        self.errors = 0
+
+class SnapshotStore:
+    """Repositório local de blocos endereçados por conteúdo e manifestos"""
+    
+    def __init__(self, root, average_chunk=None):
+        self.root = os.fspath(root)
+        self.chunks_dir = os.path.join(self.root, 'chunks')
+        self.snapshots_dir = os.path.join(self.root, 'snapshots')
+        info_path = os.path.join(self.root, STORE_INFO)
+        
+        if os.path.exists(info_path):
+            try:
+                with open(info_path, 'r', encoding='utf-8') as f:
+                    info = json.load(f)
+                if info['version'] != STORE_VERSION:
+                    raise SnapshotError(f"Versão de repositório não suportada: {info['version']}")
+                # Os parâmetros são fixos por repositório: mudá-los quebraria a deduplicação
+                self.params = chunk_params(info['average_chunk'])
+            except (KeyError, TypeError, ValueError) as e:
+                raise SnapshotError(f"Repositório inválido: {e}")
+        else:
+            self.params = chunk_params(average_chunk or DEFAULT_AVERAGE_CHUNK)
+            os.makedirs(self.chunks_dir, exist_ok=True)
+            os.makedirs(self.snapshots_dir, exist_ok=True)
+            with open(info_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': STORE_VERSION, 'average_chunk': self.params['average']}, f, indent=2)
+    
+    def chunk_path(self, digest):
+        return os.path.join(self.chunks_dir, digest[:2], digest[2:])
+    
+    def put_chunk(self, digest, data):
+        """Grava o bloco se ainda não existir; retorna True se foi gravado"""
+        path = self.chunk_path(digest)
+        if os.path.exists(path):
+            return False
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+        return True
+    
+    def get_chunk(self, digest):
+        """Lê um bloco conferindo o SHA-256"""
+        try:
+            with open(self.chunk_path(digest), 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            raise SnapshotError(f"Bloco ausente no repositório: {digest}")
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise SnapshotError(f"Bloco corrompido no repositório: {digest}")
+        return data
+    
+    def _manifest_path(self, snapshot_id):
+        return os.path.join(self.snapshots_dir, snapshot_id + MANIFEST_SUFFIX)
+    
+    def snapshot_ids(self):
+        """IDs dos snapshots, do mais antigo ao mais recente"""
+        try:
+            names = os.listdir(self.snapshots_dir)
+        except FileNotFoundError:
+            return []
+        return sorted(name[:-len(MANIFEST_SUFFIX)] for name in names if name.endswith(MANIFEST_SUFFIX))
+    
+    def load(self, snapshot_id):
+        """Carrega um manifesto; aceita 'latest' ou um prefixo único do ID"""
+        ids = self.snapshot_ids()
+        if snapshot_id == 'latest':
+            matches = ids[-1:]
+        else:
+            matches = [i for i in ids if i == snapshot_id] or [i for i in ids if i.startswith(snapshot_id)]
+        if not matches:
+            raise SnapshotError(f"Snapshot não encontrado: {snapshot_id}")
+        if len(matches) > 1:
+            raise SnapshotError(f"ID ambíguo: {snapshot_id} ({', '.join(matches)})")
+        try:
+            with gzip.open(self._manifest_path(matches[0]), 'rt', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            raise SnapshotError(f"Manifesto inválido: {matches[0]}: {e}")
+    
+    def list_snapshots(self):
+        """Manifestos sem as listas de entradas, do mais antigo ao mais recente"""
+        snapshots = []
+        for snapshot_id in self.snapshot_ids():
+            manifest = self.load(snapshot_id)
+            for key in ('files', 'dirs', 'links'):
+                manifest[key] = len(manifest[key])
+            snapshots.append(manifest)
+        return snapshots
+    
+    def latest_for(self, source):
+        """Snapshot mais recente da mesma origem, ou None"""
+        for snapshot_id in reversed(self.snapshot_ids()):
+            manifest = self.load(snapshot_id)
+            if manifest['source'] == source:
+                return manifest
+        return None
+    
+    def scan(self, source, rules=None):
+        """Lista a origem e decide quais arquivos precisam ser lidos"""
+        source = os.path.abspath(source)
+        parent = self.latest_for(source)
+        previous = {entry['path']: entry for entry in parent['files']} if parent else {}
+        plan = SnapshotPlan(source, parent)
+        
+        walker = rules.walk(source) if rules else os.walk(source)
+        for directory, dirs, files in walker:
+            relative_dir = os.path.relpath(directory, source)
+            prefix = '' if relative_dir == os.curdir else relative_dir.replace(os.sep, '/') + '/'
+            for name in dirs + files:
+                path = os.path.join(directory, name)
+                relpath = prefix + name
+                try:
+                    st = os.lstat(path)
+                except OSError:
+                    plan.errors += 1
+                    continue
+                if stat.S_ISLNK(st.st_mode):
+                    plan.links.append({'path': relpath, 'target': os.readlink(path)})
+                elif stat.S_ISDIR(st.st_mode):
+                    plan.dirs.append({'path': relpath, 'mode': stat.S_IMODE(st.st_mode),
+                                      'mtime_ns': st.st_mtime_ns})
+                elif stat.S_ISREG(st.st_mode):
+                    entry = {'path': relpath, 'size': st.st_size, 'mtime_ns': st.st_mtime_ns,
+                             'mode': stat.S_IMODE(st.st_mode)}
+                    old = previous.get(relpath)
+                    if old and old['size'] == st.st_size and old['mtime_ns'] == st.st_mtime_ns:
+                        plan.reused[relpath] = old['chunks']
+                    else:
+                        plan.bytes_to_read += st.st_size
+                    plan.files.append(entry)
+        return plan
+    
+    def create(self, plan, workers=None, progress_callback=None):
+        """Grava os blocos novos e o manifesto do snapshot; retorna o manifesto"""
+        lock = threading.Lock()
+        stats = {'files_read': 0, 'files_reused': len(plan.reused), 'bytes_read': 0,
+                 'chunks_new': 0, 'bytes_new': 0}
+        
+        def store_file(entry):
+            chunks = plan.reused.get(entry['path'])
+            if chunks is not None:
+                return chunks
+            chunks = []
+            read_bytes = new_chunks = new_bytes = 0
+            with open(os.path.join(plan.source, *entry['path'].split('/')), 'rb') as f:
+                for data in iter_chunks(f, self.params):
+                    digest = hashlib.sha256(data).hexdigest()
+                    if self.put_chunk(digest, data):
+                        new_chunks += 1
+                        new_bytes += len(data)
+                    chunks.append(digest)
+                    read_bytes += len(data)
+                    if progress_callback:
+                        progress_callback(len(data))
+            with lock:
+                stats['files_read'] += 1
+                stats['bytes_read'] += read_bytes
+                stats['chunks_new'] += new_chunks
+                stats['bytes_new'] += new_bytes
+            return chunks
+        
+        with ThreadPoolExecutor(max_workers=workers or default_workers()) as executor:
+            for entry, chunks in zip(plan.files, executor.map(store_file, plan.files)):
+                entry['chunks'] = chunks
+        
+        snapshot_id = datetime.now().strftime('%Y%m%d-%H%M%S')
+        ids = set(self.snapshot_ids())
+        suffix = 1
+        while snapshot_id + (f"-{suffix}" if suffix > 1 else '') in ids:
+            suffix += 1
+        if suffix > 1:
+            snapshot_id += f"-{suffix}"
+        
+        manifest = {
+            'version': STORE_VERSION,
+            'id': snapshot_id,
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'source': plan.source,
+            'parent': plan.parent['id'] if plan.parent else None,
+            'size': sum(entry['size'] for entry in plan.files),
+            'stats': stats,
+            'files': plan.files,
+            'dirs': plan.dirs,
+            'links': plan.links,
+        }
+        os.makedirs(self.snapshots_dir, exist_ok=True)
+        path = self._manifest_path(snapshot_id)
+        with gzip.open(path + '.tmp', 'wt', encoding='utf-8') as f:
+            json.dump(manifest, f, separators=(',', ':'))
+        os.replace(path + '.tmp', path)
+        return manifest
+    
+    def restore(self, snapshot_id, destination, workers=None, progress_callback=None):
+        """Recria os arquivos de um snapshot em destination; retorna o manifesto"""
+        manifest = self.load(snapshot_id)
+        destination = os.fspath(destination)
+        os.makedirs(destination, exist_ok=True)
+        for entry in manifest['dirs']:
+            os.makedirs(_relative_target(destination, entry['path']), exist_ok=True)
+        
+        def restore_file(entry):
+            path = _relative_target(destination, entry['path'])
+            with open(path, 'wb') as f:
+                for digest in entry['chunks']:
+                    data = self.get_chunk(digest)
+                    f.write(data)
+                    if progress_callback:
+                        progress_callback(len(data))
+            os.chmod(path, entry['mode'])
+            os.utime(path, ns=(entry['mtime_ns'], entry['mtime_ns']))
+        
+        with ThreadPoolExecutor(max_workers=workers or default_workers()) as executor:
+            list(executor.map(restore_file, manifest['files']))
+        
+        for entry in manifest['links']:
+            path = _relative_target(destination, entry['path'])
+            if os.path.lexists(path):
+                os.unlink(path)
+            os.symlink(entry['target'], path)
+        
+        # Pastas por último (das mais profundas): criar arquivos altera o mtime delas
+        for entry in sorted(manifest['dirs'], key=lambda e: e['path'].count('/'), reverse=True):
+            path = _relative_target(destination, entry['path'])
+            os.chmod(path, entry['mode'])
+            os.utime(path, ns=(entry['mtime_ns'], entry['mtime_ns']))
+        return manifest
\ No newline at end of file
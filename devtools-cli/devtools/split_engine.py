@@ -0,0 +1,185 @@
+"""
+Divisão e junção de arquivos grandes do DevTools CLI (file split/join)
+
+As partes são independentes entre si: cada worker lê o seu trecho com
+os.pread e grava com os.pwrite, calculando o checksum no caminho. Na
+junção o destino é pré-alocado com posix_fallocate e cada parte é gravada
+diretamente no seu offset, também em paralelo.
+"""
+import errno
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from .copy_engine import COPY_BUFFER_SIZE, PART_SUFFIX, _datasync, _pread_into, _pwrite_all
+from .utils import default_workers
+
+MANIFEST_SUFFIX = '.manifest.json'
+MANIFEST_VERSION = 1
+LINE_SEARCH_WINDOW = 1024 * 1024
+
+class ManifestError(Exception):
+    """Manifesto inválido ou partes que não conferem com ele"""
+
+def part_name(filename, index):
+    return f"{filename}.part{index:04d}"
+
+def _last_newline_before(fd, start, limit):
+    """Offset logo após a última quebra de linha em [start, limit), ou None"""
+    end = limit
+    while end > start:
+        window_start = max(start, end - LINE_SEARCH_WINDOW)
+        data = os.pread(fd, end - window_start, window_start)
+        position = data.rfind(b'\n')
+        if position != -1:
+            return window_start + position + 1
+        end = window_start
+    return None
+
+def plan_parts(fd, size, part_size, line_aligned=False):
+    """Calcula os limites (offset, tamanho) de cada parte
+    
+    Com line_aligned as partes terminam na última quebra de linha que cabe no
+    limite; uma linha maior que part_size é cortada no limite.
+    """
+    parts = []
+    offset = 0
+    while offset < size:
+        end = min(offset + part_size, size)
+        if line_aligned and end < size:
+            end = _last_newline_before(fd, offset, end) or end
+        parts.append((offset, end - offset))
+        offset = end
+    return parts
+
+def _copy_range(src_fd, dst_fd, src_offset, dst_offset, length, algorithm, progress_callback=None):
+    """Copia um trecho entre descritores calculando o checksum dos dados"""
+    hasher = hashlib.new(algorithm)
+    view = memoryview(bytearray(min(COPY_BUFFER_SIZE, max(length, 1))))
+    done = 0
+    while done < length:
+        read = _pread_into(src_fd, view[:min(len(view), length - done)], src_offset + done)
+        if not read:
+            raise ManifestError(f"Fim de arquivo inesperado após {done} de {length} bytes")
+        chunk = view[:read]
+        _pwrite_all(dst_fd, chunk, dst_offset + done)
+        # hashlib libera o GIL para blocos grandes: os workers rodam em paralelo
+        hasher.update(chunk)
+        done += read
+        if progress_callback:
+            progress_callback(read)
+    return hasher.hexdigest()
+
+def split_file(source, output_dir, part_size, line_aligned=False, algorithm='sha256',
+               workers=None, progress_callback=None):
+    """Divide o arquivo em partes e grava o manifesto; retorna o caminho do manifesto"""
+    filename = os.path.basename(source)
+    os.makedirs(output_dir, exist_ok=True)
+    
+    src_fd = os.open(source, os.O_RDONLY)
+    try:
+        size = os.fstat(src_fd).st_size
+        parts = plan_parts(src_fd, size, part_size, line_aligned)
+        
+        def write_part(index):
+            offset, length = parts[index]
+            path = os.path.join(output_dir, part_name(filename, index + 1))
+            dst_fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            try:
+                digest = _copy_range(src_fd, dst_fd, offset, 0, length, algorithm, progress_callback)
+            finally:
+                os.close(dst_fd)
+            return {'name': os.path.basename(path), 'offset': offset, 'size': length, 'digest': digest}
+        
+        with ThreadPoolExecutor(max_workers=workers or default_workers()) as executor:
+            entries = list(executor.map(write_part, range(len(parts))))
+    finally:
+        os.close(src_fd)
+    
+    manifest_path = os.path.join(output_dir, filename + MANIFEST_SUFFIX)
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'version': MANIFEST_VERSION,
+            'file': filename,
+            'size': size,
+            'algorithm': algorithm,
+            'line_aligned': line_aligned,
+            'parts': entries,
+        }, f, indent=2)
+    return manifest_path
+
+def read_manifest(manifest_path):
+    """Carrega e valida a consistência do manifesto"""
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        parts = manifest['parts']
+        size = manifest['size']
+        hashlib.new(manifest['algorithm'])
+    except (KeyError, TypeError, ValueError) as e:
+        raise ManifestError(f"Manifesto inválido: {e}")
+    
+    offset = 0
+    for part in parts:
+        name = part.get('name', '')
+        if part.get('offset') != offset or not name or os.sep in name or name in ('.', '..'):
+            raise ManifestError(f"Manifesto inválido: parte {part.get('name')} fora de ordem")
+        offset += part['size']
+    if offset != size:
+        raise ManifestError("Manifesto inválido: soma das partes difere do tamanho do arquivo")
+    return manifest
+
+def join_file(manifest_path, output, workers=None, progress_callback=None):
+    """Reconstrói o arquivo a partir das partes verificando cada checksum
+    
+    Os dados vão para um temporário ao lado do destino, renomeado apenas
+    depois que todas as partes conferem.
+    """
+    manifest = read_manifest(manifest_path)
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    algorithm = manifest['algorithm']
+    
+    for part in manifest['parts']:
+        path = os.path.join(base_dir, part['name'])
+        try:
+            actual = os.path.getsize(path)
+        except OSError:
+            raise ManifestError(f"Parte não encontrada: {path}")
+        if actual != part['size']:
+            raise ManifestError(f"Tamanho incorreto em {part['name']}: {actual} (esperado {part['size']})")
+    
+    temp_path = os.fspath(output) + PART_SUFFIX
+    dst_fd = os.open(temp_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        # Pré-alocação: evita fragmentação e falha cedo se faltar espaço
+        if manifest['size'] and hasattr(os, 'posix_fallocate'):
+            try:
+                os.posix_fallocate(dst_fd, 0, manifest['size'])
+            except OSError as e:
+                if e.errno not in (errno.EINVAL, errno.EOPNOTSUPP):
+                    raise
+                os.ftruncate(dst_fd, manifest['size'])
+        else:
+            os.ftruncate(dst_fd, manifest['size'])
+        
+        def read_part(part):
+            src_fd = os.open(os.path.join(base_dir, part['name']), os.O_RDONLY)
+            try:
+                digest = _copy_range(src_fd, dst_fd, 0, part['offset'], part['size'], algorithm,
+                                     progress_callback)
+            finally:
+                os.close(src_fd)
+            if digest != part['digest']:
+                raise ManifestError(f"Checksum incorreto em {part['name']}")
+        
+        with ThreadPoolExecutor(max_workers=workers or default_workers()) as executor:
+            list(executor.map(read_part, manifest['parts']))
+        _datasync(dst_fd)
+    except BaseException:
+        os.close(dst_fd)
+        os.unlink(temp_path)
+        raise
+    os.close(dst_fd)
+    
+    os.replace(temp_path, output)
+    return manifest
\ No newline at end of file
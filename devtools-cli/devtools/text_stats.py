@@ -0,0 +1,233 @@
+"""
+Estatísticas de texto do DevTools CLI (linhas, palavras, bytes)
+
+Os arquivos são lidos em blocos grandes e contados com operações que rodam
+em C (bytes.count/translate, ou NumPy quando instalado), nunca linha a
+linha em Python. Cada bloco gera contagens parciais que podem ser
+combinadas, então um arquivo enorme é dividido entre vários processos e as
+partes são unidas no final.
+
+Histograma de comprimento das linhas: faixa k contém linhas com
+2^(k-1) <= comprimento < 2^k (k=0 são linhas vazias).
+"""
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from .utils import default_workers
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+CHUNK_SIZE = 16 * 1024 * 1024
+WHITESPACE = b' \t\n\r\x0b\x0c'
+
+# Tabela de tradução: espaço em branco vira b' ', o resto vira b'x'
+_WORD_TABLE = bytes(0x20 if byte in WHITESPACE else 0x78 for byte in range(256))
+
+if np is not None:
+    _WHITESPACE_LOOKUP = np.zeros(256, dtype=bool)
+    _WHITESPACE_LOOKUP[list(WHITESPACE)] = True
+
+class ChunkStats:
+    """Contagens parciais de um trecho contíguo do arquivo
+    
+    prefix/suffix são os bytes antes da primeira e depois da última quebra de
+    linha; linhas completamente internas ao trecho já entram em histogram.
+    """
+    
+    __slots__ = ('bytes', 'lines', 'words', 'starts_in_word', 'ends_in_word',
+                 'prefix', 'suffix', 'longest', 'histogram')
+    
+    def __init__(self):
+        self.bytes = 0
+        self.lines = 0
+        self.words = 0
+        self.starts_in_word = False
+        self.ends_in_word = False
+        self.prefix = 0
+        self.suffix = 0
+        self.longest = 0
+        self.histogram = Counter()
+    
+    def _add_line(self, length):
+        self.histogram[length.bit_length()] += 1
+        self.longest = max(self.longest, length)
+    
+    def merge(self, other):
+        """Combina com o trecho imediatamente seguinte"""
+        if not other.bytes:
+            return self
+        if not self.bytes:
+            return other
+        
+        merged = ChunkStats()
+        merged.bytes = self.bytes + other.bytes
+        merged.lines = self.lines + other.lines
+        # Uma palavra cortada na fronteira foi contada nos dois lados
+        merged.words = self.words + other.words - (self.ends_in_word and other.starts_in_word)
+        merged.starts_in_word = self.starts_in_word
+        merged.ends_in_word = other.ends_in_word
+        merged.longest = max(self.longest, other.longest)
+        merged.histogram = self.histogram + other.histogram
+        
+        if self.lines and other.lines:
+            merged.prefix = self.prefix
+            merged.suffix = other.suffix
+            merged._add_line(self.suffix + other.prefix)
+        elif self.lines:
+            merged.prefix = self.prefix
+            merged.suffix = self.suffix + other.bytes
+        elif other.lines:
+            merged.prefix = self.bytes + other.prefix
+            merged.suffix = other.suffix
+        else:
+            merged.prefix = merged.suffix = merged.bytes
+        return merged
+    
+    def result(self):
+        """Estatísticas finais do arquivo"""
+        longest = self.longest
+        histogram = Counter(self.histogram)
+        edges = [self.prefix] if self.lines else []
+        if self.suffix or not self.lines and self.bytes:
+            # Última linha sem quebra de linha no final
+            edges.append(self.suffix)
+        for length in edges:
+            histogram[length.bit_length()] += 1
+            longest = max(longest, length)
+        
+        return {
+            'lines': self.lines,
+            'words': self.words,
+            'bytes': self.bytes,
+            'longest_line': longest,
+            'histogram': {bucket_label(k): histogram[k] for k in sorted(histogram)},
+        }
+
+def bucket_label(bucket):
+    """Rótulo da faixa do histograma (ex: '64-127')"""
+    if bucket <= 1:
+        return str(bucket)
+    return f"{1 << (bucket - 1)}-{(1 << bucket) - 1}"
+
+def _count_python(data, stats):
+    """Contagem com métodos de bytes (sem NumPy)"""
+    stats.lines = data.count(b'\n')
+    marks = data.translate(_WORD_TABLE)
+    stats.starts_in_word = marks[0] == 0x78
+    stats.ends_in_word = marks[-1] == 0x78
+    stats.words = marks.count(b' x') + stats.starts_in_word
+    
+    if not stats.lines:
+        stats.prefix = stats.suffix = len(data)
+        return
+    
+    first = data.find(b'\n')
+    last = data.rfind(b'\n')
+    stats.prefix = first
+    stats.suffix = len(data) - last - 1
+    if last > first:
+        lengths = list(map(len, data[first + 1:last].split(b'\n')))
+        stats.histogram = Counter(map(int.bit_length, lengths))
+        stats.longest = max(lengths)
+
+def _count_numpy(data, stats):
+    """Contagem vetorizada com NumPy"""
+    array = np.frombuffer(data, dtype=np.uint8)
+    newlines = np.flatnonzero(array == 0x0A)
+    stats.lines = len(newlines)
+    
+    in_word = ~_WHITESPACE_LOOKUP[array]
+    stats.starts_in_word = bool(in_word[0])
+    stats.ends_in_word = bool(in_word[-1])
+    stats.words = int(np.count_nonzero(in_word[1:] & ~in_word[:-1])) + stats.starts_in_word
+    
+    if not stats.lines:
+        stats.prefix = stats.suffix = len(data)
+        return
+    
+    stats.prefix = int(newlines[0])
+    stats.suffix = len(data) - int(newlines[-1]) - 1
+    if stats.lines > 1:
+        lengths = np.diff(newlines) - 1
+        # frexp devolve o expoente e com x = m * 2^e, 0.5 <= m < 1: o bit_length
+        buckets = np.bincount(np.frexp(lengths)[1])
+        stats.histogram = Counter({k: int(n) for k, n in enumerate(buckets) if n})
+        stats.longest = int(lengths.max())
+
+def count_range(path, offset=0, length=None):
+    """Conta um trecho do arquivo (o arquivo inteiro por padrão)"""
+    stats = ChunkStats()
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        if length is None:
+            length = os.fstat(fd).st_size - offset
+        end = offset + length
+        while offset < end:
+            data = os.pread(fd, min(CHUNK_SIZE, end - offset), offset)
+            if not data:
+                break
+            chunk = ChunkStats()
+            chunk.bytes = len(data)
+            if np is not None:
+                _count_numpy(data, chunk)
+            else:
+                _count_python(data, chunk)
+            stats = stats.merge(chunk)
+            offset += len(data)
+    finally:
+        os.close(fd)
+    return stats
+
+def _count_task(task):
+    index, path, offset, length = task
+    try:
+        return index, path, count_range(path, offset, length), None
+    except OSError as e:
+        return index, path, None, e
+
+def file_stats(paths, workers=None, chunk_size=CHUNK_SIZE * 4):
+    """Calcula as estatísticas dos arquivos em paralelo
+    
+    Arquivos maiores que chunk_size são divididos em trechos processados por
+    workers diferentes e combinados em ordem. Gera (caminho, estatísticas,
+    erro) na ordem de entrada.
+    """
+    tasks = []
+    for index, path in enumerate(paths):
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            size = 0
+        if size > chunk_size:
+            tasks += [(index, path, offset, chunk_size) for offset in range(0, size, chunk_size)]
+        else:
+            tasks.append((index, path, 0, None))
+    
+    workers = workers or default_workers()
+    if workers == 1 or len(tasks) == 1:
+        yield from _merge_results(map(_count_task, tasks))
+        return
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from _merge_results(executor.map(_count_task, tasks))
+
+def _merge_results(results):
+    """Une os trechos consecutivos de cada arquivo"""
+    current_index = None
+    current_path = None
+    current = None
+    error = None
+    for index, path, stats, task_error in results:
+        if index != current_index:
+            if current_index is not None:
+                yield current_path, None if error else current.result(), error
+            current_index, current_path, current, error = index, path, ChunkStats(), None
+        if task_error:
+            error = error or task_error
+        elif not error:
+            current = current.merge(stats)
+    if current_index is not None:
+        yield current_path, None if error else current.result(), error
\ No newline at end of file
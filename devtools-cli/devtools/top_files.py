@@ -0,0 +1,98 @@
+"""
+Maiores/mais antigos/mais recentes arquivos de uma árvore (file top)
+
+A árvore é percorrida uma única vez com scandir e só os N melhores
+candidatos ficam em memória, em um heap limitado: o custo de memória é
+O(N) independentemente do tamanho da árvore.
+"""
+import heapq
+import itertools
+import os
+import time
+
+SORT_KEYS = {
+    'size': lambda st: st.st_size,
+    'mtime': lambda st: st.st_mtime,
+    'atime': lambda st: st.st_atime,
+}
+
+class TopN:
+    """Mantém os N itens com maior (ou menor) valor vistos até agora"""
+    
+    def __init__(self, n, largest=True):
+        self.n = n
+        self.sign = 1 if largest else -1
+        self.heap = []
+        self.counter = itertools.count()
+    
+    def push(self, value, item):
+        if self.n <= 0:
+            return
+        # O topo do heap é o pior dos N atuais: só ele precisa ser comparado
+        entry = (self.sign * value, next(self.counter), item)
+        if len(self.heap) < self.n:
+            heapq.heappush(self.heap, entry)
+        elif entry[0] > self.heap[0][0]:
+            heapq.heapreplace(self.heap, entry)
+    
+    def items(self):
+        """Itens em ordem, do melhor para o pior"""
+        return [item for _, _, item in sorted(self.heap, key=lambda entry: (-entry[0], entry[1]))]
+
+def scan(paths, key='size', n=50, largest=True, rules=None, progress_callback=None, interval=5.0):
+    """Percorre os caminhos e retorna ((caminho, stat), ...) dos N primeiros
+    
+    rules (IgnoreRules) filtra as entradas e poda diretórios excluídos.
+    progress_callback(verificados, parciais) é chamado a cada interval
+    segundos com os resultados parciais.
+    """
+    value_of = SORT_KEYS[key]
+    top = TopN(n, largest)
+    scanned = 0
+    errors = 0
+    next_report = time.monotonic() + interval
+    
+    stack = []
+    for path in reversed(paths):
+        path = os.fspath(path)
+        if os.path.isdir(path):
+            stack.append((path, rules.matcher(path) if rules else None))
+            continue
+        try:
+            st = os.stat(path)
+        except OSError:
+            errors += 1
+            continue
+        top.push(value_of(st), (path, st))
+        scanned += 1
+    
+    while stack:
+        directory, matcher = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                        if matcher and not matcher.accepts(entry.name, is_dir):
+                            continue
+                        if is_dir:
+                            stack.append((entry.path, matcher and matcher.child(entry.name)))
+                            continue
+                        if not entry.is_file(follow_symlinks=False):
+                            continue
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        errors += 1
+                        continue
+                    
+                    top.push(value_of(st), (entry.path, st))
+                    scanned += 1
+        except OSError:
+            errors += 1
+            continue
+        
+        if progress_callback and time.monotonic() >= next_report:
+            progress_callback(scanned, top.items())
+            next_report = time.monotonic() + interval
+    
+    return top.items(), scanned, errors
\ No newline at end of file
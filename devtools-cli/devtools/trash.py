@@ -0,0 +1,159 @@
+"""
+Lixeira do DevTools CLI
+
+Apagar com a lixeira é apenas um rename para uma pasta .devtools-trash no
+mesmo sistema de arquivos (O(1), independente do tamanho da árvore). A
+remoção definitiva fica a cargo do purge, que apaga em paralelo.
+"""
+import json
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from . import delete_engine
+
+TRASH_DIR_NAME = '.devtools-trash'
+
+def _mount_point(path):
+    """Retorna o ponto de montagem que contém o caminho"""
+    path = Path(path)
+    dev = os.lstat(path).st_dev
+    while path.parent != path and os.lstat(path.parent).st_dev == dev:
+        path = path.parent
+    return path
+
+class Trash:
+    def __init__(self, config):
+        self.config = config
+        self.home_trash = Path(config.config_dir) / 'trash'
+        self.locations_file = Path(config.config_dir) / 'trash_locations.json'
+    
+    def _trash_root_for(self, path):
+        """Escolhe uma lixeira no mesmo sistema de arquivos do caminho"""
+        dev = os.lstat(path).st_dev
+        
+        self.home_trash.mkdir(exist_ok=True)
+        if os.stat(self.home_trash).st_dev == dev:
+            return self.home_trash
+        
+        root = _mount_point(path) / TRASH_DIR_NAME
+        try:
+            root.mkdir(mode=0o700, exist_ok=True)
+        except OSError:
+            return None
+        return root if os.stat(root).st_dev == dev else None
+    
+    def _locations(self):
+        """Lixeiras já utilizadas"""
+        locations = [str(self.home_trash)]
+        try:
+            with open(self.locations_file, 'r') as f:
+                locations += [loc for loc in json.load(f) if loc not in locations]
+        except (OSError, ValueError):
+            pass
+        return [Path(loc) for loc in locations if os.path.isdir(loc)]
+    
+    def _register_location(self, root):
+        """Registra uma nova lixeira para que purge/restore a encontrem"""
+        locations = [str(loc) for loc in self._locations()]
+        if str(root) not in locations:
+            locations.append(str(root))
+            with open(self.locations_file, 'w') as f:
+                json.dump(locations, f)
+    
+    def move_to_trash(self, path):
+        """Move o caminho para a lixeira, retornando o identificador da entrada"""
+        path = Path(path)
+        root = self._trash_root_for(path)
+        if root is None:
+            raise OSError(f"Nenhuma lixeira disponível no sistema de arquivos de {path}")
+        
+        (root / 'files').mkdir(exist_ok=True)
+        (root / 'info').mkdir(exist_ok=True)
+        if root != self.home_trash:
+            self._register_location(root)
+        
+        entry_id = f"{time.time_ns()}-{path.name}"[:200]
+        info_file = root / 'info' / f"{entry_id}.json"
+        with open(info_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                'original_path': str(path),
+                'deleted_at': time.time(),
+                'is_dir': path.is_dir() and not path.is_symlink(),
+            }, f)
+        
+        try:
+            os.rename(path, root / 'files' / entry_id)
+        except OSError:
+            info_file.unlink()
+            raise
+        
+        return entry_id
+    
+    def list_entries(self):
+        """Lista as entradas da lixeira, mais recentes primeiro"""
+        entries = []
+        for root in self._locations():
+            info_dir = root / 'info'
+            if not info_dir.is_dir():
+                continue
+            for info_file in info_dir.glob('*.json'):
+                try:
+                    with open(info_file, 'r', encoding='utf-8') as f:
+                        info = json.load(f)
+                except (OSError, ValueError):
+                    continue
+                info['id'] = info_file.stem
+                info['root'] = root
+                info['deleted'] = datetime.fromtimestamp(info['deleted_at'])
+                entries.append(info)
+        
+        entries.sort(key=lambda entry: entry['deleted_at'], reverse=True)
+        return entries
+    
+    def find_entry(self, selector):
+        """Localiza uma entrada por identificador ou caminho original (a mais recente)"""
+        original = str(Path(selector).resolve())
+        for entry in self.list_entries():
+            if entry['id'] == selector or entry['original_path'] == original:
+                return entry
+        return None
+    
+    def restore(self, entry, destination=None):
+        """Restaura uma entrada para o caminho original ou para o destino indicado"""
+        target = Path(destination or entry['original_path'])
+        if os.path.lexists(target):
+            raise FileExistsError(f"Destino já existe: {target}")
+        
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.rename(entry['root'] / 'files' / entry['id'], target)
+        (entry['root'] / 'info' / f"{entry['id']}.json").unlink()
+        return target
+    
+    def purge(self, older_than=None, workers=None, throttle=None):
+        """Apaga definitivamente entradas da lixeira, retornando (entradas, itens)"""
+        cutoff = time.time() - older_than if older_than is not None else None
+        selected = [entry for entry in self.list_entries()
+                    if cutoff is None or entry['deleted_at'] < cutoff]
+        
+        paths = [entry['root'] / 'files' / entry['id'] for entry in selected]
+        if cutoff is None:
+            # Inclui restos de purges interrompidos (arquivos sem info)
+            known = {entry['id'] for entry in selected}
+            for root in self._locations():
+                files_dir = root / 'files'
+                if files_dir.is_dir():
+                    paths += [p for p in files_dir.iterdir() if p.name not in known]
+        
+        plan = delete_engine.scan([str(path) for path in paths], workers)
+        removed, errors = delete_engine.execute(plan, workers, throttle)
+        if errors:
+            raise errors[0]
+        
+        for entry in selected:
+            try:
+                (entry['root'] / 'info' / f"{entry['id']}.json").unlink()
+            except FileNotFoundError:
+                pass
+        
+        return len(selected), removed
\ No newline at end of file
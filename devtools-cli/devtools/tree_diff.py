@@ -0,0 +1,228 @@
+"""
+Comparação de árvores de diretórios do DevTools CLI (file diff-dir)
+
+Cada árvore é percorrida em profundidade com os nomes ordenados, o que gera
+os caminhos relativos já em ordem; as duas varreduras rodam em threads
+próprias e são unidas como um merge-join, sem manter a listagem completa de
+nenhuma delas em memória.
+
+A igualdade de arquivos é verificada em camadas, da mais barata para a mais
+cara: tamanho, mtime, hash de amostras (início, meio e fim) e, se pedido,
+hash completo.
+"""
+import hashlib
+import os
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from . import checksum
+from .utils import default_workers
+
+SAMPLE_BLOCK_SIZE = 64 * 1024
+SAMPLE_BLOCKS = 3
+WALK_BATCH_SIZE = 512
+WALK_QUEUE_SIZE = 64
+HASH_WINDOW = 256
+
+class TreeEntry:
+    """Entrada de uma das árvores"""
+    
+    __slots__ = ('key', 'path', 'kind', 'size', 'mtime_ns')
+    
+    def __init__(self, key, path, kind, size=0, mtime_ns=0):
+        self.key = key
+        self.path = path
+        self.kind = kind
+        self.size = size
+        self.mtime_ns = mtime_ns
+    
+    @property
+    def relpath(self):
+        return '/'.join(self.key)
+
+def _entry_kind(entry):
+    if entry.is_symlink():
+        return 'link'
+    if entry.is_dir(follow_symlinks=False):
+        return 'dir'
+    if entry.is_file(follow_symlinks=False):
+        return 'file'
+    return 'other'
+
+def walk_sorted(root, errors, rules=None):
+    """Gera TreeEntry em ordem de caminho relativo (como tupla de componentes)
+    
+    Só a listagem ordenada dos diretórios do caminho atual fica em memória.
+    """
+    def listing(directory):
+        try:
+            with os.scandir(directory) as entries:
+                return iter(sorted(entries, key=lambda entry: entry.name))
+        except OSError as e:
+            errors.append(e)
+            return iter(())
+    
+    stack = [((), listing(root), rules.matcher(root) if rules else None)]
+    while stack:
+        prefix, entries, matcher = stack[-1]
+        entry = next(entries, None)
+        if entry is None:
+            stack.pop()
+            continue
+        
+        key = prefix + (entry.name,)
+        try:
+            kind = _entry_kind(entry)
+            if matcher and not matcher.accepts(entry.name, kind == 'dir'):
+                continue
+            st = entry.stat(follow_symlinks=False)
+        except OSError as e:
+            errors.append(e)
+            continue
+        
+        yield TreeEntry(key, entry.path, kind, st.st_size if kind == 'file' else 0, st.st_mtime_ns)
+        if kind == 'dir':
+            stack.append((key, listing(entry.path), matcher and matcher.child(entry.name)))
+
+def _threaded(generator):
+    """Consome um gerador em outra thread, entregando itens em lotes por uma fila limitada"""
+    channel = queue.Queue(maxsize=WALK_QUEUE_SIZE)
+    stop = threading.Event()
+    
+    def produce():
+        batch = []
+        try:
+            for item in generator:
+                batch.append(item)
+                if len(batch) >= WALK_BATCH_SIZE:
+                    channel.put(batch)
+                    batch = []
+                    if stop.is_set():
+                        return
+            channel.put(batch)
+        finally:
+            channel.put(None)
+    
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            batch = channel.get()
+            if batch is None:
+                break
+            yield from batch
+    finally:
+        stop.set()
+        # Libera o produtor caso esteja bloqueado na fila cheia
+        while thread.is_alive():
+            try:
+                channel.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        thread.join()
+
+def sample_digest(path, size):
+    """Hash de blocos amostrados no início, meio e fim do arquivo"""
+    hasher = hashlib.blake2b(digest_size=16)
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        if size <= SAMPLE_BLOCK_SIZE * SAMPLE_BLOCKS:
+            offsets = [0]
+            length = size
+        else:
+            step = (size - SAMPLE_BLOCK_SIZE) // (SAMPLE_BLOCKS - 1)
+            offsets = [i * step for i in range(SAMPLE_BLOCKS)]
+            length = SAMPLE_BLOCK_SIZE
+        for offset in offsets:
+            hasher.update(os.pread(fd, length, offset))
+    finally:
+        os.close(fd)
+    return hasher.digest()
+
+def _full_digest(path):
+    return checksum.hash_file(path, ('blake2b',))['blake2b']
+
+def _compare_content(left, right, full):
+    """Compara o conteúdo de dois arquivos de mesmo tamanho: (status, motivo)"""
+    try:
+        if sample_digest(left.path, left.size) != sample_digest(right.path, right.size):
+            return 'changed', 'sample'
+        if not full:
+            return 'same', 'sample'
+        if _full_digest(left.path) != _full_digest(right.path):
+            return 'changed', 'hash'
+        return 'same', 'hash'
+    except OSError as e:
+        return 'error', str(e)
+
+def _compare(left, right, full):
+    """Classificação barata; retorna (status, motivo) ou None se precisa ler o conteúdo"""
+    if left.kind != right.kind:
+        return 'changed', 'type'
+    if left.kind == 'dir':
+        return 'same', 'dir'
+    if left.kind == 'link':
+        try:
+            same = os.readlink(left.path) == os.readlink(right.path)
+        except OSError as e:
+            return 'error', str(e)
+        return ('same', 'target') if same else ('changed', 'target')
+    if left.kind != 'file':
+        return 'same', 'type'
+    if left.size != right.size:
+        return 'changed', 'size'
+    if left.mtime_ns == right.mtime_ns and not full:
+        return 'same', 'mtime'
+    return None
+
+def diff_trees(left_root, right_root, full=False, workers=None, rules=None):
+    """Compara duas árvores, gerando dicionários em ordem de caminho relativo
+    
+    status: added (só em right), removed (só em left), changed, same ou error.
+    """
+    errors = []
+    left_iter = _threaded(walk_sorted(left_root, errors, rules))
+    right_iter = _threaded(walk_sorted(right_root, errors, rules))
+    pending = deque()
+    
+    def record(entry, status, reason, kind=None):
+        return {'path': entry.relpath, 'status': status, 'reason': reason,
+                'type': kind or entry.kind}
+    
+    with ThreadPoolExecutor(max_workers=workers or default_workers()) as executor:
+        def drain(limit):
+            # Mantém a ordem de saída mesmo com hashes terminando fora de ordem
+            while len(pending) > limit:
+                item, future = pending.popleft()
+                if future is not None:
+                    item['status'], item['reason'] = future.result()
+                yield item
+        
+        left = next(left_iter, None)
+        right = next(right_iter, None)
+        while left is not None or right is not None:
+            if right is None or (left is not None and left.key < right.key):
+                pending.append((record(left, 'removed', None), None))
+                left = next(left_iter, None)
+            elif left is None or right.key < left.key:
+                pending.append((record(right, 'added', None), None))
+                right = next(right_iter, None)
+            else:
+                result = _compare(left, right, full)
+                item = record(right, None, None, right.kind if left.kind == right.kind else 'mixed')
+                if result is None:
+                    # hashlib libera o GIL: as leituras rodam em paralelo
+                    pending.append((item, executor.submit(_compare_content, left, right, full)))
+                else:
+                    item['status'], item['reason'] = result
+                    pending.append((item, None))
+                left = next(left_iter, None)
+                right = next(right_iter, None)
+            
+            yield from drain(HASH_WINDOW)
+        yield from drain(0)
+    
+    for error in errors:
+        yield {'path': getattr(error, 'filename', None), 'status': 'error', 'reason': error.strerror,
+               'type': None}
\ No newline at end of file
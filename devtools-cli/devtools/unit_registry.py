@@ -0,0 +1,242 @@
+"""
+Registro de unidades do DevTools CLI
+
+As unidades são definidas em tabelas (símbolos, nomes, dimensão, fator para a
+unidade base e deslocamento) e combinadas com os prefixos SI e IEC, resolvidos
+por uma trie de prefixos. Expressões compostas como MB/s, GiB/h ou req/min
+são analisadas como produto/quociente de unidades, somando os expoentes de
+cada dimensão. A conversão entre duas expressões compatíveis se reduz a
+(escala, deslocamento) e fica em cache.
+"""
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+BASE_DIMENSIONS = ('data', 'time', 'length', 'mass', 'temperature', 'count')
+
+def dim(**exponents):
+    """Dimensão como tupla de expoentes na ordem de BASE_DIMENSIONS"""
+    return tuple(exponents.get(name, 0) for name in BASE_DIMENSIONS)
+
+DIMENSIONLESS = dim()
+
+DIMENSION_NAMES = {
+    dim(data=1): 'size',
+    dim(time=1): 'time',
+    dim(temperature=1): 'temperature',
+    dim(length=1): 'length',
+    dim(mass=1): 'mass',
+    dim(length=1, time=-1): 'speed',
+    dim(data=1, time=-1): 'data_rate',
+    dim(time=-1): 'frequency',
+    dim(count=1): 'count',
+    dim(count=1, time=-1): 'rate',
+}
+
+DIMENSION_LABELS = {
+    'size': 'Tamanho', 'time': 'Tempo', 'temperature': 'Temperatura', 'length': 'Comprimento',
+    'mass': 'Massa', 'speed': 'Velocidade', 'data_rate': 'Taxa de dados', 'frequency': 'Frequência',
+    'count': 'Contagem', 'rate': 'Taxa de eventos',
+}
+
+# prefixo: (fator, família, tipo); símbolos aceitam prefixos de símbolo e nomes, de nome.
+# 'si' são os múltiplos a partir de k; 'si_small' (h, da, m, µ...) só vale para tempo, comprimento e massa
+PREFIXES = {
+    'Q': (1e30, 'si', 'symbol'), 'R': (1e27, 'si', 'symbol'), 'Y': (1e24, 'si', 'symbol'),
+    'Z': (1e21, 'si', 'symbol'), 'E': (1e18, 'si', 'symbol'), 'P': (1e15, 'si', 'symbol'),
+    'T': (1e12, 'si', 'symbol'), 'G': (1e9, 'si', 'symbol'), 'M': (1e6, 'si', 'symbol'),
+    'k': (1e3, 'si', 'symbol'), 'h': (1e2, 'si_small', 'symbol'), 'da': (1e1, 'si_small', 'symbol'),
+    'd': (1e-1, 'si_small', 'symbol'), 'c': (1e-2, 'si_small', 'symbol'), 'm': (1e-3, 'si_small', 'symbol'),
+    'u': (1e-6, 'si_small', 'symbol'), 'µ': (1e-6, 'si_small', 'symbol'), 'μ': (1e-6, 'si_small', 'symbol'),
+    'n': (1e-9, 'si_small', 'symbol'), 'p': (1e-12, 'si_small', 'symbol'), 'f': (1e-15, 'si_small', 'symbol'),
+    'a': (1e-18, 'si_small', 'symbol'),
+    'Ki': (2 ** 10, 'iec', 'symbol'), 'Mi': (2 ** 20, 'iec', 'symbol'), 'Gi': (2 ** 30, 'iec', 'symbol'),
+    'Ti': (2 ** 40, 'iec', 'symbol'), 'Pi': (2 ** 50, 'iec', 'symbol'), 'Ei': (2 ** 60, 'iec', 'symbol'),
+    'exa': (1e18, 'si', 'name'), 'peta': (1e15, 'si', 'name'), 'tera': (1e12, 'si', 'name'),
+    'giga': (1e9, 'si', 'name'), 'mega': (1e6, 'si', 'name'), 'kilo': (1e3, 'si', 'name'),
+    'hecto': (1e2, 'si_small', 'name'), 'deca': (1e1, 'si_small', 'name'), 'deci': (1e-1, 'si_small', 'name'),
+    'centi': (1e-2, 'si_small', 'name'), 'milli': (1e-3, 'si_small', 'name'), 'micro': (1e-6, 'si_small', 'name'),
+    'nano': (1e-9, 'si_small', 'name'), 'pico': (1e-12, 'si_small', 'name'),
+    'kibi': (2 ** 10, 'iec', 'name'), 'mebi': (2 ** 20, 'iec', 'name'), 'gibi': (2 ** 30, 'iec', 'name'),
+    'tebi': (2 ** 40, 'iec', 'name'), 'pebi': (2 ** 50, 'iec', 'name'), 'exbi': (2 ** 60, 'iec', 'name'),
+}
+
+# (símbolos, nomes, dimensão, fator para a base, deslocamento, famílias de prefixo aceitas)
+UNITS = (
+    (('B',), ('byte', 'bytes'), dim(data=1), 1, 0, ('si', 'iec')),
+    (('bit',), ('bit', 'bits'), dim(data=1), 1 / 8, 0, ('si', 'iec')),
+    (('bps',), (), dim(data=1, time=-1), 1 / 8, 0, ('si',)),
+    (('s', 'sec', 'secs'), ('second', 'seconds'), dim(time=1), 1, 0, ('si', 'si_small')),
+    (('min', 'mins'), ('minute', 'minutes'), dim(time=1), 60, 0, ()),
+    (('h', 'hr'), ('hour', 'hours'), dim(time=1), 3600, 0, ()),
+    (('d',), ('day', 'days'), dim(time=1), 86400, 0, ()),
+    (('w', 'wk'), ('week', 'weeks'), dim(time=1), 604800, 0, ()),
+    (('month',), ('months',), dim(time=1), 2592000, 0, ()),
+    (('y', 'yr'), ('year', 'years'), dim(time=1), 31536000, 0, ()),
+    (('m',), ('meter', 'meters', 'metre', 'metres'), dim(length=1), 1, 0, ('si', 'si_small')),
+    (('in',), ('inch', 'inches'), dim(length=1), 0.0254, 0, ()),
+    (('ft',), ('foot', 'feet'), dim(length=1), 0.3048, 0, ()),
+    (('yd',), ('yard', 'yards'), dim(length=1), 0.9144, 0, ()),
+    (('mi',), ('mile', 'miles'), dim(length=1), 1609.344, 0, ()),
+    (('nmi',), (), dim(length=1), 1852, 0, ()),
+    (('g',), ('gram', 'grams'), dim(mass=1), 1e-3, 0, ('si', 'si_small')),
+    (('t',), ('tonne', 'tonnes'), dim(mass=1), 1000, 0, ()),
+    (('lb', 'lbs'), ('pound', 'pounds'), dim(mass=1), 0.45359237, 0, ()),
+    (('oz',), ('ounce', 'ounces'), dim(mass=1), 0.028349523125, 0, ()),
+    (('mph',), (), dim(length=1, time=-1), 0.44704, 0, ()),
+    (('kph', 'kmh'), (), dim(length=1, time=-1), 1 / 3.6, 0, ()),
+    (('kn', 'kt'), ('knot', 'knots'), dim(length=1, time=-1), 1852 / 3600, 0, ()),
+    (('K',), ('kelvin',), dim(temperature=1), 1, 0, ()),
+    (('°C', 'degC'), ('celsius',), dim(temperature=1), 1, 273.15, ()),
+    (('°F', 'degF'), ('fahrenheit',), dim(temperature=1), 5 / 9, 459.67 * 5 / 9, ()),
+    (('Hz',), ('hertz',), dim(time=-1), 1, 0, ('si',)),
+    (('rpm',), (), dim(time=-1), 1 / 60, 0, ()),
+    (('req',), ('request', 'requests', 'reqs'), dim(count=1), 1, 0, ()),
+    (('op', 'ops'), ('operation', 'operations'), dim(count=1), 1, 0, ()),
+    (('event',), ('events',), dim(count=1), 1, 0, ()),
+    (('1',), (), DIMENSIONLESS, 1, 0, ()),
+)
+
+# Tamanhos aceitos antes do registro (KB, MB, kb, megabyte...): base 1024, ou SI com --si.
+# kB, MiB, GiB... são sempre SI ou IEC.
+SIZE_ALIASES = {
+    alias: prefix
+    for prefix, name in (('k', 'kilo'), ('M', 'mega'), ('G', 'giga'), ('T', 'tera'), ('P', 'peta'))
+    for alias in (prefix.lower() + 'b', prefix.upper() + 'B', name + 'byte', name + 'bytes')
+}
+
+# Demais nomes do conversor anterior (byte, milissegundos, temperaturas por letra) e taxas de rede
+# em minúsculas; também são os únicos aceitos sem diferenciar maiúsculas (MS, Min, HOURS...)
+LEGACY_ALIASES = {
+    'b': 'B', 'c': '°C', 'f': '°F', 'k': 'K', 'ms': 'ms', 'millisecond': 'ms', 'milliseconds': 'ms',
+    'kbps': 'kbps', 'mbps': 'Mbps', 'gbps': 'Gbps', 'tbps': 'Tbps',
+}
+
+Unit = namedtuple('Unit', 'factor offset dimension')
+
+class UnitError(Exception):
+    """Unidade desconhecida ou conversão entre dimensões incompatíveis"""
+
+class PrefixTrie:
+    """Trie de prefixos: encontra todos os prefixos no início de um texto"""
+    
+    def __init__(self, prefixes):
+        self.root = {}
+        for prefix, value in prefixes.items():
+            node = self.root
+            for char in prefix:
+                node = node.setdefault(char, {})
+            node[None] = value
+    
+    def matches(self, text):
+        """(comprimento, valor) de cada prefixo de text, do mais longo ao mais curto"""
+        found = []
+        node = self.root
+        for length, char in enumerate(text, 1):
+            node = node.get(char)
+            if node is None:
+                break
+            if None in node:
+                found.append((length, node[None]))
+        return reversed(found)
+
+def _scale(dimension, power):
+    return tuple(exponent * power for exponent in dimension)
+
+def _combine(first, second):
+    return tuple(a + b for a, b in zip(first, second))
+
+class UnitRegistry:
+    """Unidades definidas em UNITS, com prefixos, aliases e expressões compostas"""
+    
+    TERM = re.compile(r'^(?P<name>[^\^]+?)(?:\^(?P<power>-?\d+))?$')
+    
+    def __init__(self, units=UNITS, prefixes=PREFIXES, aliases=LEGACY_ALIASES, binary_sizes=True):
+        self.exact = {}
+        self.prefixable = {}
+        for symbols, names, dimension, factor, offset, families in units:
+            unit = Unit(factor, offset, dimension)
+            for kind, labels in (('symbol', symbols), ('name', names)):
+                for label in labels:
+                    self.exact[label] = unit
+                    if families:
+                        kinds = self.prefixable.get(label, (None, set()))[1]
+                        self.prefixable[label] = (unit, kinds | {kind}, families)
+        self.trie = PrefixTrie(prefixes)
+        for alias, target in aliases.items():
+            self.exact[alias] = self._lookup(target)
+        for alias, prefix in SIZE_ALIASES.items():
+            self.exact[alias] = self._lookup(prefix.upper() + 'iB' if binary_sizes else prefix + 'B')
+        self.parse = lru_cache(maxsize=1024)(self._parse)
+        self.conversion = lru_cache(maxsize=4096)(self._conversion)
+    
+    def _lookup(self, text):
+        """Unidade simples: nome exato, prefixo + unidade, ou nome exato em minúsculas"""
+        unit = self.exact.get(text)
+        if unit is not None:
+            return unit
+        for length, (factor, family, kind) in self.trie.matches(text):
+            entry = self.prefixable.get(text[length:])
+            if entry and kind in entry[1] and family in entry[2]:
+                base = entry[0]
+                return Unit(base.factor * factor, base.offset, base.dimension)
+        # Como no conversor anterior, MS, Min ou HOURS também são aceitos; só nomes exatos, nunca
+        # prefixo + unidade (COP ou MOP não podem virar centi/mili-alguma coisa)
+        return self.exact.get(text.lower())
+    
+    def knows(self, expression):
+        try:
+            self.parse(expression)
+            return True
+        except UnitError:
+            return False
+    
+    def _parse(self, expression):
+        """Analisa uma expressão como 'GiB/h', 'm/s^2' ou 'req/min'"""
+        numerator, *denominators = expression.strip().split('/')
+        terms = []
+        for sign, group in [(1, numerator)] + [(-1, group) for group in denominators]:
+            for term in re.split(r'[*·]', group):
+                match = self.TERM.match(term.strip())
+                unit = self._lookup(match.group('name')) if match else None
+                if unit is None:
+                    raise UnitError(f"Unidade não reconhecida: {term.strip() or expression}")
+                terms.append((unit, sign * int(match.group('power') or 1)))
+        
+        if len(terms) == 1 and terms[0][1] == 1:
+            return terms[0][0]
+        factor = 1.0
+        dimension = DIMENSIONLESS
+        for unit, power in terms:
+            if unit.offset:
+                raise UnitError(f"Unidades com deslocamento (°C, °F) não podem ser compostas: {expression}")
+            factor *= unit.factor ** power
+            dimension = _combine(dimension, _scale(unit.dimension, power))
+        return Unit(factor, 0, dimension)
+    
+    def _conversion(self, source, target):
+        """(escala, deslocamento, dimensão): resultado = valor * escala + deslocamento"""
+        source_unit = self.parse(source)
+        target_unit = self.parse(target)
+        if source_unit.dimension != target_unit.dimension:
+            raise UnitError(f"Unidades incompatíveis: {source} ({describe(source_unit.dimension)}) → "
+                            f"{target} ({describe(target_unit.dimension)})")
+        scale = source_unit.factor / target_unit.factor
+        offset = (source_unit.offset - target_unit.offset) / target_unit.factor
+        return scale, offset, source_unit.dimension
+
+def dimension_name(dimension):
+    """Nome da dimensão (ex: 'data_rate'), ou None se não tiver nome"""
+    return DIMENSION_NAMES.get(dimension)
+
+def describe(dimension):
+    """Descrição legível de uma dimensão (nome conhecido ou fórmula)"""
+    name = dimension_name(dimension)
+    if name:
+        return DIMENSION_LABELS[name].lower()
+    terms = [f"{base}^{exponent}" if exponent != 1 else base
+             for base, exponent in zip(BASE_DIMENSIONS, dimension) if exponent]
+    return '·'.join(terms) or 'adimensional'
+
+REGISTRY = UnitRegistry()
+SI_REGISTRY = UnitRegistry(binary_sizes=False)
\ No newline at end of file
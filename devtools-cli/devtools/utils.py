@@ -49,6 +49,18 @@ def format_bytes(bytes_value):
         bytes_value /= 1024.0
     return f"{bytes_value:.2f} PB"
 
+def parse_size(value):
+    """Converte tamanhos como '512K', '100M' ou '2GiB' em bytes (múltiplos de 1024)"""
+    text = str(value).strip().upper().replace('IB', '').rstrip('B')
+    multipliers = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3, 'T': 1024 ** 4}
+    if text and text[-1] in multipliers:
+        return int(float(text[:-1]) * multipliers[text[-1]])
+    return int(float(text))
+
+def default_workers():
+    """Número padrão de workers para operações paralelas"""
+    return os.cpu_count() or 4
+
 def validate_file_path(file_path):
     """Valida se um caminho de arquivo existe"""
     return os.path.exists(file_path)
@@ -42,6 +42,10 @@ setup(
     ],
     python_requires='>=3.7',
     install_requires=read_requirements(),
+    extras_require={
+        # Contagens vetorizadas em `file stats`
+        'fast': ['numpy>=1.21'],
+    },
     entry_points={
         'console_scripts': [
             'devtools=devtools.main:main',